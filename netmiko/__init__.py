@@ -45,7 +45,7 @@ from netmiko.ssh_dispatcher import ssh_dispatcher  # noqa
 from netmiko.ssh_dispatcher import redispatch  # noqa
 from netmiko.ssh_dispatcher import platforms  # noqa
 from netmiko.ssh_dispatcher import FileTransfer  # noqa
-from netmiko.scp_handler import SCPConn  # noqa
+from netmiko.scp_handler import SCPConn, transfer_session  # noqa
 from netmiko.cisco.cisco_ios import InLineTransfer  # noqa
 from netmiko.exceptions import (  # noqa
     NetmikoTimeoutException,
@@ -59,8 +59,17 @@ from netmiko.exceptions import ConfigInvalidException  # noqa
 from netmiko.exceptions import ReadException, ReadTimeout  # noqa
 from netmiko.exceptions import NetmikoBaseException, ConnectionException  # noqa
 from netmiko.ssh_autodetect import SSHDetect  # noqa
+from netmiko.autodetect_cache import AutodetectCache  # noqa
+from netmiko.file_digest import DigestCache  # noqa
+from netmiko.scp_handler import ResumeJournal  # noqa
 from netmiko.base_connection import BaseConnection  # noqa
-from netmiko.scp_functions import file_transfer, progress_bar  # noqa
+from netmiko.scp_functions import (
+    file_transfer,
+    file_transfer_many,
+    progress_bar,
+)  # noqa
+from netmiko.async_connection import AsyncConnectHandler, AsyncBaseConnection  # noqa
+from netmiko.connection_pool import ConnectionPool  # noqa
 
 # Alternate naming
 Netmiko = ConnectHandler
@@ -74,6 +83,7 @@ __all__ = (
     "platforms",
     "SCPConn",
     "FileTransfer",
+    "transfer_session",
     "NetmikoBaseException",
     "ConnectionException",
     "NetmikoTimeoutException",
@@ -86,10 +96,17 @@ __all__ = (
     "InLineTransfer",
     "redispatch",
     "SSHDetect",
+    "AutodetectCache",
+    "DigestCache",
+    "ResumeJournal",
     "BaseConnection",
     "Netmiko",
     "file_transfer",
+    "file_transfer_many",
     "progress_bar",
+    "AsyncConnectHandler",
+    "AsyncBaseConnection",
+    "ConnectionPool",
 )
 
 # Cisco cntl-shift-six sequence
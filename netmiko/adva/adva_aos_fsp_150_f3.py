@@ -121,6 +121,7 @@ class AdvaAosFsp150F3SSH(NoEnable, NoConfig, CiscoSSHConnection):
         error_pattern: str = "",
         terminator: str = r"#",
         bypass_commands: Optional[str] = None,
+        window: int = 1,
     ) -> str:
 
         if bypass_commands is None:
@@ -143,4 +144,5 @@ class AdvaAosFsp150F3SSH(NoEnable, NoConfig, CiscoSSHConnection):
             error_pattern=error_pattern,
             terminator=terminator,
             bypass_commands=bypass_commands,
+            window=window,
         )
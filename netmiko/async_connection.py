@@ -0,0 +1,174 @@
+"""
+asyncio convenience wrapper around Netmiko connections.
+
+The vendor drivers (prompt handling, paging, config mode, etc.) are reused unchanged from
+CLASS_MAPPER. Each blocking driver operation runs in a thread pool and is awaited, so Netmiko
+can be called from asyncio applications without blocking the event loop.
+
+This is not non-blocking channel I/O: an operation in progress occupies a worker thread for
+its whole duration (Paramiko is a blocking library and each session also has its Paramiko
+transport thread). It doesn't scale beyond threads: every operation is also handed back and
+forth through the event loop thread, so with hundreds of sessions at once it is slower than
+running each whole session in a thread (ConnectHandler in a ThreadPoolExecutor). Use it to
+call Netmiko from asyncio code, not to scale out. The number of operations in progress at
+once is the size of the pool: the shared default pool has NETMIKO_ASYNC_MAX_WORKERS (default
+256) workers, or pass your own executor (of any size) to AsyncConnectHandler(). To bound the
+number of open sessions, limit them in the caller (e.g. with an asyncio.Semaphore).
+
+    import asyncio
+    from netmiko import AsyncConnectHandler
+
+    async def show_version(device):
+        async with await AsyncConnectHandler(**device) as conn:
+            return await conn.send_command("show version")
+
+    async def main(devices):
+        return await asyncio.gather(*(show_version(device) for device in devices))
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from types import TracebackType
+from concurrent.futures import Executor, ThreadPoolExecutor
+import asyncio
+import functools
+import os
+import threading
+
+from netmiko.base_connection import BaseConnection
+from netmiko.ssh_dispatcher import ConnectHandler
+
+T = TypeVar("T")
+
+# Maximum number of driver operations (connects, commands) in progress at once (default)
+ASYNC_MAX_WORKERS = 256
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _max_workers() -> int:
+    """Return the size of the shared executor (NETMIKO_ASYNC_MAX_WORKERS env variable)."""
+    try:
+        max_workers = int(
+            os.environ.get("NETMIKO_ASYNC_MAX_WORKERS", ASYNC_MAX_WORKERS)
+        )
+    except ValueError:
+        return ASYNC_MAX_WORKERS
+    return max_workers if max_workers > 0 else ASYNC_MAX_WORKERS
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    """Return the (lazily created) executor that is shared by all async connections."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=_max_workers(), thread_name_prefix="netmiko_async"
+            )
+        return _default_executor
+
+
+async def _run(
+    executor: Optional[Executor], func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    if executor is None:
+        executor = _get_default_executor()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+class AsyncBaseConnection:
+    """Async wrapper around a Netmiko connection object (i.e. created by ConnectHandler)."""
+
+    def __init__(
+        self, connection: BaseConnection, executor: Optional[Executor] = None
+    ) -> None:
+        self.connection = connection
+        self.executor = executor
+        # Operations on a single session must not be interleaved (created on first use so
+        # it is bound to the running event loop).
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.connection.__class__.__name__} {self.host}>"
+
+    @property
+    def host(self) -> str:
+        return self.connection.host
+
+    @property
+    def device_type(self) -> str:
+        return self.connection.device_type
+
+    @property
+    def base_prompt(self) -> str:
+        return self.connection.base_prompt
+
+    async def __aenter__(self) -> "AsyncBaseConnection":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.disconnect()
+
+    async def run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Execute any method of the underlying connection object i.e.
+
+        await conn.run("send_command_timing", "show run", read_timeout=60)
+        """
+        func = getattr(self.connection, method)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await _run(self.executor, func, *args, **kwargs)
+
+    async def send_command(
+        self, command_string: str, **kwargs: Any
+    ) -> Union[str, List[Any], Dict[str, Any]]:
+        """See BaseConnection.send_command()."""
+        return await self.run("send_command", command_string, **kwargs)  # type: ignore
+
+    async def send_command_timing(
+        self, command_string: str, **kwargs: Any
+    ) -> Union[str, List[Any], Dict[str, Any]]:
+        """See BaseConnection.send_command_timing()."""
+        return await self.run(  # type: ignore
+            "send_command_timing", command_string, **kwargs
+        )
+
+    async def send_config_set(self, config_commands: Any = None, **kwargs: Any) -> str:
+        """See BaseConnection.send_config_set()."""
+        return await self.run("send_config_set", config_commands, **kwargs)  # type: ignore
+
+    async def find_prompt(self, **kwargs: Any) -> str:
+        """See BaseConnection.find_prompt()."""
+        return await self.run("find_prompt", **kwargs)  # type: ignore
+
+    async def is_alive(self) -> bool:
+        """See BaseConnection.is_alive()."""
+        return await self.run("is_alive")  # type: ignore
+
+    async def disconnect(self) -> None:
+        """See BaseConnection.disconnect()."""
+        await self.run("disconnect")
+
+
+async def AsyncConnectHandler(
+    *args: Any, executor: Optional[Executor] = None, **kwargs: Any
+) -> AsyncBaseConnection:
+    """
+    Create a Netmiko connection (class selected based on device_type like ConnectHandler)
+    without blocking the event loop.
+
+    :param executor: Executor that runs the blocking driver operations of this connection,
+        i.e. ThreadPoolExecutor(max_workers=1000) to run 1000 sessions at once (default: a
+        shared ThreadPoolExecutor with NETMIKO_ASYNC_MAX_WORKERS workers).
+    """
+    connection = await _run(executor, ConnectHandler, *args, **kwargs)
+    return AsyncBaseConnection(connection, executor=executor)
@@ -160,6 +160,7 @@ class AudiocodeBase(BaseConnection):
         error_pattern: str = "",
         terminator: str = r"\*?#",
         bypass_commands: Optional[str] = None,
+        window: int = 1,
     ) -> str:
         if enter_config_mode and config_mode_command is None:
             msg = """
@@ -182,6 +183,7 @@ config_mode_command. For example, config_mode_command="configure system"
             error_pattern=error_pattern,
             terminator=terminator,
             bypass_commands=bypass_commands,
+            window=window,
         )
 
     def save_config(
@@ -400,6 +402,7 @@ class AudiocodeShellBase(NoEnable, AudiocodeBase):
         error_pattern: str = "",
         terminator: str = r"/.*>",
         bypass_commands: Optional[str] = None,
+        window: int = 1,
     ) -> str:
 
         return super().send_config_set(
@@ -416,6 +419,7 @@ class AudiocodeShellBase(NoEnable, AudiocodeBase):
             error_pattern=error_pattern,
             terminator=terminator,
             bypass_commands=bypass_commands,
+            window=window,
         )
 
     def config_mode(
@@ -0,0 +1,124 @@
+"""
+On-disk cache of autodetect results (SSHDetect and SNMPDetect).
+
+Results are stored in a sqlite database (default: autodetect_cache.db in the Netmiko directory,
+see find_netmiko_dir()) keyed by host, port, and detection method. SSH entries also record the
+SSH host key fingerprint and the remote SSH version string; the entry is discarded if either
+of them changes (i.e. the device was replaced or its software was upgraded); SSHDetect doesn't
+use the cache for a host whose host key can't be read. All entries expire after ttl seconds.
+
+    from netmiko import SSHDetect, AutodetectCache
+
+    cache = AutodetectCache()
+    device_type = SSHDetect(cache=cache, **device).autodetect()
+"""
+
+from typing import Optional
+import time
+
+from netmiko.sqlite_cache import SQLiteCache
+
+# Default time-to-live of an entry (7 days)
+AUTODETECT_CACHE_TTL = 7 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS autodetect (
+    host TEXT NOT NULL,
+    port INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    device_type TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    remote_version TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (host, port, method)
+)
+"""
+
+
+class AutodetectCache(SQLiteCache):
+    """Persistent mapping of (host, port, method) to the detected device_type.
+
+    :param file_name: sqlite database file (default: autodetect_cache.db in the Netmiko
+        directory).
+
+    :param ttl: Entries older than this (in seconds) are ignored and replaced.
+    """
+
+    table = "autodetect"
+    schema = _SCHEMA
+    default_file_name = "autodetect_cache.db"
+
+    def __init__(
+        self, file_name: Optional[str] = None, ttl: float = AUTODETECT_CACHE_TTL
+    ) -> None:
+        super().__init__(file_name)
+        self.ttl = ttl
+
+    def get(
+        self,
+        host: str,
+        port: int,
+        method: str = "ssh",
+        fingerprint: str = "",
+        remote_version: str = "",
+    ) -> Optional[str]:
+        """Return the cached device_type (or None).
+
+        An entry whose fingerprint or remote_version doesn't match (or that has expired) is
+        removed.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT device_type, fingerprint, remote_version, updated "
+                "FROM autodetect WHERE host = ? AND port = ? AND method = ?",
+                (host, port, method),
+            ).fetchone()
+            if row is None:
+                return None
+            device_type, cached_fingerprint, cached_version, updated = row
+            if (
+                cached_fingerprint == fingerprint
+                and cached_version == remote_version
+                and time.time() - updated < self.ttl
+            ):
+                return str(device_type)
+            conn.execute(
+                "DELETE FROM autodetect WHERE host = ? AND port = ? AND method = ?",
+                (host, port, method),
+            )
+            return None
+
+    def set(
+        self,
+        host: str,
+        port: int,
+        device_type: str,
+        method: str = "ssh",
+        fingerprint: str = "",
+        remote_version: str = "",
+    ) -> None:
+        """Store the device_type detected for host/port."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO autodetect VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    host,
+                    port,
+                    method,
+                    device_type,
+                    fingerprint,
+                    remote_version,
+                    time.time(),
+                ),
+            )
+
+    def invalidate(self, host: str, port: Optional[int] = None) -> None:
+        """Remove the entries of host (all ports unless port is specified)."""
+        with self._transaction() as conn:
+            if port is None:
+                conn.execute("DELETE FROM autodetect WHERE host = ?", (host,))
+            else:
+                conn.execute(
+                    "DELETE FROM autodetect WHERE host = ? AND port = ?",
+                    (host, port),
+                )
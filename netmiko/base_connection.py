@@ -21,7 +21,10 @@ from typing import (
     TextIO,
     Union,
     Tuple,
+    Pattern,
+    Match,
     Deque,
+    Iterable,
 )
 from typing import TYPE_CHECKING
 from types import TracebackType
@@ -29,10 +32,12 @@ import io
 import re
 import socket
 import time
+import copy
 from collections import deque
 from os import path
 from pathlib import Path
 from threading import Lock
+from concurrent.futures import Executor, Future
 import functools
 import logging
 import itertools
@@ -47,12 +52,14 @@ from netmiko.exceptions import (
     NetmikoTimeoutException,
     NetmikoAuthenticationException,
     ConfigInvalidException,
+    ConnectionException,
     ReadException,
     ReadTimeout,
 )
 from netmiko._telnetlib import telnetlib
 from netmiko.channel import Channel, SSHChannel, TelnetChannel, SerialChannel
-from netmiko.session_log import SessionLog
+from netmiko.session_log import SessionLog, SessionLogWriter
+from netmiko.pattern_search import PatternSearch, max_match_width
 from netmiko.utilities import (
     write_bytes,
     check_serial_port,
@@ -77,16 +84,87 @@ max_loops in this context. You should remove any use of delay_factor=x
 from this method call.\n"""
 
 
+# ANSI (VT100) escape codes that are removed by strip_ansi_escape_codes() (the leading
+# 'ESC[' is shared by all of these codes and is not included).
+ANSI_ESCAPE_CODES = (
+    r"\d+;\d+H",  # code_position_cursor
+    r"\?25h",  # code_show_cursor
+    r"2K",  # code_erase_line
+    r"\d+;\d+r",  # code_enable_scroll
+    r"K",  # code_erase_start_line / code_erase_line_end
+    r"1M",  # code_carriage_return
+    r"\?7l",  # code_disable_line_wrapping
+    r"\?\d+l",  # code_reset_mode_screen_options
+    r"00m",  # code_reset_graphics_mode
+    r"2J",  # code_erase_display
+    r"\dm",  # code_graphics_mode
+    r"\d\d;\d\dm",  # code_graphics_mode1
+    r"\d\d;\d\d;\d\dm",  # code_graphics_mode2
+    r"(?:3|4)\dm",  # code_graphics_mode3
+    r"(?:9|10)[0-7]m",  # code_graphics_mode4
+    r"\d;\d\dm",  # code_graphics_mode5
+    r"6n",  # code_get_cursor_position
+    r"m",  # code_cursor_position
+    r"J",  # code_erase_display_0
+    r"0m",  # code_attrs_off
+    r"7m",  # code_reverse
+    r"\d+D",  # code_cursor_left
+    r"\d*A",  # code_cursor_up
+    r"\d*B",  # code_cursor_down
+    r"\d*C",  # code_cursor_forward
+    r"\?7h",  # code_wrap_around
+    r"\?2004h",  # code_enable_bracketed_paste_mode
+    r"\?2004l",  # code_disable_bracketed_paste_mode
+    r"4m",  # code_underline
+    r"c",  # code_query_device
+)
+# ANSI escape codes that are substituted with <enter>
+CODE_NEXT_LINE = re.compile(chr(27) + r"E")
+CODE_INSERT_LINE = re.compile(chr(27) + r"\[(\d+)L")
+
+
+@functools.lru_cache(maxsize=None)
+def _ansi_escape_regex(extra_codes: Tuple[str, ...] = ()) -> Pattern[str]:
+    """
+    Compile all of the ANSI escape codes that are removed into a single regex (so the
+    output only needs to be processed once). Driver specific codes (extra_codes) take
+    precedence over the standard codes.
+    """
+    codes = "|".join(ANSI_ESCAPE_CODES)
+    pattern = chr(27) + rf"\[(?:{codes})"
+    if extra_codes:
+        extra = "|".join(f"(?:{code})" for code in extra_codes)
+        pattern = f"{extra}|{pattern}"
+    return re.compile(pattern)
+
+
 # Logging filter for #2597
 class SecretsFilter(logging.Filter):
     def __init__(self, no_log: Optional[Dict[Any, str]] = None) -> None:
         self.no_log = no_log
 
+    def redact(self, message: str) -> str:
+        """Replace the no_log values in message (longest first, so a value that is a prefix
+        of another value doesn't leave the rest of the longer one visible)."""
+        if self.no_log:
+            values = [str(value) for value in self.no_log.values() if value]
+            for hidden_data in sorted(values, key=len, reverse=True):
+                message = message.replace(hidden_data, "********")
+        return message
+
     def filter(self, record: logging.LogRecord) -> bool:
-        """Removes secrets (no_log) from messages"""
+        """Removes secrets (no_log) from messages
+
+        The message is formatted (including any %-style args) to find the secrets; records
+        without any secret are left unchanged. The filter only runs for records the logger
+        is enabled for, so disabled debug logging doesn't format anything.
+        """
         if self.no_log:
-            for hidden_data in self.no_log.values():
-                record.msg = record.msg.replace(hidden_data, "********")
+            message = record.getMessage()
+            redacted = self.redact(message)
+            if redacted != message:
+                record.msg = redacted
+                record.args = ()
         return True
 
 
@@ -125,11 +203,10 @@ def log_writes(func: F) -> F:
     def wrapper_decorator(self: "BaseConnection", out_data: str) -> None:
         func(self, out_data)
         try:
-            log.debug(
-                "write_channel: {}".format(
-                    str(write_bytes(out_data, encoding=self.encoding))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "write_channel: %s", write_bytes(out_data, encoding=self.encoding)
                 )
-            )
             if self.session_log:
                 if self.session_log.fin or self.session_log.record_writes:
                     self.session_log.write(out_data)
@@ -148,6 +225,16 @@ class BaseConnection:
     Otherwise method left as a stub method.
     """
 
+    # Driver specific ANSI escape code patterns that strip_ansi_escape_codes() also removes
+    extra_ansi_escape_codes: Tuple[str, ...] = ()
+    # Maximum number of interactive shells (including the original session) that
+    # open_shell() will run over a single SSH transport
+    max_shell_channels = 5
+    # Drivers whose CLI drops or echoes out of order input that arrives before the prompt
+    # (or whose prompt changes from command to command) set this to False;
+    # send_command_batch() then sends one command at a time.
+    typeahead_safe = True
+
     def __init__(
         self,
         ip: str = "",
@@ -196,6 +283,7 @@ class BaseConnection:
         session_log: Optional[SessionLog] = None,
         session_log_record_writes: bool = False,
         session_log_file_mode: str = "write",
+        session_log_writer: Optional[SessionLogWriter] = None,
         allow_auto_change: bool = False,
         encoding: str = "utf-8",
         sock: Optional[socket.socket] = None,
@@ -287,7 +375,8 @@ class BaseConnection:
                 (default: True)
 
         :param session_log: File path, SessionLog object, or BufferedIOBase subclass object
-                to write the session log to.
+                to write the session log to. File paths ending in ".gz" or ".zst" are written
+                compressed (use a SessionLog object for size/time based rotation).
 
         :param session_log_record_writes: The session log generally only records channel reads due
                 to eliminate command duplication due to command echo. You can enable this if you
@@ -296,6 +385,10 @@ class BaseConnection:
         :param session_log_file_mode: "write" or "append" for session_log file mode
                 (default: "write")
 
+        :param session_log_writer: SessionLogWriter (background thread shared by many
+                connections) used to write the session_log instead of writing (and flushing)
+                it in this thread (default: None).
+
         :param allow_auto_change: Allow automatic configuration changes for terminal settings.
                 (default: False)
 
@@ -403,6 +496,7 @@ class BaseConnection:
                     file_mode=session_log_file_mode,
                     no_log=no_log,
                     record_writes=session_log_record_writes,
+                    writer=session_log_writer,
                 )
                 self.session_log.open()
             elif isinstance(session_log, io.BufferedIOBase):
@@ -411,6 +505,7 @@ class BaseConnection:
                     buffered_io=session_log,
                     no_log=no_log,
                     record_writes=session_log_record_writes,
+                    writer=session_log_writer,
                 )
             elif isinstance(session_log, SessionLog):
                 # SessionLog object
@@ -445,6 +540,14 @@ class BaseConnection:
         self.base_prompt = ""
         self._session_locker = Lock()
 
+        # set in establish_connection method (SSH only)
+        self.ssh_connect_time: Optional[float] = None
+
+        # Additional shells running over this connection's SSH transport (open_shell())
+        self._shell_parent: Optional["BaseConnection"] = None
+        self._shells: List["BaseConnection"] = []
+        self._shells_lock = Lock()
+
         # determine if telnet or SSH
         if "_telnet" in device_type:
             self.protocol = "telnet"
@@ -629,6 +732,29 @@ key_file: {self.key_file}
                 return False
         return False
 
+    def wait_for_data(self, timeout: float) -> bool:
+        """Block until there is data to be read or until timeout expires (avoids fixed
+        sleeps in the read loops).
+
+        :param timeout: Maximum amount of time (in seconds) to wait for new data.
+        """
+        if self._read_buffer:
+            return True
+        return self.channel.wait_for_data(timeout=timeout)
+
+    def _wait_for_data_until(self, start_time: float, read_timeout: float) -> bool:
+        """Wait up to one second for new data without running past read_timeout.
+
+        :param start_time: time.time() value at which the read loop started.
+
+        :param read_timeout: Overall read timeout of the loop (0 means no timeout).
+        """
+        max_wait = 1.0
+        if read_timeout:
+            remaining = read_timeout - (time.time() - start_time)
+            max_wait = max(min(remaining, max_wait), 0)
+        return self.wait_for_data(timeout=max_wait)
+
     @lock_channel
     def read_channel(self) -> str:
         """Generic handler that will read all the data from given channel."""
@@ -649,7 +775,7 @@ key_file: {self.key_file}
 
         if self.ansi_escape_codes:
             new_data = self.strip_ansi_escape_codes(new_data)
-        log.debug(f"read_channel: {new_data}")
+        log.debug("read_channel: %s", new_data)
         if self.session_log:
             self.session_log.write(new_data)
 
@@ -696,14 +822,18 @@ where x is the total number of seconds to wait before timing out.\n"""
             read_timeout = self.read_timeout_override
 
         output = ""
-        loop_delay = 0.01
+        pattern_search = PatternSearch(pattern, re_flags=re_flags)
         start_time = time.time()
         # if read_timeout == 0 or 0.0 keep reading indefinitely
         while (time.time() - start_time < read_timeout) or (not read_timeout):
             output += self.read_channel()
 
-            if re.search(pattern, output, flags=re_flags):
-                if "(" in pattern and "(?:" not in pattern:
+            if pattern_search.search(output):
+                if (
+                    "(" in pattern
+                    and "(?:" not in pattern
+                    and log.isEnabledFor(logging.DEBUG)
+                ):
                     msg = f"""
 Parenthesis found in pattern.
 
@@ -740,9 +870,9 @@ results={results}
                 output = output + match_str
                 if buffer:
                     self._read_buffer += buffer
-                log.debug(f"Pattern found: {pattern} {output}")
+                log.debug("Pattern found: %s %s", pattern, output)
                 return output
-            time.sleep(loop_delay)
+            self._wait_for_data_until(start_time, read_timeout)
 
         msg = f"""\n\nPattern not detected: {repr(pattern)} in output.
 
@@ -800,13 +930,14 @@ You can also look at the Netmiko session_log or debug log for more information.\
 
         # Set read_timeout to 0 to never timeout
         while (time.time() - start_time < read_timeout) or (not read_timeout):
-            time.sleep(loop_delay)
+            # Wakes up early if data arrives (otherwise waits loop_delay)
+            self.wait_for_data(timeout=loop_delay)
             new_data = self.read_channel()
             # gather new output
             if new_data:
                 channel_data += new_data
             # if we have some output, but nothing new, then do the last read
-            elif channel_data != "":
+            elif channel_data:
                 # Make sure really done (i.e. no new data)
                 time.sleep(last_read)
                 new_data = self.read_channel()
@@ -1143,7 +1274,11 @@ You can look at the Netmiko session_log or debug log for more information.
 
             # initiate SSH connection
             try:
+                start = time.monotonic()
                 self.remote_conn_pre.connect(**ssh_connect_params)
+                # TCP connection, key exchange, and authentication time (i.e. the cost of
+                # another SSH connection to the device, see SCPConn)
+                self.ssh_connect_time = time.monotonic() - start
             except socket.error as conn_error:
                 self.paramiko_cleanup()
                 msg = f"""TCP connection to device failed.
@@ -1220,6 +1355,67 @@ A paramiko SSHException occurred during connection creation:
 
         return None
 
+    def open_shell(self, width: int = 511, height: int = 1000) -> "BaseConnection":
+        """Open an additional interactive session over this connection's SSH transport.
+
+        The returned connection object uses a new channel on the already authenticated
+        Paramiko transport (no new TCP connection, key exchange, or authentication) and
+        then goes through the normal session_preparation(). Disconnecting it only closes
+        its own channel; disconnecting the original connection closes the transport and
+        with it all of the shells.
+
+        Session logging is not shared with the new shell.
+
+        :param width: Specified width of the VT100 terminal window (default: 511)
+        :type width: int
+
+        :param height: Specified height of the VT100 terminal window (default: 1000)
+        :type height: int
+        """
+        parent = self._shell_parent or self
+        if parent.protocol != "ssh" or not getattr(parent, "remote_conn_pre", None):
+            raise ValueError("open_shell() requires an established SSH connection")
+        assert parent.remote_conn_pre is not None
+        transport = parent.remote_conn_pre.get_transport()
+        if transport is None or not transport.is_active():
+            raise ConnectionException(
+                f"SSH transport to {self.host}:{self.port} is not active"
+            )
+
+        with parent._shells_lock:
+            parent._shells = [s for s in parent._shells if s.remote_conn is not None]
+            if len(parent._shells) + 1 >= self.max_shell_channels:
+                msg = (
+                    f"Unable to open shell: max_shell_channels ({self.max_shell_channels}) "
+                    f"already open to {self.host}:{self.port}"
+                )
+                raise ConnectionException(msg)
+            shell = copy.copy(parent)
+            shell._shell_parent = parent
+            shell._shells = []
+            shell._session_locker = Lock()
+            shell._read_buffer = ""
+            shell.base_prompt = ""
+            shell.session_log = None
+            shell._session_log_close = False
+            remote_conn = parent.remote_conn_pre.invoke_shell(
+                term="vt100", width=width, height=height
+            )
+            shell.remote_conn = remote_conn
+            parent._shells.append(shell)
+
+        shell._secrets_filter = SecretsFilter(no_log=parent._secrets_filter.no_log)
+        log.addFilter(shell._secrets_filter)
+        remote_conn.settimeout(shell.blocking_timeout)
+        shell.channel = SSHChannel(conn=remote_conn, encoding=shell.encoding)
+        try:
+            shell.special_login_handler()
+        except Exception:
+            shell.disconnect()
+            raise
+        shell._try_session_preparation()
+        return shell
+
     def _test_channel_read(self, count: int = 40, pattern: str = "") -> str:
         """Try to read the channel (generally post login) verify you receive data back.
 
@@ -1722,9 +1918,6 @@ A paramiko SSHException occurred during connection creation:
         :param raise_parsing_error: Raise exception when parsing output to structured data fails.
         """
 
-        # Time to delay in each read loop
-        loop_delay = 0.025
-
         if self.read_timeout_override:
             read_timeout = self.read_timeout_override
 
@@ -1790,19 +1983,16 @@ before timing out.\n"""
         if cmd and cmd_verify:
             new_data = self.command_echo_read(cmd=cmd, read_timeout=10)
 
-        MAX_CHARS = 2_000_000
-        DEQUE_SIZE = 20
         output = ""
-        # Check only the past N-reads. This is for the case where the output is
-        # very large (i.e. searching a very large string for a pattern a whole bunch of times)
-        past_n_reads: Deque[str] = deque(maxlen=DEQUE_SIZE)
+        # Only search newly arrived data (plus an overlap window) on each read. This avoids
+        # re-searching a very large output for the pattern a whole bunch of times.
+        pattern_search = PatternSearch(search_pattern)
         first_line_processed = False
 
         # Keep reading data until search_pattern is found or until read_timeout
         while time.time() - start_time < read_timeout:
             if new_data:
                 output += new_data
-                past_n_reads.append(new_data)
 
                 # Case where we haven't processed the first_line yet (there is a potential issue
                 # in the first line (in cases where the line is repainted).
@@ -1810,21 +2000,12 @@ before timing out.\n"""
                     output, first_line_processed = self._first_line_handler(
                         output, search_pattern
                     )
-                    # Check if we have already found our pattern
-                    if re.search(search_pattern, output):
-                        break
+                    pattern_search.reset()
 
-                else:
-                    if len(output) <= MAX_CHARS:
-                        if re.search(search_pattern, output):
-                            break
-                    else:
-                        # Switch to deque mode if output is greater than MAX_CHARS
-                        # Check if pattern is in the past n reads
-                        if re.search(search_pattern, "".join(past_n_reads)):
-                            break
+                if pattern_search.search(output):
+                    break
 
-            time.sleep(loop_delay)
+            self._wait_for_data_until(start_time, read_timeout)
             new_data = self.read_channel()
 
         else:  # nobreak
@@ -1859,12 +2040,176 @@ You can also look at the Netmiko session_log or debug log for more information.
         )
         return return_val
 
+    @select_cmd_verify
+    def send_command_stream(
+        self,
+        command_string: str,
+        expect_string: Optional[str] = None,
+        read_timeout: float = 10.0,
+        auto_find_prompt: bool = True,
+        strip_prompt: bool = True,
+        strip_command: bool = True,
+        normalize: bool = True,
+        cmd_verify: bool = True,
+    ) -> Iterator[str]:
+        """Execute command_string (like send_command) and yield the output in chunks as it is
+        read from the channel (i.e. to write 'show tech-support' to a file without holding the
+        entire output in memory).
+
+        The chunks are normalized and ANSI-stripped the same as send_command() output and
+        joining all of them gives the same result as send_command(). Only complete lines (plus
+        a small window needed to detect the pattern) are held back until the end. With an
+        expect_string of unbounded width (i.e. '.*') the output is only yielded once the
+        pattern has been found.
+
+        If the generator isn't consumed to the end, the rest of the output is left on the
+        channel.
+
+        :param command_string: The command to be executed on the remote device.
+
+        :param expect_string: Regular expression pattern to use for determining end of output.
+            If left blank will default to being based on router prompt.
+
+        :param read_timeout: Maximum time to wait looking for pattern. Will raise ReadTimeout
+            if timeout is exceeded.
+
+        :param auto_find_prompt: Use find_prompt() to override base prompt
+
+        :param strip_prompt: Remove the trailing router prompt from the output (default: True).
+
+        :param strip_command: Remove the echo of the command from the output (default: True).
+
+        :param normalize: Ensure the proper enter is sent at end of command (default: True).
+
+        :param cmd_verify: Verify command echo before proceeding (default: True).
+        """
+        if self.read_timeout_override:
+            read_timeout = self.read_timeout_override
+
+        if expect_string is not None:
+            search_pattern = expect_string
+        else:
+            search_pattern = self._prompt_handler(auto_find_prompt)
+
+        if normalize:
+            command_string = self.normalize_cmd(command_string)
+
+        try:
+            start_time = time.time()
+            self.write_channel(command_string)
+            new_data = ""
+
+            cmd = command_string.strip()
+            if cmd and cmd_verify:
+                new_data = self.command_echo_read(cmd=cmd, read_timeout=10)
+
+            regex = re.compile(search_pattern)
+            # Data that hasn't been yielded yet. Retain at least the pattern width (so a
+            # match spanning chunks is found) and the last line (for strip_prompt).
+            pending = ""
+            overlap = max_match_width(regex)
+            first_line_processed = False
+            command_stripped = not (strip_command and cmd)
+
+            while time.time() - start_time < read_timeout:
+                if new_data:
+                    if command_stripped and strip_command:
+                        new_data = self.strip_backspaces(new_data)
+                    pending += new_data
+                    if not first_line_processed:
+                        pending, first_line_processed = self._first_line_handler(
+                            pending, search_pattern
+                        )
+
+                    if regex.search(pending):
+                        break
+
+                    # Wait for the complete echo line before stripping the command
+                    if not command_stripped and self.RESPONSE_RETURN in pending:
+                        pending = self.strip_command(command_string, pending)
+                        command_stripped = True
+
+                    # Unbounded width pattern: nothing can be yielded before the match
+                    if command_stripped and overlap is not None:
+                        limit = len(pending) - overlap
+                        cut = pending.rfind(self.RESPONSE_RETURN, 0, max(limit, 0))
+                        if cut > 0:
+                            chunk, pending = pending[:cut], pending[cut:]
+                            yield chunk
+
+                self._wait_for_data_until(start_time, read_timeout)
+                new_data = self.read_channel()
+
+            else:  # nobreak
+                msg = f"""
+Pattern not detected: {repr(search_pattern)} in output.
+
+Things you might try to fix this:
+1. Explicitly set your pattern using the expect_string argument.
+2. Increase the read_timeout to a larger value.
+
+You can also look at the Netmiko session_log or debug log for more information.
+
+"""
+                raise ReadTimeout(msg)
+
+            if not command_stripped:
+                pending = self.strip_command(command_string, pending)
+            if strip_prompt:
+                pending = self.strip_prompt(pending)
+            if pending:
+                yield pending
+        finally:
+            if self.session_log:
+                self.session_log.flush()
+
     def _send_command_str(self, *args: Any, **kwargs: Any) -> str:
         """Wrapper for `send_command` method that always returns a string"""
         output = self.send_command(*args, **kwargs)
         assert isinstance(output, str)
         return output
 
+    def send_command_future(
+        self,
+        command_string: str,
+        parse_executor: Executor,
+        use_textfsm: bool = False,
+        textfsm_template: Optional[str] = None,
+        use_ttp: bool = False,
+        ttp_template: Optional[str] = None,
+        use_genie: bool = False,
+        raise_parsing_error: bool = False,
+        **kwargs: Any,
+    ) -> "Future[Union[str, List[Any], Dict[str, Any]]]":
+        """Execute command_string using send_command() and hand the structured data parsing
+        to parse_executor (i.e. a ProcessPoolExecutor shared by all of the connections).
+
+        The session is released as soon as the raw output has been read (the parsing doesn't
+        hold the channel lock or run under the GIL of this process with a process pool). The
+        returned Future resolves to the same data that send_command() would have returned.
+
+        :param command_string: The command to be executed on the remote device.
+
+        :param parse_executor: Executor to run the TextFSM/TTP/Genie parsing in.
+
+        :param kwargs: Any other send_command() arguments (i.e. expect_string, read_timeout).
+
+        See send_command() for the remaining (parsing) arguments.
+        """
+        output = self._send_command_str(command_string, **kwargs)
+        return parse_executor.submit(
+            structured_data_converter,
+            command=command_string,
+            raw_data=output,
+            platform=self.device_type,
+            use_textfsm=use_textfsm,
+            use_ttp=use_ttp,
+            use_genie=use_genie,
+            textfsm_template=textfsm_template,
+            ttp_template=ttp_template,
+            raise_parsing_error=raise_parsing_error,
+        )
+
     def send_command_expect(
         self, *args: Any, **kwargs: Any
     ) -> Union[str, List[Any], Dict[str, Any]]:
@@ -1882,6 +2227,8 @@ You can also look at the Netmiko session_log or debug log for more information.
         self,
         commands: Sequence[Union[str, List[str]]],
         multiline: bool = True,
+        pipeline: bool = False,
+        window: Optional[int] = None,
         **kwargs: Any,
     ) -> str:
         """
@@ -1897,6 +2244,12 @@ You can also look at the Netmiko session_log or debug log for more information.
         device's prompt (unless expect_string argument is passed in via
         kwargs.
 
+        With pipeline=True the commands are sent using send_command_batch() (without waiting
+        for the prompt between the commands). This requires all of the commands to use the
+        default expect_string and no other arguments than the ones send_command_batch()
+        supports (otherwise the commands are sent one at a time); window limits the number of
+        commands sent ahead.
+
         """
         output = ""
         if multiline:
@@ -1907,6 +2260,31 @@ You can also look at the Netmiko session_log or debug log for more information.
             auto_find_prompt = kwargs.get("auto_find_prompt", True)
             default_expect_string = self._prompt_handler(auto_find_prompt)
 
+        batch_kwargs = {
+            "auto_find_prompt",
+            "cmd_verify",
+            "read_timeout",
+            "strip_prompt",
+            "strip_command",
+            "normalize",
+        }
+        if (
+            pipeline
+            and all(isinstance(cmd, str) or not cmd[1] for cmd in commands)
+            and set(kwargs) <= batch_kwargs
+        ):
+            kwargs.pop("auto_find_prompt", None)
+            kwargs.pop("cmd_verify", None)
+            cmd_list = [cmd if isinstance(cmd, str) else cmd[0] for cmd in commands]
+            results = self.send_command_batch(
+                cmd_list,
+                window=window,
+                expect_string=default_expect_string,
+                auto_find_prompt=False,
+                **kwargs,
+            )
+            return "".join(results)
+
         if commands and isinstance(commands[0], str):
             # If list of commands just send directly using default_expect_string (probably prompt)
             for cmd in commands:
@@ -1926,6 +2304,163 @@ You can also look at the Netmiko session_log or debug log for more information.
                 )
         return output
 
+    @flush_session_log
+    def send_command_batch(
+        self,
+        commands: Sequence[str],
+        window: Optional[int] = None,
+        expect_string: Optional[str] = None,
+        read_timeout: float = 10.0,
+        auto_find_prompt: bool = True,
+        strip_prompt: bool = True,
+        strip_command: bool = True,
+        normalize: bool = True,
+    ) -> List[str]:
+        """Execute commands (i.e. show commands) and return a list with the output of each of
+        them.
+
+        The commands are pipelined: they are written to the channel without waiting for the
+        prompt after each of them (at most window commands are outstanding, default: all of
+        them). The returned data is split into the output of each command on the prompt. This
+        saves a round-trip per command over high latency links.
+
+        Drivers with typeahead_safe=False (and window=1) send one command at a time using
+        send_command().
+
+        :param commands: The commands to be executed on the remote device.
+
+        :param window: Maximum number of commands sent before their output has been received
+            (default: None, send all of them up front).
+
+        :param expect_string: Regular expression pattern that marks the end of the output of
+            each command. If left blank will default to being based on router prompt.
+
+        :param read_timeout: Maximum time to wait for the output of each command. Will raise
+            ReadTimeout if timeout is exceeded.
+
+        :param auto_find_prompt: Use find_prompt() to override base prompt
+
+        :param strip_prompt: Remove the trailing router prompt from the output (default: True).
+
+        :param strip_command: Remove the echo of the command from the output (default: True).
+
+        :param normalize: Ensure the proper enter is sent at end of command (default: True).
+        """
+        if self.read_timeout_override:
+            read_timeout = self.read_timeout_override
+
+        if expect_string is not None:
+            search_pattern = expect_string
+        else:
+            search_pattern = self._prompt_handler(auto_find_prompt)
+
+        if not self.typeahead_safe or window == 1:
+            return [
+                self._send_command_str(
+                    cmd,
+                    expect_string=search_pattern,
+                    read_timeout=read_timeout,
+                    strip_prompt=strip_prompt,
+                    strip_command=strip_command,
+                    normalize=normalize,
+                )
+                for cmd in commands
+            ]
+
+        if normalize:
+            commands = [self.normalize_cmd(cmd) for cmd in commands]
+        if not window:
+            window = len(commands)
+
+        regex = re.compile(search_pattern)
+        overlap = max_match_width(regex)
+        results: List[str] = []
+        sent = 0
+        # Data received for the commands that haven't completed yet
+        pending = ""
+        # Position in pending where the pattern search for the current command resumes
+        search_from = 0
+
+        start_time = time.time()
+        while len(results) < len(commands):
+            # Keep up to window commands outstanding
+            while sent < len(commands) and sent - len(results) < window:
+                self.write_channel(commands[sent])
+                sent += 1
+
+            # The first line is the echo of the command
+            echo_end = pending.find("\n")
+            match = None
+            if echo_end >= 0:
+                match = regex.search(pending, max(search_from, echo_end))
+            end = self._batch_output_end(pending, match, commands, len(results))
+            if end is not None:
+                output = self._sanitize_output(
+                    pending[:end],
+                    strip_command=strip_command,
+                    command_string=commands[len(results)],
+                    strip_prompt=strip_prompt,
+                )
+                results.append(output)
+                pending = pending[end:]
+                search_from = 0
+                start_time = time.time()
+                continue
+
+            if time.time() - start_time >= read_timeout:
+                msg = f"""
+Pattern not detected: {repr(search_pattern)} in output of command {len(results) + 1} of \
+{len(commands)}: {repr(commands[len(results)].strip())}.
+
+Things you might try to fix this:
+1. Explicitly set your pattern using the expect_string argument.
+2. Increase the read_timeout to a larger value.
+3. Use a smaller window (or window=1) if the device doesn't handle typeahead.
+
+You can also look at the Netmiko session_log or debug log for more information.
+
+"""
+                raise ReadTimeout(msg)
+
+            if match is not None:
+                search_from = match.start()
+            elif overlap is not None:
+                search_from = max(len(pending) - overlap, 0)
+            self._wait_for_data_until(start_time, read_timeout)
+            pending += self.read_channel()
+
+        # Everything after the last prompt line is retained in the _read_buffer
+        self._read_buffer += pending
+        return results
+
+    @staticmethod
+    def _batch_output_end(
+        pending: str,
+        match: Optional[Match[str]],
+        commands: Sequence[str],
+        index: int,
+    ) -> Optional[int]:
+        """Return the position in pending where the output of commands[index] ends (None if
+        more data is needed).
+
+        The output ends at the echo of the next command (which follows the prompt on the same
+        line) or at the end of the prompt line for the last command.
+        """
+        if match is None:
+            return None
+        line_end = pending.find("\n", match.end())
+        last = index + 1 == len(commands)
+        if line_end < 0:
+            if last:
+                return len(pending)
+            # Wait for the complete echo of the next command
+            return None
+        next_cmd = "" if last else commands[index + 1].strip()
+        if next_cmd:
+            echo_start = pending.find(next_cmd, match.end(), line_end)
+            return echo_start if echo_start >= 0 else match.end()
+        return len(pending[:line_end].rstrip("\r"))
+
     def send_multiline_timing(
         self, commands: Sequence[str], multiline: bool = True, **kwargs: Any
     ) -> str:
@@ -2204,6 +2739,7 @@ You can also look at the Netmiko session_log or debug log for more information.
         error_pattern: str = "",
         terminator: str = r"#",
         bypass_commands: Optional[str] = None,
+        window: int = 1,
     ) -> str:
         """
         Send configuration commands down the SSH channel.
@@ -2242,6 +2778,12 @@ You can also look at the Netmiko session_log or debug log for more information.
 
         :param bypass_commands: Regular expression pattern indicating configuration commands
         where cmd_verify is automatically disabled.
+
+        :param window: Number of configuration commands sent ahead of the command whose echo
+        and prompt are being verified (cmd_verify=True only). The echo of each command is still
+        verified in order and error_pattern is checked against the output of each command
+        (default: 1, wait for the prompt after each command). Drivers that aren't
+        typeahead_safe always use 1.
         """
 
         if self.global_cmd_verify is not None:
@@ -2327,6 +2869,15 @@ You can also look at the Netmiko session_log or debug log for more information.
             if not error_pattern:
                 output += self.read_channel_timing(read_timeout=read_timeout)
 
+        elif window > 1 and self.typeahead_safe:
+            output += self._send_config_window(
+                config_commands,
+                window=window,
+                read_timeout=read_timeout,
+                error_pattern=error_pattern,
+                terminator=terminator,
+            )
+
         else:
             for cmd in config_commands:
                 self.write_channel(self.normalize_cmd(cmd))
@@ -2353,6 +2904,109 @@ You can also look at the Netmiko session_log or debug log for more information.
         log.debug(f"{output}")
         return output
 
+    def _send_config_window(
+        self,
+        config_commands: Iterable[str],
+        window: int,
+        read_timeout: float,
+        error_pattern: str = "",
+        terminator: str = r"#",
+    ) -> str:
+        """Send config_commands with up to window commands in flight (send_config_set() with
+        cmd_verify and window > 1).
+
+        The output of each command (its echo through the next prompt or terminator) is
+        verified in order and checked against error_pattern. The output of a command ends at
+        the echo of the next command (which follows the prompt on the same line).
+        """
+        if self.read_timeout_override:
+            read_timeout = self.read_timeout_override
+
+        prompt_regex = re.compile(f"(?:{re.escape(self.base_prompt)}|{terminator})")
+        commands = iter(config_commands)
+        # (line number, command) of the commands whose output hasn't been verified yet
+        in_flight: Deque[Tuple[int, str]] = deque()
+        line_number = 0
+        exhausted = False
+        output = ""
+        pending = ""
+
+        start_time = time.time()
+        while True:
+            while not exhausted and len(in_flight) < window:
+                cmd = next(commands, None)
+                if cmd is None:
+                    exhausted = True
+                    break
+                line_number += 1
+                self.write_channel(self.normalize_cmd(cmd))
+                in_flight.append((line_number, cmd))
+            if not in_flight:
+                break
+
+            line, cmd = in_flight[0]
+            next_cmd = in_flight[1][1] if len(in_flight) > 1 else None
+            end = self._config_output_end(pending, cmd, next_cmd, prompt_regex)
+            if end is not None:
+                cmd_output, pending = pending[:end], pending[end:]
+                output += cmd_output
+                if error_pattern and re.search(error_pattern, cmd_output, flags=re.M):
+                    msg = (
+                        f"Invalid input detected at command: {cmd} (line {line}; "
+                        f"{len(in_flight) - 1} subsequent line(s) were already sent)"
+                    )
+                    raise ConfigInvalidException(msg)
+                in_flight.popleft()
+                start_time = time.time()
+                continue
+
+            if time.time() - start_time >= read_timeout:
+                msg = f"""\n\nConfiguration command not verified: {repr(cmd)} (line {line}).
+
+The echo of the command followed by the prompt or {repr(terminator)} wasn't detected in
+the output. Things you might try to fix this:
+1. Increase the read_timeout to a larger value.
+2. Use a smaller window (or window=1) if the device doesn't handle typeahead.
+
+You can also look at the Netmiko session_log or debug log for more information.\n\n"""
+                raise ReadTimeout(msg)
+
+            self._wait_for_data_until(start_time, read_timeout)
+            pending += self.read_channel()
+
+        # Everything after the last prompt line is retained in the _read_buffer
+        self._read_buffer += pending
+        return output
+
+    @staticmethod
+    def _config_output_end(
+        pending: str,
+        cmd: str,
+        next_cmd: Optional[str],
+        prompt_regex: Pattern[str],
+    ) -> Optional[int]:
+        """Return the position in pending where the output of cmd ends (None if more data is
+        needed)."""
+        echo = re.search(re.escape(cmd.strip()), pending)
+        if echo is None:
+            return None
+        prompt = prompt_regex.search(pending, echo.end())
+        if prompt is None:
+            return None
+        line_end = pending.find("\n", prompt.end())
+        if next_cmd is not None and next_cmd.strip():
+            echo_start = pending.find(
+                next_cmd.strip(),
+                prompt.end(),
+                len(pending) if line_end < 0 else line_end,
+            )
+            if echo_start >= 0:
+                return echo_start
+            # Wait for the rest of the prompt line (or the echo of next_cmd)
+            return None if line_end < 0 else line_end
+        # Like the '.*$' used by send_config_set(), read the entire prompt line
+        return len(pending) if line_end < 0 else line_end
+
     def strip_ansi_escape_codes(self, string_buffer: str) -> str:
         """
         Remove any ANSI (VT100) ESC codes from the output
@@ -2387,88 +3041,23 @@ You can also look at the Netmiko session_log or debug log for more information.
         :type string_buffer: str
         """  # noqa
 
-        code_position_cursor = chr(27) + r"\[\d+;\d+H"
-        code_show_cursor = chr(27) + r"\[\?25h"
-        code_next_line = chr(27) + r"E"
-        code_erase_line_end = chr(27) + r"\[K"
-        code_erase_line = chr(27) + r"\[2K"
-        code_erase_start_line = chr(27) + r"\[K"
-        code_enable_scroll = chr(27) + r"\[\d+;\d+r"
-        code_insert_line = chr(27) + r"\[(\d+)L"
-        code_carriage_return = chr(27) + r"\[1M"
-        code_disable_line_wrapping = chr(27) + r"\[\?7l"
-        code_reset_mode_screen_options = chr(27) + r"\[\?\d+l"
-        code_reset_graphics_mode = chr(27) + r"\[00m"
-        code_erase_display = chr(27) + r"\[2J"
-        code_erase_display_0 = chr(27) + r"\[J"
-        code_graphics_mode = chr(27) + r"\[\dm"
-        code_graphics_mode1 = chr(27) + r"\[\d\d;\d\dm"
-        code_graphics_mode2 = chr(27) + r"\[\d\d;\d\d;\d\dm"
-        code_graphics_mode3 = chr(27) + r"\[(3|4)\dm"
-        code_graphics_mode4 = chr(27) + r"\[(9|10)[0-7]m"
-        code_graphics_mode5 = chr(27) + r"\[\d;\d\dm"
-        code_get_cursor_position = chr(27) + r"\[6n"
-        code_cursor_position = chr(27) + r"\[m"
-        code_attrs_off = chr(27) + r"\[0m"
-        code_reverse = chr(27) + r"\[7m"
-        code_cursor_left = chr(27) + r"\[\d+D"
-        code_cursor_forward = chr(27) + r"\[\d*C"
-        code_cursor_up = chr(27) + r"\[\d*A"
-        code_cursor_down = chr(27) + r"\[\d*B"
-        code_wrap_around = chr(27) + r"\[\?7h"
-        code_enable_bracketed_paste_mode = chr(27) + r"\[\?2004h"
-        code_disable_bracketed_paste_mode = chr(27) + r"\[\?2004l"
-        code_underline = chr(27) + r"\[4m"
-        code_query_device = chr(27) + r"\[c"
-
-        code_set = [
-            code_position_cursor,
-            code_show_cursor,
-            code_erase_line,
-            code_enable_scroll,
-            code_erase_start_line,
-            code_carriage_return,
-            code_disable_line_wrapping,
-            code_erase_line_end,
-            code_reset_mode_screen_options,
-            code_reset_graphics_mode,
-            code_erase_display,
-            code_graphics_mode,
-            code_graphics_mode1,
-            code_graphics_mode2,
-            code_graphics_mode3,
-            code_graphics_mode4,
-            code_graphics_mode5,
-            code_get_cursor_position,
-            code_cursor_position,
-            code_erase_display,
-            code_erase_display_0,
-            code_attrs_off,
-            code_reverse,
-            code_cursor_left,
-            code_cursor_up,
-            code_cursor_down,
-            code_cursor_forward,
-            code_wrap_around,
-            code_enable_bracketed_paste_mode,
-            code_disable_bracketed_paste_mode,
-            code_underline,
-            code_query_device,
-        ]
-
-        output = string_buffer
-        for ansi_esc_code in code_set:
-            output = re.sub(ansi_esc_code, "", output)
+        regex = _ansi_escape_regex(tuple(self.extra_ansi_escape_codes))
+        output, count = regex.subn("", string_buffer)
+        # Removing a code can join the text around it into a new code, repeat until stable
+        while count and chr(27) in output:
+            output, count = regex.subn("", output)
+        if chr(27) not in output:
+            return output
 
         # CODE_NEXT_LINE must substitute with return
-        output = re.sub(code_next_line, self.RETURN, output)
+        output = CODE_NEXT_LINE.sub(self.RETURN, output)
 
         # Aruba and ProCurve switches can use code_insert_line for <enter>
-        insert_line_match = re.search(code_insert_line, output)
+        insert_line_match = CODE_INSERT_LINE.search(output)
         if insert_line_match:
             # Substitute each insert_line with a new <enter>
             count = int(insert_line_match.group(1))
-            output = re.sub(code_insert_line, count * self.RETURN, output)
+            output = CODE_INSERT_LINE.sub(count * self.RETURN, output)
 
         return output
 
@@ -2478,17 +3067,33 @@ You can also look at the Netmiko session_log or debug log for more information.
 
     def paramiko_cleanup(self) -> None:
         """Cleanup Paramiko to try to gracefully handle SSH session ending."""
-        if self.remote_conn_pre is not None:
+        if self._shell_parent is not None:
+            # Shell opened by open_shell(); the transport belongs to the parent connection
+            if self.remote_conn is not None:
+                self.remote_conn.close()
+            with self._shell_parent._shells_lock:
+                if self in self._shell_parent._shells:
+                    self._shell_parent._shells.remove(self)
+        elif self.remote_conn_pre is not None:
             self.remote_conn_pre.close()
         del self.remote_conn_pre
 
     def disconnect(self) -> None:
         """Try to gracefully close the session."""
-        try:
-            self.cleanup()
-        except Exception:
-            # Keep going on cleanup process even if exceptions
-            pass
+        # Shells opened over this connection's SSH transport (open_shell()) go with it
+        for shell in list(self._shells):
+            shell.disconnect()
+
+        transport = None
+        if self.protocol == "ssh":
+            transport = getattr(getattr(self, "remote_conn", None), "transport", None)
+        # No graceful exit if the SSH connection has been lost (it would only time out)
+        if transport is None or transport.is_active():
+            try:
+                self.cleanup()
+            except Exception:
+                # Keep going on cleanup process even if exceptions
+                pass
 
         try:
             if self.protocol == "ssh":
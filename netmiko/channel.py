@@ -1,14 +1,27 @@
 from typing import Any, Optional
 from abc import ABC, abstractmethod
+import selectors
+import time
 import paramiko
 import serial
 
 from netmiko._telnetlib import telnetlib
 from netmiko.utilities import write_bytes
-from netmiko.netmiko_globals import MAX_BUFFER
+from netmiko.netmiko_globals import MAX_BUFFER, POLL_DELAY
 from netmiko.exceptions import ReadException, WriteException
 
 
+def _wait_readable(fileobj: Any, timeout: float) -> bool:
+    """Block until fileobj is readable or timeout expires.
+
+    Uses the platform's best selector (epoll/poll) instead of select.select() which can't
+    handle file descriptors above FD_SETSIZE (1024) when many sessions are open.
+    """
+    with selectors.DefaultSelector() as selector:
+        selector.register(fileobj, selectors.EVENT_READ)
+        return bool(selector.select(timeout))
+
+
 class Channel(ABC):
     @abstractmethod
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -50,6 +63,15 @@ class Channel(ABC):
         """Write data down the channel."""
         pass
 
+    def wait_for_data(self, timeout: float) -> bool:
+        """Block until data is available to be read or until timeout expires.
+
+        Returns True if data is (probably) available. Channels that have no way to
+        detect readability fall back to a short fixed delay.
+        """
+        time.sleep(min(timeout, POLL_DELAY))
+        return True
+
     # @abstractmethod
     # def is_alive(self) -> bool:
     #     """Is the channel alive."""
@@ -73,29 +95,50 @@ class SSHChannel(Channel):
             )
         self.remote_conn.sendall(write_bytes(out_data, encoding=self.encoding))
 
+    def _recv(self) -> bytes:
+        """Single read of available data (as bytes)."""
+        assert self.remote_conn is not None
+        if self.remote_conn.recv_ready():
+            outbuf = self.remote_conn.recv(MAX_BUFFER)
+            if len(outbuf) == 0:
+                raise ReadException("Channel stream closed by remote device.")
+            assert isinstance(outbuf, bytes)
+            return outbuf
+        return b""
+
     def read_buffer(self) -> str:
         """Single read of available data."""
         if self.remote_conn is None:
             raise ReadException("Attempt to read, but there is no active channel.")
-        output = ""
+        return self._recv().decode(self.encoding, "ignore")
+
+    def wait_for_data(self, timeout: float) -> bool:
+        """Block on the Paramiko channel until data arrives or timeout expires."""
+        if self.remote_conn is None:
+            raise ReadException("Attempt to read, but there is no active channel.")
         if self.remote_conn.recv_ready():
-            outbuf = self.remote_conn.recv(MAX_BUFFER)
-            if len(outbuf) == 0:
-                raise ReadException("Channel stream closed by remote device.")
-            output += outbuf.decode(self.encoding, "ignore")
-        return output
+            return True
+        if self.remote_conn.closed or self.remote_conn.eof_received:
+            # select() would return immediately on a closed channel (busy-loop)
+            time.sleep(min(timeout, POLL_DELAY))
+            return False
+        return (
+            _wait_readable(self.remote_conn, timeout) and self.remote_conn.recv_ready()
+        )
 
     def read_channel(self) -> str:
         """Read all of the available data from the channel."""
         if self.remote_conn is None:
             raise ReadException("Attempt to read, but there is no active channel.")
-        output = ""
+        # Accumulate the raw bytes and decode once (also avoids splitting multi-byte
+        # characters that straddle two reads).
+        output = bytearray()
         while True:
-            new_output = self.read_buffer()
-            output += new_output
-            if new_output == "":
+            new_output = self._recv()
+            if not new_output:
                 break
-        return output
+            output += new_output
+        return output.decode(self.encoding, "ignore")
 
 
 class TelnetChannel(Channel):
@@ -119,6 +162,19 @@ class TelnetChannel(Channel):
         """Single read of available data."""
         raise NotImplementedError
 
+    def wait_for_data(self, timeout: float) -> bool:
+        """Block on the telnet socket until data arrives or timeout expires."""
+        if self.remote_conn is None:
+            raise ReadException("Attempt to read, but there is no active channel.")
+        # Data already pulled off the socket (raw or processed) won't make it readable
+        pending_raw = len(self.remote_conn.rawq) > self.remote_conn.irawq
+        if self.remote_conn.cookedq or pending_raw:
+            return True
+        if self.remote_conn.eof:
+            time.sleep(min(timeout, POLL_DELAY))
+            return False
+        return _wait_readable(self.remote_conn, timeout)
+
     def read_channel(self) -> str:
         """Read all of the available data from the channel."""
         if self.remote_conn is None:
@@ -157,11 +213,27 @@ class SerialChannel(Channel):
         else:
             return ""
 
+    def wait_for_data(self, timeout: float) -> bool:
+        """Poll the serial port until data arrives or timeout expires.
+
+        pySerial has no portable way to block on readability (Windows), so poll
+        in_waiting using the short POLL_DELAY.
+        """
+        if self.remote_conn is None:
+            raise ReadException("Attempt to read, but there is no active channel.")
+        start = time.time()
+        while self.remote_conn.in_waiting <= 0:
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, POLL_DELAY))
+        return True
+
     def read_channel(self) -> str:
         """Read all of the available data from the channel."""
         if self.remote_conn is None:
             raise ReadException("Attempt to read, but there is no active channel.")
-        output = ""
+        output = []
         while self.remote_conn.in_waiting > 0:
-            output += self.read_buffer()
-        return output
+            output.append(self.read_buffer())
+        return "".join(output)
@@ -5,9 +5,11 @@ import re
 import os
 import hashlib
 import io
+import functools
 
 from netmiko.cisco_base_connection import CiscoBaseConnection, CiscoFileTransfer
 from netmiko.base_connection import BaseConnection
+from netmiko.file_digest import file_digest
 
 
 class CiscoIosBase(CiscoBaseConnection):
@@ -218,16 +220,16 @@ class InLineTransfer(CiscoIosFileTransfer):
             raise ValueError(
                 "add_newline argument is not supported for inline transfers."
             )
-        file_contents = self._read_file(file_name)
-        file_contents = file_contents + "\n"  # Cisco IOS automatically adds this
-        file_contents_bytes = file_contents.encode("UTF-8")
-        return hashlib.md5(file_contents_bytes).hexdigest()
+        return file_digest(
+            file_name,
+            algorithm="md5",
+            variant="inline",
+            compute=lambda path: self.config_md5(self._read_file(path)),
+        )
 
     def config_md5(self, source_config: str) -> str:
         """Compute MD5 hash of text."""
-        file_contents = source_config + "\n"  # Cisco IOS automatically adds this
-        file_contents_bytes = file_contents.encode("UTF-8")
-        return hashlib.md5(file_contents_bytes).hexdigest()
+        return _config_md5(source_config)
 
     def put_file(self) -> None:
         curlybrace = r"{"
@@ -289,3 +291,10 @@ class InLineTransfer(CiscoIosFileTransfer):
 
     def disable_scp(self, cmd: str = "") -> None:
         raise NotImplementedError
+
+
+@functools.lru_cache(maxsize=8)
+def _config_md5(source_config: str) -> str:
+    file_contents = source_config + "\n"  # Cisco IOS automatically adds this
+    file_contents_bytes = file_contents.encode("UTF-8")
+    return hashlib.md5(file_contents_bytes).hexdigest()
@@ -88,6 +88,8 @@ class CiscoNxosFileTransfer(CiscoFileTransfer):
         progress: Optional[Callable[..., Any]] = None,
         progress4: Optional[Callable[..., Any]] = None,
         hash_supported: bool = True,
+        reuse_transport: bool = False,
+        resume: bool = False,
     ) -> None:
         self.ssh_ctl_chan = ssh_conn
         self.source_file = source_file
@@ -114,6 +116,9 @@ class CiscoNxosFileTransfer(CiscoFileTransfer):
         self.socket_timeout = socket_timeout
         self.progress = progress
         self.progress4 = progress4
+        self.reuse_transport = reuse_transport
+        self.resume = resume
+        self.scp_time_saved = 0.0
 
     def check_file_exists(self, remote_cmd: str = "") -> bool:
         """Check if the dest_file already exists on the file system (return boolean)."""
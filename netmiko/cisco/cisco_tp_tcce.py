@@ -14,6 +14,9 @@ from netmiko.cisco_base_connection import CiscoSSHConnection
 
 
 class CiscoTpTcCeSSH(CiscoSSHConnection):
+    # Command output ends with OK/ERROR (not the prompt)
+    typeahead_safe = False
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         default_enter = kwargs.get("default_enter")
         kwargs["default_enter"] = "\r\n" if default_enter is None else default_enter
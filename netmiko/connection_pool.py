@@ -0,0 +1,269 @@
+"""
+Pool of connected Netmiko sessions that are reused across jobs.
+
+Every ConnectHandler() call pays for the TCP connect, the SSH handshake, authentication, and
+session_preparation(). ConnectionPool keeps connections open after they are released and
+hands them back out to later requests for the same device.
+
+    from netmiko import ConnectionPool
+
+    pool = ConnectionPool(max_per_host=2, idle_ttl=120)
+    with pool.lease(**device) as conn:
+        output = conn.send_command("show version")
+    ...
+    pool.close()
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+
+from netmiko.base_connection import BaseConnection
+from netmiko.exceptions import NetmikoTimeoutException
+from netmiko.ssh_dispatcher import ConnectHandler
+
+log = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, int, str, str]
+
+
+@dataclass
+class _Pooled:
+    connection: BaseConnection
+    key: PoolKey
+    released_at: float = field(default_factory=time.monotonic)
+
+
+class ConnectionPool:
+    """Lease warm connections keyed by (host, port, username, device_type).
+
+    :param max_per_host: Maximum number of open connections (leased + idle) per key;
+        acquire() waits for a connection to be released once the limit is reached.
+
+    :param idle_ttl: Idle connections older than this (in seconds) are disconnected.
+
+    :param connection_factory: Callable used to create new connections (default:
+        ConnectHandler).
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 4,
+        idle_ttl: float = 300.0,
+        connection_factory: Callable[..., BaseConnection] = ConnectHandler,
+    ) -> None:
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be at least 1")
+        self.max_per_host = max_per_host
+        self.idle_ttl = idle_ttl
+        self.connection_factory = connection_factory
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._cond = threading.Condition()
+        self._idle: Dict[PoolKey, List[_Pooled]] = {}
+        self._leased: Dict[int, _Pooled] = {}
+        self._open: Dict[PoolKey, int] = {}
+        self._closed = False
+
+    @staticmethod
+    def _make_key(device: Dict[str, Any]) -> PoolKey:
+        device_type = device.get("device_type", "")
+        port = device.get("port")
+        if not port:
+            port = 23 if "telnet" in device_type else 22
+        host = device.get("host") or device.get("ip") or ""
+        return (host, int(port), device.get("username", ""), device_type)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "idle": sum(len(idle) for idle in self._idle.values()),
+                "leased": len(self._leased),
+            }
+
+    def acquire(self, timeout: Optional[float] = None, **device: Any) -> BaseConnection:
+        """Return a connection for device (kwargs as for ConnectHandler).
+
+        An idle connection is reused if it passes is_alive(); otherwise a new connection
+        is created. Raises NetmikoTimeoutException if max_per_host connections are leased
+        for the device and none is released within timeout seconds.
+        """
+        key = self._make_key(device)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            stale: List[_Pooled] = []
+            pooled: Optional[_Pooled] = None
+            with self._cond:
+                if self._closed:
+                    raise ValueError("ConnectionPool is closed")
+                stale = self._expire_idle()
+                idle = self._idle.get(key)
+                if idle:
+                    pooled = idle.pop()
+                elif self._open.get(key, 0) < self.max_per_host:
+                    # Reserve the slot before connecting (outside of the lock)
+                    self._open[key] = self._open.get(key, 0) + 1
+                    self.misses += 1
+                else:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        msg = (
+                            f"Timed-out waiting for a pooled connection to {key[0]}:{key[1]} "
+                            f"(max_per_host={self.max_per_host})"
+                        )
+                        raise NetmikoTimeoutException(msg)
+                    self._cond.wait(remaining)
+                    continue
+            self._disconnect(stale)
+
+            if pooled is not None:
+                if self._healthy(pooled.connection):
+                    with self._cond:
+                        self.hits += 1
+                        self._leased[id(pooled.connection)] = pooled
+                    return pooled.connection
+                # Dead connection: drop it and try again
+                with self._cond:
+                    self.evictions += 1
+                    self._forget(key)
+                self._disconnect([pooled])
+                continue
+
+            try:
+                connection = self.connection_factory(**device)
+            except Exception:
+                with self._cond:
+                    self._forget(key)
+                raise
+            with self._cond:
+                self._leased[id(connection)] = _Pooled(connection=connection, key=key)
+            return connection
+
+    def release(self, connection: BaseConnection, discard: bool = False) -> None:
+        """Return a leased connection to the pool.
+
+        The session is returned to a known state (config mode exited and the base prompt
+        found again) before it can be reused; if that fails (or discard=True) the
+        connection is disconnected instead.
+        """
+        with self._cond:
+            pooled = self._leased.pop(id(connection), None)
+        if pooled is None:
+            raise ValueError("Connection was not leased from this pool")
+
+        if not discard:
+            discard = not self._restore(connection)
+        with self._cond:
+            if discard or self._closed:
+                self._forget(pooled.key)
+            else:
+                pooled.released_at = time.monotonic()
+                self._idle.setdefault(pooled.key, []).append(pooled)
+                self._cond.notify_all()
+        if discard or self._closed:
+            self._disconnect([pooled])
+
+    @contextmanager
+    def lease(
+        self, timeout: Optional[float] = None, **device: Any
+    ) -> Iterator[BaseConnection]:
+        """Context manager that acquires a connection and releases it on exit.
+
+        The connection is discarded if an exception is raised inside the block.
+        """
+        connection = self.acquire(timeout=timeout, **device)
+        try:
+            yield connection
+        except BaseException:
+            self.release(connection, discard=True)
+            raise
+        else:
+            self.release(connection)
+
+    def evict_idle(self) -> int:
+        """Disconnect idle connections older than idle_ttl. Returns the number evicted."""
+        with self._cond:
+            stale = self._expire_idle()
+        self._disconnect(stale)
+        return len(stale)
+
+    def close(self) -> None:
+        """Disconnect all idle connections; leased connections are closed on release."""
+        with self._cond:
+            self._closed = True
+            idle = [
+                pooled for pooled_list in self._idle.values() for pooled in pooled_list
+            ]
+            self._idle.clear()
+            for pooled in idle:
+                self._forget(pooled.key)
+            self._cond.notify_all()
+        self._disconnect(idle)
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _expire_idle(self) -> List[_Pooled]:
+        """Remove expired idle connections (caller holds the lock)."""
+        stale = []
+        cutoff = time.monotonic() - self.idle_ttl
+        for key, idle in list(self._idle.items()):
+            keep = [pooled for pooled in idle if pooled.released_at > cutoff]
+            for pooled in idle:
+                if pooled.released_at <= cutoff:
+                    stale.append(pooled)
+                    self._forget(key)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        self.evictions += len(stale)
+        return stale
+
+    def _forget(self, key: PoolKey) -> None:
+        """Free the slot held by a connection (caller holds the lock)."""
+        self._open[key] -= 1
+        if not self._open[key]:
+            del self._open[key]
+        self._cond.notify_all()
+
+    @staticmethod
+    def _healthy(connection: BaseConnection) -> bool:
+        try:
+            return connection.is_alive()
+        except Exception:
+            return False
+
+    @staticmethod
+    def _restore(connection: BaseConnection) -> bool:
+        try:
+            if connection.check_config_mode():
+                connection.exit_config_mode()
+            connection.set_base_prompt()
+        except Exception as e:
+            log.debug(f"Unable to restore pooled connection state: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _disconnect(pooled_list: List[_Pooled]) -> None:
+        for pooled in pooled_list:
+            try:
+                pooled.connection.disconnect()
+            except Exception:
+                pass
@@ -6,6 +6,9 @@ from netmiko.base_connection import BaseConnection
 
 
 class DellIsilonSSH(BaseConnection):
+    # Remove Null code
+    extra_ansi_escape_codes = (r"\x00",)
+
     def session_preparation(self) -> None:
         """Prepare the session after the connection has been established."""
         self.ansi_escape_codes = True
@@ -29,11 +32,6 @@ class DellIsilonSSH(BaseConnection):
             pattern=pattern,
         )
 
-    def strip_ansi_escape_codes(self, string_buffer: str) -> str:
-        """Remove Null code"""
-        output = re.sub(r"\x00", "", string_buffer)
-        return super().strip_ansi_escape_codes(output)
-
     def _zsh_mode(self, prompt_terminator: str = "$") -> None:
         """Run zsh command to unify the environment"""
         if self.global_delay_factor < 1:
@@ -15,6 +15,9 @@ class ExtremeExosBase(NoConfig, CiscoSSHConnection):
     Designed for EXOS >= 15.0
     """
 
+    # The prompt includes a counter that changes after every command
+    typeahead_safe = False
+
     def session_preparation(self) -> None:
         self._test_channel_read(pattern=r"[>\#]")
         self.set_base_prompt()
@@ -94,6 +97,8 @@ class ExtremeExosFileTransfer(BaseFileTransfer):
         progress: Optional[Callable[..., Any]] = None,
         progress4: Optional[Callable[..., Any]] = None,
         hash_supported: bool = False,
+        reuse_transport: bool = False,
+        resume: bool = False,
     ) -> None:
         super().__init__(
             ssh_conn=ssh_conn,
@@ -105,6 +110,8 @@ class ExtremeExosFileTransfer(BaseFileTransfer):
             progress=progress,
             progress4=progress4,
             hash_supported=hash_supported,
+            reuse_transport=reuse_transport,
+            resume=resume,
         )
 
     def remote_space_available(self, search_pattern: str = r"(\d+)\s+\d+%$") -> int:
@@ -0,0 +1,194 @@
+"""
+Digests (MD5 by default) of local files, i.e. the images transferred by FileTransfer.
+
+Files are hashed in large blocks and the digests are cached (in memory and optionally on disk
+using DigestCache) keyed by the path, size, mtime, ctime, and inode of the file. An image that
+is staged to many devices is only hashed once; modifying the file changes the key.
+
+    from netmiko import DigestCache
+    from netmiko.file_digest import set_digest_cache
+
+    set_digest_cache(DigestCache())
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+import hashlib
+import os
+import threading
+import time
+
+from netmiko.sqlite_cache import SQLiteCache
+
+# Size of the reads used to hash a file
+HASH_BLOCK_SIZE = 1024 * 1024
+# Files modified less than this many seconds ago aren't cached (the file could still be
+# changing without its mtime changing, i.e. on file systems with a coarse mtime)
+RACY_INTERVAL = 2.0
+
+# (path, algorithm, variant)
+FileKey = Tuple[str, str, str]
+# (size, mtime_ns, ctime_ns, inode)
+FileStat = Tuple[int, int, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (path, algorithm, variant)
+)
+"""
+
+
+class DigestCache(SQLiteCache):
+    """Persistent cache of file digests (shared across processes/runs).
+
+    :param file_name: sqlite database file (default: digest_cache.db in the Netmiko
+        directory).
+    """
+
+    table = "digests"
+    schema = _SCHEMA
+    default_file_name = "digest_cache.db"
+
+    def get(self, key: FileKey, stat: FileStat) -> Optional[str]:
+        """Return the cached digest (or None if the file has changed)."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, ctime_ns, inode, digest FROM digests "
+                "WHERE path = ? AND algorithm = ? AND variant = ?",
+                key,
+            ).fetchone()
+        if row is None or tuple(row[:4]) != stat:
+            return None
+        return str(row[4])
+
+    def set(self, key: FileKey, stat: FileStat, digest: str) -> None:
+        """Store the digest of the file."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                key + stat + (digest,),
+            )
+
+
+# FileKey => (FileStat, digest)
+_digests: Dict[FileKey, Tuple[FileStat, str]] = {}
+_lock = threading.Lock()
+# Per file locks so that concurrent transfers of the same file only hash it once
+_file_locks: Dict[FileKey, threading.Lock] = {}
+_disk_cache: Optional[DigestCache] = None
+
+
+def set_digest_cache(cache: Optional[DigestCache]) -> None:
+    """Also store the digests in cache (None disables the persistent cache)."""
+    global _disk_cache
+    _disk_cache = cache
+
+
+def clear_digests() -> None:
+    """Empty the in-memory digest cache."""
+    with _lock:
+        _digests.clear()
+
+
+def hash_file(file_name: str, algorithm: str = "md5") -> str:
+    """Return the hex digest of file_name (read in HASH_BLOCK_SIZE blocks)."""
+    file_hash = hashlib.new(algorithm)
+    buffer = bytearray(HASH_BLOCK_SIZE)
+    view = memoryview(buffer)
+    with open(file_name, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            file_hash.update(view[:size])
+    return file_hash.hexdigest()
+
+
+def file_digest(
+    file_name: str,
+    algorithm: str = "md5",
+    variant: str = "",
+    compute: Optional[Callable[[str], str]] = None,
+) -> str:
+    """Return the (cached) hex digest of file_name.
+
+    :param file_name: Local file to hash.
+
+    :param algorithm: hashlib algorithm name.
+
+    :param variant: Distinguishes digests computed in a different way (with compute).
+
+    :param compute: Function that returns the digest of the file (default: hash_file()).
+    """
+    path = os.path.realpath(file_name)
+    file_stat = os.stat(path)
+    stat = (
+        file_stat.st_size,
+        file_stat.st_mtime_ns,
+        file_stat.st_ctime_ns,
+        file_stat.st_ino,
+    )
+    key = (path, algorithm, variant)
+    with _lock:
+        entry = _digests.get(key)
+        if entry is not None and entry[0] == stat:
+            return entry[1]
+        file_lock = _file_locks.setdefault(key, threading.Lock())
+
+    try:
+        with file_lock:
+            # Another thread could have hashed the file in the meantime
+            with _lock:
+                entry = _digests.get(key)
+            if entry is not None and entry[0] == stat:
+                return entry[1]
+
+            disk_cache = _disk_cache
+            digest = disk_cache.get(key, stat) if disk_cache is not None else None
+            if digest is None:
+                if compute is None:
+                    digest = hash_file(path, algorithm=algorithm)
+                else:
+                    digest = compute(path)
+                if time.time() - file_stat.st_mtime_ns / 1e9 < RACY_INTERVAL:
+                    return digest
+                if disk_cache is not None:
+                    disk_cache.set(key, stat, digest)
+            with _lock:
+                _digests[key] = (stat, digest)
+            return digest
+    finally:
+        with _lock:
+            if _file_locks.get(key) is file_lock:
+                del _file_locks[key]
+
+
+def chunk_digests(
+    file_name: str, chunk_size: int = HASH_BLOCK_SIZE, algorithm: str = "md5"
+) -> List[str]:
+    """Return the (cached) hex digests of each chunk_size chunk of file_name.
+
+    Used to check the data already transferred when resuming a transfer.
+    """
+
+    def compute(path: str) -> str:
+        digests = []
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                digests.append(hashlib.new(algorithm, chunk).hexdigest())
+        return " ".join(digests)
+
+    digests = file_digest(
+        file_name, algorithm=algorithm, variant=f"chunks:{chunk_size}", compute=compute
+    )
+    return digests.split()
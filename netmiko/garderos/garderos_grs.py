@@ -224,6 +224,7 @@ class GarderosGrsSSH(CiscoSSHConnection):
         error_pattern: str = "",
         terminator: str = r"#",
         bypass_commands: Optional[str] = None,
+        window: int = 1,
     ) -> str:
 
         # The result of all commands will be collected to config_results
@@ -251,6 +252,7 @@ class GarderosGrsSSH(CiscoSSHConnection):
                 config_results += self.config_mode()
 
         # Send all commands to the router and verify their successful execution
+        # (one command at a time, window is ignored)
         for command in config_commands:
             # Verification is done in send_config_command()
             # Will raise error on execution failure
@@ -67,6 +67,7 @@ class HPComwareBase(CiscoSSHConnection):
         error_pattern: str = "",
         terminator: str = r"\]",
         bypass_commands: Optional[str] = None,
+        window: int = 1,
     ) -> str:
         return super().send_config_set(
             config_commands=config_commands,
@@ -82,6 +83,7 @@ class HPComwareBase(CiscoSSHConnection):
             error_pattern=error_pattern,
             terminator=terminator,
             bypass_commands=bypass_commands,
+            window=window,
         )
 
     def set_base_prompt(
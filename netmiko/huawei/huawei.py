@@ -14,6 +14,9 @@ class HuaweiBase(NoEnable, CiscoBaseConnection):
     prompt_pattern = r"[\]>]"
     password_change_prompt = r"(?:Change now|Please choose)"
     prompt_or_password_change = rf"(?:Change now|Please choose|{prompt_pattern})"
+    # Huawei does a strange thing where they add a space and then add ESC[1D
+    # to move the cursor to the left one. The extra space is problematic.
+    extra_ansi_escape_codes = (" " + chr(27) + r"\[\d+D",)
 
     def session_preparation(self) -> None:
         """Prepare the session after the connection has been established."""
@@ -25,20 +28,6 @@ class HuaweiBase(NoEnable, CiscoBaseConnection):
         time.sleep(0.3 * self.global_delay_factor)
         self.clear_buffer()
 
-    def strip_ansi_escape_codes(self, string_buffer: str) -> str:
-        """
-        Huawei does a strange thing where they add a space and then add ESC[1D
-        to move the cursor to the left one.
-
-        The extra space is problematic.
-        """
-        code_cursor_left = chr(27) + r"\[\d+D"
-        output = string_buffer
-        pattern = rf" {code_cursor_left}"
-        output = re.sub(pattern, "", output)
-
-        return super().strip_ansi_escape_codes(output)
-
     def config_mode(
         self,
         config_command: str = "system-view",
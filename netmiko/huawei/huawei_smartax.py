@@ -10,6 +10,9 @@ class HuaweiSmartAXSSH(CiscoBaseConnection):
     """Supports Huawei SmartAX and OLT."""
 
     prompt_pattern = r"[>$]"
+    # Huawei does a strange thing where they add a space and then add ESC[1D
+    # to move the cursor to the left one. The extra space is problematic.
+    extra_ansi_escape_codes = (" " + chr(27) + r"\[\d+D",)
 
     def session_preparation(self) -> None:
         """Prepare the session after the connection has been established."""
@@ -26,22 +29,6 @@ class HuaweiSmartAXSSH(CiscoBaseConnection):
         self._disable_infoswitch_cli()
         self.disable_paging()
 
-    def strip_ansi_escape_codes(self, string_buffer: str) -> str:
-        """
-        Huawei does a strange thing where they add a space and then add ESC[1D
-        to move the cursor to the left one.
-        The extra space is problematic.
-        """
-        code_cursor_left = chr(27) + r"\[\d+D"
-        output = string_buffer
-        pattern = rf" {code_cursor_left}"
-        output = re.sub(pattern, "", output)
-
-        log.debug("Stripping ANSI escape codes")
-        log.debug(f"new_output = {output}")
-        log.debug(f"repr = {repr(output)}")
-        return super().strip_ansi_escape_codes(output)
-
     def _enter_mmi_mode(self, command: str = "mmi-mode enable") -> None:
         """SmartAX enters a faster mode for machine to machine interactions."""
         priv_escalation_enable = False
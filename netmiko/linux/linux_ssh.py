@@ -15,6 +15,8 @@ LINUX_PROMPT_ROOT = os.getenv("NETMIKO_LINUX_PROMPT_ROOT", "#")
 
 
 class LinuxSSH(CiscoSSHConnection):
+    # The terminal echoes typeahead in the middle of the output of the running command
+    typeahead_safe = False
     prompt_pattern = rf"[{re.escape(LINUX_PROMPT_PRI)}{re.escape(LINUX_PROMPT_ALT)}]"
 
     def session_preparation(self) -> None:
@@ -181,6 +181,8 @@ class MikrotikRouterOsFileTransfer(BaseFileTransfer):
         progress: Optional[Callable[..., Any]] = None,
         progress4: Optional[Callable[..., Any]] = None,
         hash_supported: bool = False,
+        reuse_transport: bool = False,
+        resume: bool = False,
     ) -> None:
         super().__init__(
             ssh_conn=ssh_conn,
@@ -192,6 +194,8 @@ class MikrotikRouterOsFileTransfer(BaseFileTransfer):
             progress=progress,
             progress4=progress4,
             hash_supported=hash_supported,
+            reuse_transport=reuse_transport,
+            resume=resume,
         )
 
     def check_file_exists(self, remote_cmd: str = "") -> bool:
@@ -1,2 +1,4 @@
 MAX_BUFFER = 65535
 BACKSPACE_CHAR = "\x08"
+# Fallback delay (seconds) when a channel cannot block waiting for data
+POLL_DELAY = 0.01
@@ -287,6 +287,8 @@ class NokiaSrosFileTransfer(BaseFileTransfer):
         progress: Optional[Callable[..., Any]] = None,
         progress4: Optional[Callable[..., Any]] = None,
         hash_supported: bool = False,
+        reuse_transport: bool = False,
+        resume: bool = False,
     ) -> None:
         super().__init__(
             ssh_conn=ssh_conn,
@@ -298,6 +300,8 @@ class NokiaSrosFileTransfer(BaseFileTransfer):
             progress=progress,
             progress4=progress4,
             hash_supported=hash_supported,
+            reuse_transport=reuse_transport,
+            resume=resume,
         )
 
     def _file_list_command(self) -> str:
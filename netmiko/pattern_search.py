@@ -0,0 +1,105 @@
+"""
+Incremental regular-expression search over channel output that grows by appending.
+
+The read loops (send_command, read_until_pattern) check for their terminating pattern
+after every read. Re-running re.search() over the entire accumulated output is quadratic
+for very large outputs (i.e. 'show running-config' or 'show ip bgp'). PatternSearch only
+scans the newly arrived data plus an overlap window sized to the pattern (patterns of
+unbounded width are still searched over the entire output).
+"""
+
+from typing import Any, Optional, Pattern, Match
+import re
+
+try:
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:
+    # Python < 3.11
+    import sre_parse
+
+
+def _scan_width(subpattern: Any) -> int:
+    """Return the maximum width of the data a parsed pattern examines from the start of a
+    match, i.e. the match itself plus the text checked by lookaheads (which getwidth() counts
+    as zero width). Unbounded patterns return MAXREPEAT (or more)."""
+    repeats = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT}
+    if hasattr(sre_parse, "POSSESSIVE_REPEAT"):
+        repeats.add(sre_parse.POSSESSIVE_REPEAT)
+    unbounded = int(sre_parse.MAXREPEAT)
+    width = 0
+    for op, av in subpattern:
+        if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            direction, assertion = av
+            if direction > 0:
+                width += _scan_width(assertion)
+        elif op == sre_parse.BRANCH:
+            width += max(_scan_width(branch) for branch in av[1])
+        elif op == sre_parse.SUBPATTERN:
+            width += _scan_width(av[-1])
+        elif op in repeats:
+            _, max_repeat, item = av
+            if max_repeat >= unbounded:
+                return unbounded
+            width += max_repeat * _scan_width(item)
+        elif op == getattr(sre_parse, "ATOMIC_GROUP", None):
+            width += _scan_width(av)
+        elif op == sre_parse.GROUPREF_EXISTS:
+            _, yes, no = av
+            width += max(_scan_width(yes), _scan_width(no) if no else 0)
+        else:
+            width += sre_parse.SubPattern(subpattern.state, [(op, av)]).getwidth()[1]
+        if width >= unbounded:
+            return unbounded
+    return width
+
+
+def max_match_width(regex: Pattern[str]) -> Optional[int]:
+    """Return the maximum width of a match for a compiled regex (including the text examined
+    by lookaheads, i.e. the data that has to be rescanned when more data arrives).
+
+    Returns None for patterns with unbounded width (i.e. '.*', '[^#]+' or a lookahead such as
+    '(?=\\s+bar)') or that can't be analyzed; these have to be searched over the entire
+    output.
+    """
+    try:
+        max_width = _scan_width(sre_parse.parse(regex.pattern, regex.flags))
+    except Exception:
+        return None
+    if max_width >= sre_parse.MAXREPEAT:
+        return None
+    return int(max_width)
+
+
+class PatternSearch:
+    """Search for a pattern in output that is only ever appended to.
+
+    Every call to search() scans starting at the end of the previously searched data
+    minus the overlap window (the maximum width of a pattern match). The search uses
+    the 'pos' argument (instead of slicing) so '^', lookbehinds, and other context
+    dependent constructs behave the same as a search over the entire string.
+
+    Patterns with unbounded width (i.e. '.*' or '[^#]+') can match any amount of data that
+    was already searched, so they are always searched over the entire output.
+    """
+
+    def __init__(self, pattern: str, re_flags: int = 0) -> None:
+        self.regex = re.compile(pattern, flags=re_flags)
+        self.overlap = max_match_width(self.regex)
+        self.searched = 0
+
+    def search(self, output: str) -> Optional[Match[str]]:
+        """Search output for pattern (only looking at data not previously searched)."""
+        length = len(output)
+        if length < self.searched:
+            # Output was modified (not appended to) so search everything
+            self.searched = 0
+        if self.overlap is None:
+            start = 0
+        else:
+            start = max(self.searched - self.overlap, 0)
+        self.searched = length
+        return self.regex.search(output, start)
+
+    def reset(self) -> None:
+        """Search the entire output on the next call (i.e. output has been modified)."""
+        self.searched = 0
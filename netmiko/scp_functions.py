@@ -6,15 +6,25 @@ Supports file get and file put operations.
 SCP requires a separate SSH connection for a control channel.
 """
 
-from typing import AnyStr, Optional, Callable, Any, Dict
+from typing import AnyStr, Optional, Callable, Any, Dict, List, Sequence, Union
 from typing import TYPE_CHECKING
-from netmiko.scp_handler import BaseFileTransfer
-from netmiko.ssh_dispatcher import FileTransfer
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+import time
+
+from paramiko import SSHException
+
+from netmiko.exceptions import NetmikoAuthenticationException, ReadTimeout
+from netmiko.scp_handler import BaseFileTransfer, transfer_session
+from netmiko.ssh_dispatcher import ConnectHandler, FileTransfer
 from netmiko.cisco.cisco_ios import InLineTransfer
 
 if TYPE_CHECKING:
     from netmiko.base_connection import BaseConnection
 
+MD5_FAILURE = "MD5 failure between source and destination files"
+
 
 def progress_bar(
     filename: AnyStr, size: int, sent: int, peername: Optional[str] = None
@@ -64,11 +74,20 @@ def file_transfer(
     progress: Optional[Callable[..., Any]] = None,
     progress4: Optional[Callable[..., Any]] = None,
     verify_file: Optional[bool] = None,
+    reuse_transport: bool = False,
+    resume: bool = False,
 ) -> Dict[str, bool]:
     """Use Secure Copy or Inline (IOS-only) to transfer files to/from network devices.
 
     inline_transfer ONLY SUPPORTS TEXT FILES and will not support binary file transfers.
 
+    reuse_transport=True runs SCP over the SSH connection of ssh_conn (no second login) when
+    the device allows it (see SCPConn).
+
+    resume=True (put only) transfers the file using SFTP when the device supports it and
+    completes a partial copy of the file left by an interrupted transfer (instead of starting
+    over); the partial copy isn't verified (MD5) before the transfer.
+
     return {
         'file_exists': boolean,
         'file_transferred': boolean,
@@ -119,9 +138,17 @@ def file_transfer(
         TransferClass = InLineTransfer
     else:
         TransferClass = FileTransfer
+        scp_args["reuse_transport"] = reuse_transport
+        scp_args["resume"] = resume
 
-    with TransferClass(**scp_args) as scp_transfer:
-        if scp_transfer.check_file_exists():
+    # The directory listings and MD5s are only retrieved once (see transfer_session())
+    with transfer_session(ssh_conn), TransferClass(**scp_args) as scp_transfer:
+        file_exists = scp_transfer.check_file_exists()
+        if file_exists and resume and overwrite_file and direction == "put":
+            # Partial copy of the file (interrupted transfer): complete it
+            if scp_transfer.remote_file_size() < scp_transfer.file_size:
+                file_exists = False
+        if file_exists:
             if overwrite_file:
                 if verify_file:
                     if scp_transfer.verify_file():
@@ -132,9 +159,7 @@ def file_transfer(
                         if scp_transfer.verify_file():
                             return transferred_and_verified
                         else:
-                            raise ValueError(
-                                "MD5 failure between source and destination files"
-                            )
+                            raise ValueError(MD5_FAILURE)
                 else:
                     # File exists, you can overwrite it, but MD5 not allowed (transfer file)
                     verifyspace_and_transferfile(scp_transfer)
@@ -153,6 +178,204 @@ def file_transfer(
                 if scp_transfer.verify_file():
                     return transferred_and_verified
                 else:
-                    raise ValueError("MD5 failure between source and destination files")
+                    raise ValueError(MD5_FAILURE)
             else:
                 return transferred_and_notverified
+
+
+class BandwidthLimiter:
+    """Token bucket limiting the transfer rate (bytes per second) of the transfers sharing it.
+
+    :param rate: Maximum rate in bytes per second.
+
+    :param burst: Bytes that can be sent at once after being idle (default: rate / 10).
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = rate / 10 if burst is None else burst
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int) -> None:
+        """Account for amount bytes sent (sleeps if the rate has been exceeded)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            # Reserve the bytes (the balance can go negative) so concurrent callers queue up
+            self._tokens -= amount
+            delay = -self._tokens / self.rate
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _limited_progress(
+    limiters: Sequence[BandwidthLimiter],
+    progress: Optional[Callable[..., Any]] = None,
+    progress4: Optional[Callable[..., Any]] = None,
+) -> Callable[..., None]:
+    """Return an SCP progress4 callback that applies limiters (the SCP client calls it after
+    sending each block) and then calls the user's progress/progress4 callback.
+
+    The first call for a file (before any data is sent) sets the starting point (i.e. the
+    offset of a resumed transfer).
+    """
+    sent_so_far: Dict[Any, int] = {}
+
+    def limited_progress(
+        filename: AnyStr, size: int, sent: int, peername: Optional[str] = None
+    ) -> None:
+        delta = sent - sent_so_far.get(filename, sent)
+        sent_so_far[filename] = sent
+        if delta > 0:
+            for limiter in limiters:
+                limiter.consume(delta)
+        if progress4 is not None:
+            progress4(filename, size, sent, peername)
+        elif progress is not None:
+            progress(filename, size, sent)
+
+    return limited_progress
+
+
+@dataclass
+class FileTransferResult:
+    """Result of the file transfer to/from one device (see file_transfer_many())."""
+
+    host: str
+    file_exists: bool = False
+    file_transferred: bool = False
+    file_verified: bool = False
+    attempts: int = 0
+    elapsed: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _transient_error(error: Exception) -> bool:
+    """Return True for the failures file_transfer_many() retries (connection lost or timed
+    out, MD5 mismatch after the transfer); i.e. not a failed login, missing space, a local
+    file that can't be read or a file that already exists."""
+    if isinstance(error, NetmikoAuthenticationException):
+        return False
+    if isinstance(error, ValueError):
+        return str(error) == MD5_FAILURE
+    if isinstance(error, (FileNotFoundError, PermissionError, IsADirectoryError)):
+        return False
+    # Socket errors are OSErrors (i.e. paramiko's "Socket is closed")
+    return isinstance(error, (SSHException, ReadTimeout, OSError, EOFError))
+
+
+def file_transfer_many(
+    devices: Sequence[Union[Dict[str, Any], "BaseConnection"]],
+    source_file: str,
+    dest_file: str,
+    max_workers: int = 8,
+    retries: int = 2,
+    retry_delay: float = 10.0,
+    device_bandwidth: Optional[float] = None,
+    total_bandwidth: Optional[float] = None,
+    connection_factory: Callable[..., "BaseConnection"] = ConnectHandler,
+    **kwargs: Any,
+) -> List[FileTransferResult]:
+    """Transfer a file (i.e. stage an image) to/from many devices in parallel using
+    file_transfer().
+
+    Devices where the file already exists and its MD5 matches aren't transferred again (see
+    file_transfer()). The local MD5 is computed once for all of the devices.
+
+    Transfers that fail on a transient error (connection lost, timeout, MD5 mismatch) are
+    retried; devices given as ConnectHandler() arguments are reconnected for each attempt,
+    connected sessions are used as-is. Other failures (i.e. authentication, insufficient
+    space, the file already exists) aren't retried. A device that fails is reported with the
+    last exception (the other devices aren't affected).
+
+    :param devices: ConnectHandler() arguments of each device (a connection is opened and
+        closed for each attempt) or connected sessions (used as-is and left connected).
+
+    :param source_file: Local (put) or remote (get) file.
+
+    :param dest_file: Remote (put) or local (get) file.
+
+    :param max_workers: Maximum number of concurrent transfers.
+
+    :param retries: Number of times a transfer that failed on a transient error is retried.
+
+    :param retry_delay: Seconds to wait before retrying (doubled after each retry).
+
+    :param device_bandwidth: Maximum transfer rate to each device (bytes per second).
+
+    :param total_bandwidth: Maximum transfer rate of all of the transfers combined (bytes per
+        second).
+
+    :param connection_factory: Callable used to connect to the devices (default:
+        ConnectHandler).
+
+    :param kwargs: Other file_transfer() arguments (i.e. file_system, overwrite_file).
+
+    Returns a FileTransferResult for each device (in the same order as devices).
+    """
+    progress = kwargs.pop("progress", None)
+    progress4 = kwargs.pop("progress4", None)
+    total_limiter = BandwidthLimiter(total_bandwidth) if total_bandwidth else None
+
+    def transfer(device: Union[Dict[str, Any], "BaseConnection"]) -> FileTransferResult:
+        if isinstance(device, dict):
+            host = str(device.get("host") or device.get("ip", ""))
+        else:
+            host = device.host
+        result = FileTransferResult(host=host)
+        limiters = [BandwidthLimiter(device_bandwidth)] if device_bandwidth else []
+        if total_limiter is not None:
+            limiters.append(total_limiter)
+        transfer_kwargs = dict(kwargs)
+        transfer_kwargs["progress"] = progress
+        transfer_kwargs["progress4"] = progress4
+
+        start = time.monotonic()
+        delay = retry_delay
+        for attempt in range(1, retries + 2):
+            result.attempts = attempt
+            if limiters:
+                # A new callback for each attempt (the transfer restarts or resumes)
+                transfer_kwargs["progress"] = None
+                transfer_kwargs["progress4"] = _limited_progress(
+                    limiters, progress=progress, progress4=progress4
+                )
+            try:
+                if isinstance(device, dict):
+                    with connection_factory(**device) as ssh_conn:
+                        transfer_result = file_transfer(
+                            ssh_conn, source_file, dest_file, **transfer_kwargs
+                        )
+                else:
+                    transfer_result = file_transfer(
+                        device, source_file, dest_file, **transfer_kwargs
+                    )
+            except Exception as e:
+                result.error = e
+                if not _transient_error(e):
+                    break
+                if attempt <= retries:
+                    time.sleep(delay)
+                    delay *= 2
+                continue
+            result.file_exists = transfer_result["file_exists"]
+            result.file_transferred = transfer_result["file_transferred"]
+            result.file_verified = transfer_result["file_verified"]
+            result.error = None
+            break
+        result.elapsed = time.monotonic() - start
+        return result
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(transfer, devices))
@@ -3,28 +3,173 @@ Netmiko SCP operations.
 
 Supports file get and file put operations.
 
-SCP requires a separate SSH connection for a control channel.
+SCP uses either a separate SSH connection or (reuse_transport=True) an additional channel on
+the SSH connection used for the control channel.
 """
 
-from typing import Callable, Optional, Any, Type
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple, Type
 from typing import TYPE_CHECKING
 from types import TracebackType
+from contextlib import contextmanager
+import hashlib
 import re
 import os
-import hashlib
+import sqlite3
+import threading
+import time
 
+import paramiko
 import scp
 import sys
 
+from netmiko import log
+from netmiko.file_digest import chunk_digests, file_digest
+from netmiko.sqlite_cache import SQLiteCache
+
 if TYPE_CHECKING:
     from netmiko.base_connection import BaseConnection
 
+# Resumable transfers continue from the end of the last complete chunk of this size
+RESUME_CHUNK_SIZE = 1024 * 1024
+
+_RESUME_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resume (
+    host TEXT NOT NULL,
+    port INTEGER NOT NULL,
+    destination TEXT NOT NULL,
+    chunk_size INTEGER NOT NULL,
+    digests TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (host, port, destination)
+)
+"""
+
+# Line of a 'dir' listing: 26  -rw-   6738  Jul 30 2016 19:49:50 -07:00  filename
+DIR_LINE_PATTERN = r"^\s*\d+\s+[-\w]+\s+(\d+)\s+.*\s(\S+)\s*$"
+
+
+class RemoteFileCache:
+    """Directory listings and file digests of a remote device (see transfer_session())."""
+
+    def __init__(self) -> None:
+        # file_system => {command: output}
+        self.listings: Dict[str, Dict[str, str]] = {}
+        # (file_system, file_name) => digest
+        self.digests: Dict[Tuple[str, str], str] = {}
+        self.sessions = 0
+
+    def invalidate(self, file_system: str, file_name: Optional[str] = None) -> None:
+        """Forget the listings of file_system and the digest of file_name (or of all of the
+        files on file_system); i.e. after a file has been written or deleted."""
+        self.listings.pop(file_system, None)
+        for key in list(self.digests):
+            if key[0] == file_system and file_name in (None, key[1]):
+                del self.digests[key]
+
+    def clear(self) -> None:
+        self.listings.clear()
+        self.digests.clear()
+
+
+_remote_file_caches: Dict["BaseConnection", RemoteFileCache] = {}
+_remote_file_caches_lock = threading.Lock()
+
+
+@contextmanager
+def transfer_session(ssh_conn: "BaseConnection") -> Iterator[RemoteFileCache]:
+    """Cache the remote directory listings and MD5 digests used by the file transfers on
+    ssh_conn until the end of the (outermost) session.
+
+    A multi-file transfer then issues one 'dir' per file system and doesn't compute the MD5 of
+    an unchanged remote file again. Netmiko invalidates the cache entries of the files it
+    transfers; call invalidate() on the yielded cache after changing files on the device
+    in another way (i.e. deleting a file).
+
+        with transfer_session(ssh_conn):
+            for image in images:
+                file_transfer(ssh_conn, source_file=image, dest_file=image)
+    """
+    with _remote_file_caches_lock:
+        cache = _remote_file_caches.setdefault(ssh_conn, RemoteFileCache())
+        cache.sessions += 1
+    try:
+        yield cache
+    finally:
+        with _remote_file_caches_lock:
+            cache.sessions -= 1
+            if cache.sessions == 0:
+                del _remote_file_caches[ssh_conn]
+
+
+def remote_file_cache(ssh_conn: "BaseConnection") -> Optional[RemoteFileCache]:
+    """Return the cache of the transfer session on ssh_conn (None if there is no session)."""
+    return _remote_file_caches.get(ssh_conn)
+
+
+class ResumeJournal(SQLiteCache):
+    """Local record of the transfers started with resume=True (the sidecar of the remote
+    partial files).
+
+    Before the data is written, the digests of every RESUME_CHUNK_SIZE chunk of the source
+    file are stored for the destination (host, port, and remote path); the entry is removed
+    once the file has been written entirely. A partial remote file is only resumed after the
+    chunks recorded for it that still match the local file.
+
+    :param file_name: sqlite database file (default: resume_journal.db in the Netmiko
+        directory).
+    """
+
+    table = "resume"
+    schema = _RESUME_SCHEMA
+    default_file_name = "resume_journal.db"
+
+    def get(
+        self, host: str, port: int, destination: str
+    ) -> Optional[Tuple[int, List[str]]]:
+        """Return the chunk size and the chunk digests recorded for destination (or None)."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT chunk_size, digests FROM resume "
+                "WHERE host = ? AND port = ? AND destination = ?",
+                (host, port, destination),
+            ).fetchone()
+        if row is None:
+            return None
+        return int(row[0]), str(row[1]).split()
+
+    def set(
+        self,
+        host: str,
+        port: int,
+        destination: str,
+        chunk_size: int,
+        digests: List[str],
+    ) -> None:
+        """Record the chunk digests of the file that is written to destination."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO resume VALUES (?, ?, ?, ?, ?, ?)",
+                (host, port, destination, chunk_size, " ".join(digests), time.time()),
+            )
+
+    def remove(self, host: str, port: int, destination: str) -> None:
+        """Remove the entry of destination (the file was transferred entirely)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM resume WHERE host = ? AND port = ? AND destination = ?",
+                (host, port, destination),
+            )
+
 
 class SCPConn(object):
     """
     Establish a secure copy channel to the remote network device.
 
     Must close the SCP connection to get the file to write to the remote filesystem
+
+    :param reuse_transport: Open the SCP channel on the SSH transport of ssh_conn instead of
+        logging in again (falls back to a separate SSH connection if the device doesn't allow
+        an additional channel). time_saved is then the estimated time saved.
     """
 
     def __init__(
@@ -33,24 +178,76 @@ class SCPConn(object):
         socket_timeout: float = 10.0,
         progress: Optional[Callable[..., Any]] = None,
         progress4: Optional[Callable[..., Any]] = None,
+        reuse_transport: bool = False,
     ) -> None:
         self.ssh_ctl_chan = ssh_conn
         self.socket_timeout = socket_timeout
         self.progress = progress
         self.progress4 = progress4
+        self.reuse_transport = reuse_transport
+        self.transport_reused = False
+        self.time_saved = 0.0
         self.establish_scp_conn()
 
+    def _shared_transport(self) -> Optional[paramiko.Transport]:
+        """Return the transport of the control connection if another channel can be opened."""
+        parent = self.ssh_ctl_chan._shell_parent or self.ssh_ctl_chan
+        remote_conn_pre = getattr(parent, "remote_conn_pre", None)
+        if parent.protocol != "ssh" or remote_conn_pre is None:
+            return None
+        # The SCP channel counts against the same limit as the shells
+        if len(parent._shells) + 2 > parent.max_shell_channels:
+            return None
+        transport = remote_conn_pre.get_transport()
+        if transport is None or not transport.is_active():
+            return None
+        return transport
+
     def establish_scp_conn(self) -> None:
         """Establish the secure copy connection."""
-        ssh_connect_params = self.ssh_ctl_chan._connect_params_dict()
-        self.scp_conn = self.ssh_ctl_chan._build_ssh_client()
-        self.scp_conn.connect(**ssh_connect_params)
+        start = time.monotonic()
+        self.scp_conn: Optional[paramiko.SSHClient] = None
+        transport = self._shared_transport() if self.reuse_transport else None
+        channel = None
+        if transport is not None:
+            try:
+                channel = transport.open_session()
+            except paramiko.SSHException as e:
+                log.debug(f"Unable to open SCP channel on the existing transport: {e}")
+                transport = None
+        if transport is None:
+            ssh_connect_params = self.ssh_ctl_chan._connect_params_dict()
+            self.scp_conn = self.ssh_ctl_chan._build_ssh_client()
+            self.scp_conn.connect(**ssh_connect_params)
+            transport = self.scp_conn.get_transport()
         self.scp_client = scp.SCPClient(
-            self.scp_conn.get_transport(),
+            transport,
             socket_timeout=self.socket_timeout,
             progress=self.progress,
             progress4=self.progress4,
         )
+        if channel is not None:
+            # SCPClient uses (and then closes) this channel for the first get/put
+            self.scp_client.channel = channel
+            self.transport_reused = True
+            connect_time = self.ssh_ctl_chan.ssh_connect_time or 0.0
+            self.time_saved = max(connect_time - (time.monotonic() - start), 0.0)
+            log.info(
+                f"SCP to {self.ssh_ctl_chan.host} is using the existing SSH transport "
+                f"(saved {self.time_saved:.2f}s)"
+            )
+
+    def open_sftp(self) -> paramiko.SFTPClient:
+        """Open an SFTP session over the SCP connection (raises SSHException if the device
+        doesn't support SFTP)."""
+        channel = self.scp_client.channel
+        self.scp_client.channel = None
+        if channel is None or channel.closed:
+            channel = self.scp_client.transport.open_session()
+        channel.settimeout(self.socket_timeout)
+        channel.invoke_subsystem("sftp")
+        sftp = paramiko.SFTPClient(channel)
+        return sftp
 
     def scp_transfer_file(self, source_file: str, dest_file: str) -> None:
         """Put file using SCP (for backwards compatibility)."""
@@ -66,7 +263,13 @@ class SCPConn(object):
 
     def close(self) -> None:
         """Close the SCP connection."""
-        self.scp_conn.close()
+        if self.scp_conn is None:
+            # Only close the SCP channel; the transport belongs to the control connection
+            if self.scp_client.channel is not None:
+                self.scp_client.channel.close()
+                self.scp_client.channel = None
+        else:
+            self.scp_conn.close()
 
 
 class BaseFileTransfer(object):
@@ -83,6 +286,9 @@ class BaseFileTransfer(object):
         progress: Optional[Callable[..., Any]] = None,
         progress4: Optional[Callable[..., Any]] = None,
         hash_supported: bool = True,
+        reuse_transport: bool = False,
+        resume: bool = False,
+        resume_journal: Optional[ResumeJournal] = None,
     ) -> None:
         self.ssh_ctl_chan = ssh_conn
         self.source_file = source_file
@@ -91,6 +297,12 @@ class BaseFileTransfer(object):
         self.socket_timeout = socket_timeout
         self.progress = progress
         self.progress4 = progress4
+        self.reuse_transport = reuse_transport
+        self.resume = resume
+        # Default: ResumeJournal() in the Netmiko directory
+        self.resume_journal = resume_journal
+        # Time saved by reusing the SSH transport for the SCP connections (see SCPConn)
+        self.scp_time_saved = 0.0
 
         auto_flag = (
             "cisco_ios" in ssh_conn.device_type
@@ -110,7 +322,9 @@ class BaseFileTransfer(object):
             self.file_size = os.stat(source_file).st_size
         elif direction == "get":
             self.source_md5 = (
-                self.remote_md5(remote_file=source_file) if hash_supported else None
+                self._cached_remote_md5(remote_file=source_file)
+                if hash_supported
+                else None
             )
             self.file_size = self.remote_file_size(remote_file=source_file)
         else:
@@ -137,7 +351,9 @@ class BaseFileTransfer(object):
             socket_timeout=self.socket_timeout,
             progress=self.progress,
             progress4=self.progress4,
+            reuse_transport=self.reuse_transport,
         )
+        self.scp_time_saved += self.scp_conn.time_saved
 
     def close_scp_chan(self) -> None:
         """Close the SCP connection to the remote network device."""
@@ -147,7 +363,7 @@ class BaseFileTransfer(object):
     def remote_space_available(self, search_pattern: str = r"(\d+) \w+ free") -> int:
         """Return space available on remote device."""
         remote_cmd = f"dir {self.file_system}"
-        remote_output = self.ssh_ctl_chan._send_command_str(remote_cmd)
+        remote_output = self._listing(remote_cmd)
         match = re.search(search_pattern, remote_output)
         if match:
             if "kbytes" in match.group(0) or "Kbytes" in match.group(0):
@@ -224,8 +440,11 @@ class BaseFileTransfer(object):
         """Check if the dest_file already exists on the file system (return boolean)."""
         if self.direction == "put":
             if not remote_cmd:
+                file_size = self._listed_file_size(self.dest_file)
+                if file_size is not None:
+                    return file_size >= 0
                 remote_cmd = f"dir {self.file_system}/{self.dest_file}"
-            remote_out = self.ssh_ctl_chan._send_command_str(remote_cmd)
+            remote_out = self._listing(remote_cmd)
             search_string = r"Directory of .*{0}".format(self.dest_file)
             if (
                 "Error opening" in remote_out
@@ -271,8 +490,14 @@ class BaseFileTransfer(object):
             elif self.direction == "get":
                 remote_file = self.source_file
         if not remote_cmd:
+            assert isinstance(remote_file, str)
+            listed_size = self._listed_file_size(remote_file)
+            if listed_size is not None:
+                if listed_size < 0:
+                    raise IOError("Unable to find file on remote system")
+                return listed_size
             remote_cmd = f"dir {self.file_system}/{remote_file}"
-        remote_out = self.ssh_ctl_chan._send_command_str(remote_cmd)
+        remote_out = self._listing(remote_cmd)
         # Strip out "Directory of flash:/filename line
         remote_out_lines = re.split(r"Directory of .*", remote_out)
         remote_out = "".join(remote_out_lines)
@@ -338,21 +563,16 @@ class BaseFileTransfer(object):
         add_newline is needed to support Cisco IOS MD5 calculation which expects the newline in
         the string
 
+        The digest is cached (see netmiko.file_digest) so a file transferred to many devices is
+        only hashed once.
+
         Args:
           file_name: name of file to get md5 digest of
-          add_newline: add newline to end of file contents or not
+          add_newline: add newline to end of file contents or not (note, this has never been
+            applied to the digest; retained for backwards compatibility)
 
         """
-        file_hash = hashlib.md5()
-        with open(file_name, "rb") as f:
-            while True:
-                file_contents = f.read(512)
-                if not file_contents:
-                    if add_newline:
-                        file_contents + b"\n"
-                    break
-                file_hash.update(file_contents)
-        return file_hash.hexdigest()
+        return file_digest(file_name, algorithm="md5")
 
     @staticmethod
     def process_md5(md5_output: str, pattern: str = r"=\s+(\S+)") -> str:
@@ -372,7 +592,7 @@ class BaseFileTransfer(object):
     def compare_md5(self) -> bool:
         """Compare md5 of file on network device to md5 of local file."""
         if self.direction == "put":
-            remote_md5 = self.remote_md5()
+            remote_md5 = self._cached_remote_md5()
             return self.source_md5 == remote_md5
         elif self.direction == "get":
             local_md5 = self.file_md5(self.dest_file)
@@ -397,10 +617,59 @@ class BaseFileTransfer(object):
         dest_md5 = self.process_md5(dest_md5)
         return dest_md5
 
+    def _cached_remote_md5(self, remote_file: Optional[str] = None) -> str:
+        """remote_md5() (cached during a transfer session)."""
+        cache = remote_file_cache(self.ssh_ctl_chan)
+        key = (self.file_system, self.dest_file if remote_file is None else remote_file)
+        digest = cache.digests.get(key) if cache is not None else None
+        if digest is None:
+            if remote_file is None:
+                digest = self.remote_md5()
+            else:
+                digest = self.remote_md5(remote_file=remote_file)
+            if cache is not None:
+                cache.digests[key] = digest
+        return digest
+
+    def _listing(self, remote_cmd: str) -> str:
+        """Output of a directory listing command (cached during a transfer session)."""
+        cache = remote_file_cache(self.ssh_ctl_chan)
+        if cache is None:
+            return self.ssh_ctl_chan._send_command_str(remote_cmd)
+        listings = cache.listings.setdefault(self.file_system, {})
+        output = listings.get(remote_cmd)
+        if output is None:
+            output = listings[remote_cmd] = self.ssh_ctl_chan._send_command_str(
+                remote_cmd
+            )
+        return output
+
+    def _listed_file_size(self, file_name: str) -> Optional[int]:
+        """Size of file_name according to the (cached) listing of the file system, -1 if the
+        file isn't listed; None outside of a transfer session or if the listing can't be
+        used (subdirectories, unexpected format)."""
+        if remote_file_cache(self.ssh_ctl_chan) is None or "/" in file_name:
+            return None
+        remote_out = self._listing(f"dir {self.file_system}")
+        if not re.search(r"Directory of ", remote_out):
+            return None
+        for match in re.finditer(DIR_LINE_PATTERN, remote_out, flags=re.M):
+            if match.group(2) == file_name:
+                return int(match.group(1))
+        if file_name in remote_out:
+            # Listed in an unexpected format
+            return None
+        return -1
+
     def transfer_file(self) -> None:
         """SCP transfer file."""
         if self.direction == "put":
-            self.put_file()
+            cache = remote_file_cache(self.ssh_ctl_chan)
+            try:
+                self.put_file()
+            finally:
+                if cache is not None:
+                    cache.invalidate(self.file_system, self.dest_file)
         elif self.direction == "get":
             self.get_file()
         else:
@@ -413,12 +682,137 @@ class BaseFileTransfer(object):
         self.scp_conn.close()
 
     def put_file(self) -> None:
-        """SCP copy the file from the local system to the remote device."""
+        """SCP copy the file from the local system to the remote device.
+
+        With resume=True the file is copied using SFTP (if the device supports it) and a
+        partial copy of the file on the remote device is completed instead of starting over.
+        """
         destination = f"{self.file_system}/{self.dest_file}"
+        if self.resume:
+            try:
+                sftp = self.scp_conn.open_sftp()
+            except paramiko.SSHException as e:
+                log.debug(f"SFTP not available, unable to resume transfers: {e}")
+            else:
+                try:
+                    self._sftp_put_file(sftp, destination)
+                finally:
+                    sftp.close()
+                self.scp_conn.close()
+                return
         self.scp_conn.scp_transfer_file(self.source_file, destination)
         # Must close the SCP connection to get the file written (flush)
         self.scp_conn.close()
 
+    def _journal(self) -> Optional[ResumeJournal]:
+        if self.resume_journal is None:
+            try:
+                self.resume_journal = ResumeJournal()
+            except ValueError as e:
+                log.debug(f"Unable to record the transfer, resume isn't possible: {e}")
+        return self.resume_journal
+
+    def resume_offset(self, sftp: paramiko.SFTPClient, destination: str) -> int:
+        """Return the offset the transfer of a partial remote file can resume from.
+
+        Only a partial file written by an earlier transfer (see ResumeJournal) is resumed:
+        the offset is the end of the complete chunks (RESUME_CHUNK_SIZE) of the remote file
+        whose recorded digests match the chunks of the local file. The last of these chunks
+        is also read back and compared (i.e. the remote file was replaced since). Returns 0
+        (transfer the entire file) if there is no such partial file.
+        """
+        journal = self._journal()
+        if journal is None:
+            return 0
+        try:
+            remote_size = self.remote_file_size()
+        except (IOError, ValueError):
+            return 0
+        chunks = remote_size // RESUME_CHUNK_SIZE
+        if remote_size >= self.file_size or chunks == 0:
+            return 0
+        host, port = self.ssh_ctl_chan.host, self.ssh_ctl_chan.port
+        try:
+            entry = journal.get(host, port, destination)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            log.debug(f"Unable to read the resume journal: {e}")
+            return 0
+        if entry is None or entry[0] != RESUME_CHUNK_SIZE:
+            log.debug(f"Partial file {destination} wasn't written by netmiko")
+            return 0
+        recorded = entry[1]
+        digests = chunk_digests(self.source_file, chunk_size=RESUME_CHUNK_SIZE)
+        matching = 0
+        for recorded_digest, digest in zip(recorded[:chunks], digests):
+            if recorded_digest != digest:
+                break
+            matching += 1
+        if matching == 0:
+            log.debug(
+                f"Partial file {destination} doesn't match, transferring all of it"
+            )
+            return 0
+        offset = matching * RESUME_CHUNK_SIZE
+        with sftp.open(destination, "rb") as remote_file:
+            # readv() pipelines the read requests
+            remote_chunk = b"".join(
+                remote_file.readv([(offset - RESUME_CHUNK_SIZE, RESUME_CHUNK_SIZE)])
+            )
+        if hashlib.md5(remote_chunk).hexdigest() != digests[matching - 1]:
+            log.debug(
+                f"Partial file {destination} doesn't match, transferring all of it"
+            )
+            return 0
+        return offset
+
+    def _sftp_put_file(self, sftp: paramiko.SFTPClient, destination: str) -> None:
+        """SFTP copy the file to the remote device (resuming a partial transfer)."""
+        offset = self.resume_offset(sftp, destination)
+        if offset:
+            log.info(
+                f"Resuming transfer of {self.source_file} to {self.ssh_ctl_chan.host} "
+                f"at {offset} of {self.file_size} bytes"
+            )
+        file_name = os.path.basename(self.source_file)
+        peername = self.scp_conn.scp_client.peername
+        journal = self._journal()
+        host, port = self.ssh_ctl_chan.host, self.ssh_ctl_chan.port
+        if journal is not None:
+            digests = chunk_digests(self.source_file, chunk_size=RESUME_CHUNK_SIZE)
+            try:
+                journal.set(host, port, destination, RESUME_CHUNK_SIZE, digests)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                log.debug(f"Unable to record the transfer, resume isn't possible: {e}")
+                journal = None
+
+        def progress(sent: int) -> None:
+            # Same arguments as the SCP client's progress callbacks
+            if self.progress4 is not None:
+                self.progress4(file_name, self.file_size, sent, peername)
+            elif self.progress is not None:
+                self.progress(file_name, self.file_size, sent)
+
+        with open(self.source_file, "rb") as f, sftp.open(
+            destination, "r+b" if offset else "wb"
+        ) as remote_file:
+            remote_file.set_pipelined(True)
+            f.seek(offset)
+            remote_file.seek(offset)
+            sent = offset
+            progress(sent)
+            while True:
+                chunk = f.read(RESUME_CHUNK_SIZE)
+                if not chunk:
+                    break
+                remote_file.write(chunk)
+                sent += len(chunk)
+                progress(sent)
+        if journal is not None:
+            try:
+                journal.remove(host, port, destination)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                log.debug(f"Unable to update the resume journal: {e}")
+
     def verify_file(self) -> bool:
         """Verify the file has been transferred correctly."""
         return self.compare_md5()
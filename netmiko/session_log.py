@@ -1,6 +1,192 @@
+import gzip
 import io
+import os
+import re
+import threading
+import time
+from collections import deque
+from netmiko import log
 from netmiko.utilities import write_bytes
-from typing import Dict, Any, Union, Optional, TextIO
+from typing import (
+    Dict,
+    Any,
+    Union,
+    Optional,
+    TextIO,
+    Tuple,
+    Pattern,
+    Deque,
+    List,
+    IO,
+    cast,
+)
+
+try:
+    import zstandard
+
+    ZSTD_INSTALLED = True
+except ImportError:
+    ZSTD_INSTALLED = False
+
+NO_LOG_REPLACEMENT = "********"
+
+# Compression used for session_log files based on the file name suffix
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _zstd_required() -> None:
+    if not ZSTD_INSTALLED:
+        msg = "zstandard not installed; please install it: 'pip install zstandard'"
+        raise ModuleNotFoundError(msg)
+
+
+def _open_log_file(
+    file_name: str, mode: str, compression: Optional[str], encoding: str
+) -> TextIO:
+    """Open a session_log file for writing (mode is "w" or "a") as a text stream."""
+    if compression is None:
+        return cast(TextIO, open(file_name, mode=mode, encoding=encoding))
+    elif compression == "gzip":
+        return cast(TextIO, gzip.open(file_name, mode=f"{mode}t", encoding=encoding))
+    elif compression == "zstd":
+        _zstd_required()
+        # Each append adds a new zstd frame (the reader reads across frames)
+        return cast(
+            TextIO, zstandard.open(file_name, mode=f"{mode}t", encoding=encoding)
+        )
+    raise ValueError(f"Unsupported session_log compression: {compression}")
+
+
+class SessionLogWriter:
+    """
+    Background thread that writes the data of many SessionLog objects to their files.
+
+    SessionLog.write()/flush() only queue the (already redacted) data; the writer thread
+    writes it out in batches and flushes the files every flush_interval seconds (or once
+    max_batch_size characters are queued). Writers block when more than max_buffer_size
+    characters are queued (so memory stays bounded if the disk can't keep up).
+
+    :param flush_interval: Maximum time (in seconds) data is queued before it is written out.
+
+    :param max_batch_size: Write out the queued data once this many characters are queued.
+
+    :param max_buffer_size: Maximum number of characters queued before writes block.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 1.0,
+        max_batch_size: int = 1024 * 1024,
+        max_buffer_size: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_buffer_size = max_buffer_size
+        self._queue: Deque[Tuple["SessionLog", str]] = deque()
+        self._queued_size = 0
+        # Producers wait on _done (space freed / data written); the writer thread waits
+        # on _work so a wakeup only reaches the side that can make progress.
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._done = threading.Condition(self._lock)
+        self._flush_requested = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        # Number of items submitted and written for each SessionLog (used by drain)
+        self._submitted: Dict["SessionLog", int] = {}
+        self._written: Dict["SessionLog", int] = {}
+        self._errors: Dict["SessionLog", Exception] = {}
+
+    def submit(self, slog: "SessionLog", data: str) -> None:
+        """Queue data to be written to the slog file (blocks if the queue is full)."""
+        with self._lock:
+            if self._closed:
+                raise ValueError("SessionLogWriter is closed")
+            while (
+                self._queued_size
+                and self._queued_size + len(data) > self.max_buffer_size
+            ):
+                self._flush_requested = True
+                self._work.notify()
+                self._done.wait()
+            was_empty = not self._queue
+            self._queue.append((slog, data))
+            self._queued_size += len(data)
+            self._submitted[slog] = self._submitted.get(slog, 0) + 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="netmiko_session_log", daemon=True
+                )
+                self._thread.start()
+            if was_empty or self._queued_size >= self.max_batch_size:
+                self._work.notify()
+
+    def drain(self, slog: "SessionLog") -> None:
+        """Block until all of the data queued for slog has been written and flushed."""
+        with self._lock:
+            self._flush_requested = True
+            self._work.notify()
+            while self._written.get(slog, 0) < self._submitted.get(slog, 0):
+                self._done.wait()
+            self._submitted.pop(slog, None)
+            self._written.pop(slog, None)
+            error = self._errors.pop(slog, None)
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Write out everything that is queued and stop the writer thread."""
+        with self._lock:
+            self._closed = True
+            self._work.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._work.wait()
+                deadline = time.monotonic() + self.flush_interval
+                while not (
+                    self._closed
+                    or self._flush_requested
+                    or self._queued_size >= self.max_batch_size
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._work.wait(remaining)
+                batch = list(self._queue)
+                self._queue.clear()
+                self._flush_requested = False
+                closed = self._closed
+
+            self._write_batch(batch)
+
+            with self._lock:
+                for slog, data in batch:
+                    self._queued_size -= len(data)
+                    self._written[slog] = self._written.get(slog, 0) + 1
+                self._done.notify_all()
+                if closed and not self._queue:
+                    return
+
+    def _write_batch(self, batch: List[Tuple["SessionLog", str]]) -> None:
+        """Write the batch (combining the writes for each SessionLog) and flush the files."""
+        grouped: Dict["SessionLog", List[str]] = {}
+        for slog, data in batch:
+            grouped.setdefault(slog, []).append(data)
+        for slog, chunks in grouped.items():
+            try:
+                slog._write_file("".join(chunks))
+                if slog.session_log is not None:
+                    slog.session_log.flush()
+            except Exception as e:
+                log.error(f"Unable to write to session_log: {e}")
+                self._errors[slog] = e
 
 
 class SessionLog:
@@ -13,7 +199,25 @@ class SessionLog:
         no_log: Optional[Dict[str, Any]] = None,
         record_writes: bool = False,
         slog_buffer: Optional[io.StringIO] = None,
+        writer: Optional[SessionLogWriter] = None,
+        compression: Optional[str] = None,
+        max_bytes: int = 0,
+        rotate_interval: float = 0,
+        backup_count: int = 0,
     ) -> None:
+        """
+        :param compression: "gzip", "zstd" (requires the zstandard package), or None. By
+            default this is determined by the file_name suffix (".gz" or ".zst").
+
+        :param max_bytes: Rotate the file once this many characters (before compression)
+            have been written to it (0 disables size based rotation).
+
+        :param rotate_interval: Rotate the file once it has been open this many seconds (0
+            disables time based rotation).
+
+        :param backup_count: Number of rotated files that are kept (file_name.1 is the most
+            recent). With a backup_count of 0 the current file is truncated on rotation.
+        """
         if no_log is None:
             self.no_log = {}
         else:
@@ -22,8 +226,25 @@ class SessionLog:
         self.file_mode = file_mode
         self.file_encoding = file_encoding
         self.record_writes = record_writes
+        # Background writer (shared by many SessionLog objects) or None to write directly
+        self.writer = writer
         self._session_log_close = False
 
+        if compression is None and file_name is not None:
+            _, suffix = os.path.splitext(file_name)
+            compression = COMPRESSION_SUFFIXES.get(suffix)
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unsupported session_log compression: {compression}")
+        if compression == "zstd":
+            _zstd_required()
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        # Size and age of the current file (used for rotation)
+        self._file_size = 0
+        self._opened_at = 0.0
+
         # Actual file/file-handle/buffered-IO that will be written to.
         self.session_log: Union[io.BufferedIOBase, TextIO, None]
         if file_name is None and buffered_io:
@@ -31,12 +252,16 @@ class SessionLog:
         else:
             self.session_log = None
 
-        # In order to ensure all the no_log entries get hidden properly,
-        # we must first store everying in memory and then write out to file.
-        # Otherwise, we might miss the data we are supposed to hide (since
-        # the no_log data potentially spans multiple reads).
-        if slog_buffer is None:
-            self.slog_buffer = io.StringIO()
+        # Data is redacted as it is written and then passed through to the file. Only the
+        # tail that could be the start of a no_log entry (i.e. a secret that is split across
+        # multiple reads) is held back until more data arrives (or until flush).
+        self._pending = ""
+        self._no_log_values: Tuple[str, ...] = ()
+        self._no_log_regex: Optional[Pattern[str]] = None
+        self._holdback = 0
+
+        # Redacted data written before the session_log file is opened.
+        self.slog_buffer = io.StringIO() if slog_buffer is None else slog_buffer
 
         # Ensures last write operations prior to disconnect are recorded.
         self.fin = False
@@ -45,28 +270,121 @@ class SessionLog:
         """Open the session_log file."""
         if self.file_name is None:
             return None
-        if self.file_mode == "append":
-            self.session_log = open(
-                self.file_name, mode="a", encoding=self.file_encoding
-            )
-        else:
-            self.session_log = open(
-                self.file_name, mode="w", encoding=self.file_encoding
-            )
+        mode = "a" if self.file_mode == "append" else "w"
+        self._open_file(mode)
+
+    def _open_file(self, mode: str) -> None:
+        assert self.file_name is not None
+        self._file_size = 0
+        if mode == "a" and self.compression is None and os.path.exists(self.file_name):
+            self._file_size = os.path.getsize(self.file_name)
+        self.session_log = _open_log_file(
+            self.file_name, mode, self.compression, self.file_encoding
+        )
+        self._opened_at = time.monotonic()
         self._session_log_close = True
 
+    def _should_rotate(self, size: int) -> bool:
+        if self.file_name is None or not self._file_size:
+            return False
+        if self.max_bytes and self._file_size + size > self.max_bytes:
+            return True
+        if (
+            self.rotate_interval
+            and time.monotonic() - self._opened_at >= self.rotate_interval
+        ):
+            return True
+        return False
+
+    def rotate(self) -> None:
+        """Close the current file, shift the rotated files, and start a new file.
+
+        file_name becomes file_name.1, file_name.1 becomes file_name.2 and so on; files
+        beyond backup_count are removed.
+        """
+        assert self.file_name is not None
+        if self.session_log is not None:
+            self.session_log.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = f"{self.file_name}.{i}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.file_name}.{i + 1}")
+            if os.path.exists(self.file_name):
+                os.replace(self.file_name, f"{self.file_name}.1")
+        self._open_file("w")
+
     def close(self) -> None:
         """Close the session_log file (if it is a file that we opened)."""
         self.flush()
+        if self.writer is not None:
+            self.writer.drain(self)
         if self.session_log and self._session_log_close:
             self.session_log.close()
             self.session_log = None
 
+    def _update_no_log_regex(self) -> Optional[Pattern[str]]:
+        """Compile the no_log entries into a single regex (rebuilt if no_log changes).
+
+        Longer entries come first in the alternation so that an entry that is a prefix of
+        another entry doesn't prevent the longer one from being hidden.
+        """
+        values = tuple(str(value) for value in self.no_log.values() if value)
+        if values != self._no_log_values:
+            self._no_log_values = values
+            if values:
+                ordered = sorted(set(values), key=len, reverse=True)
+                alternation = "|".join(map(re.escape, ordered))
+                # Capture group so re.split() returns the matches as well
+                self._no_log_regex = re.compile(f"({alternation})")
+                self._holdback = len(ordered[0]) - 1
+            else:
+                self._no_log_regex = None
+                self._holdback = 0
+        return self._no_log_regex
+
     def no_log_filter(self, data: str) -> str:
         """Filter content from the session_log."""
-        for hidden_data in self.no_log.values():
-            data = data.replace(hidden_data, "********")
-        return data
+        regex = self._update_no_log_regex()
+        if regex is None:
+            return data
+        return regex.sub(NO_LOG_REPLACEMENT, data)
+
+    def _redact(self, data: str, final: bool = False) -> str:
+        """Redact data (prepended with the pending tail) and return the part that is safe
+        to write out. Unless final, data that could still be part of a no_log entry is
+        retained as the pending tail.
+        """
+        data = self._pending + data
+        self._pending = ""
+        regex = self._update_no_log_regex()
+        if regex is None:
+            return data
+        if final:
+            return regex.sub(NO_LOG_REPLACEMENT, data)
+
+        # parts alternates text and no_log matches: [text, match, text, ..., match, text]
+        parts = regex.split(data)
+        # A match that ends at or before limit is complete (a longer entry would be fully
+        # contained in the data and would have matched instead). Walk back over the
+        # matches at the end of the data that could still change with more data.
+        limit = len(data) - self._holdback
+        held = len(parts)  # Index of the first match that is held back
+        written_end = len(data)  # End of the text that precedes that match
+        end = len(data)
+        for i in range(len(parts) - 1, 0, -2):
+            end -= len(parts[i])
+            if end <= limit:
+                break
+            end -= len(parts[i - 1])
+            held, written_end = i - 1, end
+        cut = max(min(limit, written_end), 0)
+
+        # Only the end of the last text part that is written out can be beyond cut
+        last = parts[held - 1]
+        parts[held - 1] = last[: len(last) - (written_end - cut)]
+        self._pending = data[cut:]
+        return NO_LOG_REPLACEMENT.join(parts[0:held:2])
 
     def _read_buffer(self) -> str:
         self.slog_buffer.seek(0)
@@ -75,17 +393,38 @@ class SessionLog:
         self.slog_buffer = io.StringIO()
         return data
 
+    def _write_out(self, data: str) -> None:
+        """Write redacted data to the session_log (or buffer it if not open yet)."""
+        if self.session_log is None:
+            self.slog_buffer.write(data)
+            return
+        if self.slog_buffer.tell():
+            data = self._read_buffer() + data
+        if not data:
+            return
+        if self.writer is not None:
+            self.writer.submit(self, data)
+        else:
+            self._write_file(data)
+
+    def _write_file(self, data: str) -> None:
+        if self._session_log_close and self._should_rotate(len(data)):
+            self.rotate()
+        assert self.session_log is not None
+        self._file_size += len(data)
+        if isinstance(self.session_log, io.BufferedIOBase):
+            self.session_log.write(write_bytes(data, encoding=self.file_encoding))
+        else:
+            self.session_log.write(data)
+
     def flush(self) -> None:
-        """Force the slog_buffer to be written out to the actual file"""
+        """Write out any held back data and flush the actual file"""
 
         if self.session_log is not None:
-            data = self._read_buffer()
-            data = self.no_log_filter(data)
-
-            if isinstance(self.session_log, io.BufferedIOBase):
-                self.session_log.write(write_bytes(data, encoding=self.file_encoding))
-            else:
-                self.session_log.write(data)
+            self._write_out(self._redact("", final=True))
+            if self.writer is not None:
+                # The writer thread flushes the file
+                return
 
             assert isinstance(self.session_log, io.BufferedIOBase) or isinstance(
                 self.session_log, io.TextIOBase
@@ -96,4 +435,144 @@ class SessionLog:
 
     def write(self, data: str) -> None:
         if len(data) > 0:
-            self.slog_buffer.write(data)
+            self._write_out(self._redact(data))
+
+
+class SessionLogReader(io.RawIOBase):
+    """
+    Read a session_log and its rotated files (oldest first) as one continuous stream.
+
+    Compression (gzip or zstd) is detected per file, so plain and compressed files can be
+    mixed. The stream is binary and seekable (offsets are in uncompressed bytes); use
+    open_session_log() for a text stream.
+
+        with open_session_log("device1.log.gz") as f:
+            for line in f:
+                ...
+
+    Seeking backwards within a compressed file re-reads the file from its start.
+
+    :param file_name: The session_log file name (the rotated files are file_name.N).
+    """
+
+    def __init__(self, file_name: str) -> None:
+        super().__init__()
+        self.file_name = file_name
+        rotated = []
+        i = 1
+        while os.path.exists(f"{file_name}.{i}"):
+            rotated.append(f"{file_name}.{i}")
+            i += 1
+        self.files = rotated[::-1]
+        if os.path.exists(file_name):
+            self.files.append(file_name)
+        if not self.files:
+            raise FileNotFoundError(f"session_log not found: {file_name}")
+
+        self._sizes: Dict[int, int] = {}
+        self._index = 0
+        self._start = 0  # Stream offset of the start of the current file
+        self._pos = 0
+        self._fh: Optional[IO[bytes]] = self._open_member(0)
+
+    def _open_member(self, index: int) -> IO[bytes]:
+        file_name = self.files[index]
+        with open(file_name, "rb") as fh:
+            magic = fh.read(4)
+        if magic.startswith(GZIP_MAGIC):
+            return cast(IO[bytes], gzip.open(file_name, "rb"))
+        elif magic == ZSTD_MAGIC:
+            _zstd_required()
+            dctx = zstandard.ZstdDecompressor()
+            reader = dctx.stream_reader(
+                open(file_name, "rb"), read_across_frames=True, closefd=True
+            )
+            return cast(IO[bytes], reader)
+        return open(file_name, "rb")
+
+    def _size(self, index: int) -> int:
+        """Uncompressed size of a file (cached for the rotated files)."""
+        if index in self._sizes:
+            return self._sizes[index]
+        with self._open_member(index) as fh:
+            size = 0
+            while True:
+                block = fh.read(1024 * 1024)
+                if not block:
+                    break
+                size += len(block)
+        if index < len(self.files) - 1:
+            self._sizes[index] = size
+        return size
+
+    def _switch(self, index: int, start: int) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        self._fh = self._open_member(index)
+        self._index = index
+        self._start = start
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        while True:
+            assert self._fh is not None
+            data = self._fh.read(len(view))
+            if data:
+                view[: len(data)] = data
+                self._pos += len(data)
+                return len(data)
+            if self._index + 1 >= len(self.files):
+                return 0
+            # The current file has been read, so its size is known
+            self._sizes[self._index] = self._pos - self._start
+            self._switch(self._index + 1, self._pos)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += sum(self._size(i) for i in range(len(self.files)))
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+        if offset < 0:
+            raise ValueError(f"Negative seek position: {offset}")
+
+        index, start = 0, 0
+        while index < len(self.files) - 1:
+            size = self._size(index)
+            if offset < start + size:
+                break
+            start += size
+            index += 1
+        if index != self._index or offset < self._pos:
+            self._switch(index, start)
+            current = start
+        else:
+            current = self._pos
+        assert self._fh is not None
+        # Decompressing readers only support seeking forwards
+        self._fh.seek(offset - current, io.SEEK_CUR)
+        self._pos = offset
+        return offset
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        super().close()
+
+
+def open_session_log(file_name: str, encoding: str = "utf-8") -> TextIO:
+    """Open a (possibly compressed and rotated) session_log for reading as text."""
+    return io.TextIOWrapper(
+        io.BufferedReader(SessionLogReader(file_name)), encoding=encoding
+    )
@@ -11,6 +11,8 @@ from netmiko.snmp_autodetect import SNMPDetect
 
 my_snmp = SNMPDetect(hostname='1.1.1.70', user='pysnmp', auth_key='key1', encrypt_key='key2')
 device_type = my_snmp.autodetect()
+
+device_types = SNMPDetect.autodetect_many(hosts, snmp_version="v2c", community="public")
 ------------------
 
 autodetect will return None if no match.
@@ -21,9 +23,11 @@ Note, pysnmp is a required dependency for SNMPDetect and is intentionally not in
 netmiko requirements. So installation of pysnmp might be required.
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Sequence, Union, Any
 from typing.re import Pattern
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import functools
 import re
 import socket
 
@@ -38,8 +42,14 @@ except ImportError:
 except ImportError:
     raise ImportError("pysnmp not installed; please install it: 'pip install pysnmp'")
 
+from pysnmp.proto import rfc1905
+
+from netmiko.autodetect_cache import AutodetectCache
 from netmiko.ssh_dispatcher import CLASS_MAPPER
 
+# Values returned for OIDs that don't exist on the device
+_SNMP_MISSING = (rfc1905.NoSuchObject, rfc1905.NoSuchInstance, rfc1905.EndOfMibView)
+
 
 # Higher priority indicates a better match.
 SNMP_MAPPER_BASE = {
@@ -143,6 +153,20 @@ for device_type in std_device_types:
         SNMP_MAPPER[device_type] = SNMP_MAPPER_BASE[device_type]
 
 
+def _sorted_snmp_mapper() -> List[Dict[str, Any]]:
+    """SNMP_MAPPER entries (with the device_type added) in the order used by autodetect()."""
+    entries: List[Dict[str, Any]] = [
+        dict(v, device_type=k) for k, v in SNMP_MAPPER.items()
+    ]
+    entries = sorted(entries, key=lambda entry: entry["priority"])
+    entries.reverse()
+    return entries
+
+
+# SNMP_MAPPER sorted by priority once (instead of on every autodetect() call)
+SNMP_MAPPER_SORTED = _sorted_snmp_mapper()
+
+
 def identify_address_type(entry: str) -> List[str]:
     """
     Return a list containing all ip types found. An empty list means no valid ip were found
@@ -214,6 +238,9 @@ class SNMPDetect(object):
         The SNMPv3 authentication protocol (default: 'aes128')
     encrypt_proto : str, optional ('sha', 'md5')
         The SNMPv3 encryption protocol (default: 'sha')
+    cache : AutodetectCache, optional
+        Return the cached device_type instead of querying the device, and store new results.
+        SNMP entries are only invalidated by the cache TTL (default: None).
 
     Attributes
     ----------
@@ -240,6 +267,8 @@ class SNMPDetect(object):
     -------
     autodetect()
         Try to determine the device type.
+    autodetect_many()
+        Try to determine the device type of many hosts (concurrently).
 
     """
 
@@ -254,6 +283,7 @@ class SNMPDetect(object):
         encrypt_key: str = "",
         auth_proto: str = "sha",
         encrypt_proto: str = "aes128",
+        cache: Optional[AutodetectCache] = None,
     ) -> None:
         # Check that the SNMP version is matching predefined type or raise ValueError
         if snmp_version == "v1" or snmp_version == "v2c":
@@ -300,6 +330,7 @@ class SNMPDetect(object):
         self.auth_proto = self._snmp_v3_authentication[auth_proto]
         self.encryp_proto = self._snmp_v3_encryption[encrypt_proto]
         self._response_cache: Dict[str, str] = {}
+        self.cache = cache
         self.snmp_target = (self.hostname, self.snmp_port)
 
         if "IPv6" in identify_address_type(self.hostname):
@@ -339,6 +370,77 @@ class SNMPDetect(object):
             return str(varBinds[0][1])
         return ""
 
+    def _credentials(self) -> object:
+        """UsmUserData (SNMPv3) or CommunityData (SNMPv1/v2c) object for the queries."""
+        if self.snmp_version in ["v1", "v2c"]:
+            return cmdgen.CommunityData(self.community)
+        return cmdgen.UsmUserData(
+            self.user,
+            self.auth_key,
+            self.encrypt_key,
+            authProtocol=self.auth_proto,
+            privProtocol=self.encryp_proto,
+        )
+
+    async def _run_query_many(
+        self, snmp_engine: object, oids: List[str]
+    ) -> Dict[str, str]:
+        """
+        Get all of the OIDs using a single GET request (newer versions of pysnmp).
+
+        Returns
+        -------
+        responses : dict
+            The string value of each OID that exists on the device.
+        """
+        errorIndication, errorStatus, errorIndex, varBinds = await cmdgen.getCmd(
+            snmp_engine,
+            self._credentials(),
+            self.udp_transport_target,
+            cmdgen.ContextData(),
+            *[cmdgen.ObjectType(cmdgen.ObjectIdentity(oid)) for oid in oids],
+        )
+        if errorIndication:
+            return {}
+        if errorStatus:
+            # i.e. SNMPv1 noSuchName fails the whole request; query the OIDs one at a time
+            if len(oids) == 1:
+                return {}
+            responses: Dict[str, str] = {}
+            for oid in oids:
+                responses.update(await self._run_query_many(snmp_engine, [oid]))
+            return responses
+        return {
+            oid: str(value)
+            for oid, (_, value) in zip(oids, varBinds)
+            if not isinstance(value, _SNMP_MISSING) and str(value)
+        }
+
+    def _get_snmp_many_legacy(self, oids: List[str]) -> Dict[str, str]:
+        """Get all of the OIDs using a single GET request (legacy pysnmp)."""
+        cmd_gen = cmdgen.CommandGenerator()
+        (error_detected, error_status, error_index, snmp_data) = cmd_gen.getCmd(
+            self._credentials(),
+            self.udp_transport_target,
+            *oids,
+            lookupNames=True,
+            lookupValues=True,
+        )
+        if error_detected:
+            return {}
+        if error_status:
+            if len(oids) == 1:
+                return {}
+            responses: Dict[str, str] = {}
+            for oid in oids:
+                responses.update(self._get_snmp_many_legacy([oid]))
+            return responses
+        return {
+            oid: str(value)
+            for oid, (_, value) in zip(oids, snmp_data)
+            if not isinstance(value, _SNMP_MISSING) and str(value)
+        }
+
     def _get_snmpv3_asyncwr(self, oid: str) -> str:
         """
         This is an asynchronous wrapper to call code in newer versions of the pysnmp library
@@ -442,6 +544,131 @@ class SNMPDetect(object):
         else:
             return self._get_snmpv3(oid)
 
+    def _cached_result(self) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self.hostname, self.snmp_port, method="snmp")
+
+    def _store_result(self, device_type: Optional[str]) -> None:
+        if self.cache is not None and device_type:
+            self.cache.set(self.hostname, self.snmp_port, device_type, method="snmp")
+
+    @classmethod
+    def autodetect_many(
+        cls,
+        hosts: Sequence[Union[str, Dict[str, Any]]],
+        max_concurrency: int = 200,
+        cache: Optional[AutodetectCache] = None,
+        **kwargs: Any,
+    ) -> List[Union[str, None, Exception]]:
+        """
+        Autodetect many hosts concurrently.
+
+        All of the OIDs in SNMP_MAPPER are fetched from each host with a single GET request
+        and matched (by priority) against SNMP_MAPPER. With newer versions of pysnmp all of the
+        queries run in one event loop (sharing one SNMP engine); legacy pysnmp uses threads.
+        From a coroutine use autodetect_many_async() instead (so the running event loop isn't
+        blocked).
+
+        Parameters
+        ----------
+        hosts : list
+            Hostnames, or dicts of SNMPDetect arguments for each host (i.e. to override the
+            snmp_port or the credentials).
+        max_concurrency : int, optional
+            Maximum number of hosts that are queried at once (default: 200).
+        cache : AutodetectCache, optional
+            Cache of autodetect results (default: None).
+        **kwargs : dict
+            SNMPDetect arguments shared by all of the hosts (i.e. snmp_version, community).
+
+        Returns
+        -------
+        results : list
+            The device_type (or None) of each host in the same order as hosts. If a host
+            fails (i.e. invalid arguments), the exception is returned in its place.
+        """
+        detectors = cls._detectors(hosts, cache, kwargs)
+        oids = _mapper_oids()
+        if SNMP_MODE == "v6_async":
+            coro = _autodetect_many_async(detectors, oids, max_concurrency)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(coro)
+            # asyncio.run() can't be used from a running event loop (i.e. a synchronous
+            # call from async code): run a separate event loop in a thread.
+            with ThreadPoolExecutor(max_workers=1) as loop_thread:
+                return loop_thread.submit(asyncio.run, coro).result()
+
+        def detect(
+            detector: Union["SNMPDetect", Exception]
+        ) -> Union[str, None, Exception]:
+            if isinstance(detector, Exception):
+                return detector
+            try:
+                cached = detector._cached_result()
+                if cached:
+                    return cached
+                detector._response_cache.update(detector._get_snmp_many_legacy(oids))
+                device_type = _match_snmp_responses(detector._response_cache)
+                detector._store_result(device_type)
+                return device_type
+            except Exception as e:
+                return e
+
+        if not detectors:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(detectors))
+        ) as pool:
+            return list(pool.map(detect, detectors))
+
+    @classmethod
+    async def autodetect_many_async(
+        cls,
+        hosts: Sequence[Union[str, Dict[str, Any]]],
+        max_concurrency: int = 200,
+        cache: Optional[AutodetectCache] = None,
+        **kwargs: Any,
+    ) -> List[Union[str, None, Exception]]:
+        """
+        Coroutine version of autodetect_many() that runs in the current event loop.
+
+        The cache (sqlite) lookups and updates are run in the default executor; with legacy
+        pysnmp autodetect_many() is run in the default executor.
+        """
+        if SNMP_MODE != "v6_async":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                functools.partial(
+                    cls.autodetect_many, hosts, max_concurrency, cache, **kwargs
+                ),
+            )
+        detectors = cls._detectors(hosts, cache, kwargs)
+        return await _autodetect_many_async(detectors, _mapper_oids(), max_concurrency)
+
+    @classmethod
+    def _detectors(
+        cls,
+        hosts: Sequence[Union[str, Dict[str, Any]]],
+        cache: Optional[AutodetectCache],
+        kwargs: Dict[str, Any],
+    ) -> List[Union["SNMPDetect", Exception]]:
+        """SNMPDetect object for each host (or the exception raised creating it)."""
+        detectors: List[Union["SNMPDetect", Exception]] = []
+        for host in hosts:
+            if isinstance(host, dict):
+                params = dict(kwargs, **host)
+            else:
+                params = dict(kwargs, hostname=host)
+            try:
+                detectors.append(cls(cache=cache, **params))
+            except Exception as e:
+                detectors.append(e)
+        return detectors
+
     def autodetect(self) -> Optional[str]:
         """
         Try to guess the device_type using SNMP GET based on the SNMP_MAPPER dict. The type which
@@ -455,31 +682,75 @@ class SNMPDetect(object):
         potential_type : str
             The name of the device_type that must be running.
         """
-        # Convert SNMP_MAPPER to a list and sort by priority
-        snmp_mapper_orig = []
-        for k, v in SNMP_MAPPER.items():
-            snmp_mapper_orig.append({k: v})
-        snmp_mapper_list = sorted(
-            snmp_mapper_orig, key=lambda x: list(x.values())[0]["priority"]  # type: ignore
-        )
-        snmp_mapper_list.reverse()
-
-        for entry in snmp_mapper_list:
-            for device_type, v in entry.items():
-                oid: str = v["oid"]  # type: ignore
-                regex: Pattern = v["expr"]
-
-                # Used cache data if we already queryied this OID
-                if self._response_cache.get(oid):
-                    snmp_response = self._response_cache.get(oid)
-                else:
-                    snmp_response = self._get_snmp(oid)
-                    self._response_cache[oid] = snmp_response
-
-                # See if we had a match
-                assert isinstance(snmp_response, str)
-                if re.search(regex, snmp_response):
-                    assert isinstance(device_type, str)
-                    return device_type
+        cached = self._cached_result()
+        if cached:
+            return cached
+        device_type = self._autodetect()
+        self._store_result(device_type)
+        return device_type
+
+    def _autodetect(self) -> Optional[str]:
+        for entry in SNMP_MAPPER_SORTED:
+            oid: str = entry["oid"]
+            regex: Pattern = entry["expr"]
+
+            # Used cache data if we already queryied this OID
+            if self._response_cache.get(oid):
+                snmp_response = self._response_cache.get(oid)
+            else:
+                snmp_response = self._get_snmp(oid)
+                self._response_cache[oid] = snmp_response
+
+            # See if we had a match
+            assert isinstance(snmp_response, str)
+            if regex.search(snmp_response):
+                return str(entry["device_type"])
 
         return None
+
+
+def _mapper_oids() -> List[str]:
+    """The (unique) OIDs of SNMP_MAPPER."""
+    return list(dict.fromkeys(str(v["oid"]) for v in SNMP_MAPPER.values()))
+
+
+def _match_snmp_responses(responses: Dict[str, str]) -> Optional[str]:
+    """Return the highest priority device_type that matches the OID values in responses."""
+    for entry in SNMP_MAPPER_SORTED:
+        snmp_response = responses.get(entry["oid"])
+        if snmp_response and entry["expr"].search(snmp_response):
+            return str(entry["device_type"])
+    return None
+
+
+async def _autodetect_many_async(
+    detectors: List[Union[SNMPDetect, Exception]],
+    oids: List[str],
+    max_concurrency: int,
+) -> List[Union[str, None, Exception]]:
+    snmp_engine = cmdgen.SnmpEngine()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def detect(
+        detector: Union[SNMPDetect, Exception]
+    ) -> Union[str, None, Exception]:
+        if isinstance(detector, Exception):
+            return detector
+        try:
+            # The sqlite cache blocks: keep it off the event loop
+            if detector.cache is not None:
+                cached = await loop.run_in_executor(None, detector._cached_result)
+                if cached:
+                    return cached
+            async with semaphore:
+                responses = await detector._run_query_many(snmp_engine, oids)
+            detector._response_cache.update(responses)
+            device_type = _match_snmp_responses(responses)
+            if detector.cache is not None:
+                await loop.run_in_executor(None, detector._store_result, device_type)
+            return device_type
+        except Exception as e:
+            return e
+
+    return list(await asyncio.gather(*(detect(detector) for detector in detectors)))
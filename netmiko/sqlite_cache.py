@@ -0,0 +1,58 @@
+"""
+sqlite plumbing shared by the on-disk caches (AutodetectCache and DigestCache).
+"""
+
+from typing import Iterator, Optional
+from contextlib import contextmanager
+import os
+import sqlite3
+
+from netmiko.utilities import ensure_dir_exists, find_netmiko_dir
+
+
+class SQLiteCache:
+    """Base class of a cache stored in one table of a sqlite database.
+
+    Subclasses set the table name, its CREATE TABLE IF NOT EXISTS schema, and the default
+    database file name (created in the Netmiko directory, see find_netmiko_dir()).
+
+    :param file_name: sqlite database file (default: default_file_name in the Netmiko
+        directory).
+    """
+
+    table = ""
+    schema = ""
+    default_file_name = ""
+
+    def __init__(self, file_name: Optional[str] = None) -> None:
+        if file_name is None:
+            netmiko_base_dir, _ = find_netmiko_dir()
+            file_name = os.path.join(netmiko_base_dir, self.default_file_name)
+        self.file_name = file_name
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            ensure_dir_exists(os.path.dirname(os.path.abspath(self.file_name)))
+        # A connection per operation: safe to share the cache across threads/processes
+        conn = sqlite3.connect(self.file_name, timeout=30)
+        if not self._initialized:
+            with conn:
+                conn.execute(self.schema)
+            self._initialized = True
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Connection whose statements are committed together (and then closed)."""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._transaction() as conn:
+            conn.execute(f"DELETE FROM {self.table}")
@@ -37,14 +37,33 @@ Examples
 # Netmiko connection creation section
 >>> remote_device['device_type'] = best_match
 >>> connection = ConnectHandler(**remote_device)
+
+# Fast mode (prompt based reads) and many devices at once
+>>> best_match = SSHDetect(fast=True, **remote_device).autodetect()
+>>> results = SSHDetect.autodetect_many([remote_device1, remote_device2], max_workers=50)
 """
 
-from typing import Any, List, Optional, Union, Dict
+from typing import (
+    Any,
+    List,
+    Optional,
+    Union,
+    Dict,
+    Sequence,
+    Tuple,
+    Match,
+    Pattern,
+    FrozenSet,
+    Set,
+)
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import re
 import time
 
 import paramiko
 
+from netmiko.autodetect_cache import AutodetectCache
 from netmiko.ssh_dispatcher import ConnectHandler
 from netmiko.base_connection import BaseConnection
 
@@ -389,6 +408,127 @@ SSH_MAPPER_BASE = sorted(
 )
 SSH_MAPPER_BASE.reverse()
 
+# Responses that indicate the probe command isn't supported by the device
+INVALID_RESPONSES = [
+    r"% Invalid input detected",
+    r"syntax error, expecting",
+    r"Error: Unrecognized command",
+    r"%Error",
+    r"command not found",
+    r"Syntax Error: unexpected argument",
+    r"% Unrecognized command found at",
+    r"% Unknown command, the error locates at",
+]
+INVALID_RESPONSE_REGEX = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in INVALID_RESPONSES), flags=re.I
+)
+
+
+def _scoped_pattern(pattern: str, re_flags: int) -> str:
+    """Wrap pattern in a group with its flags applied inline (i.e. '(?i:pattern)')."""
+    inline = "".join(
+        letter
+        for flag, letter in ((re.I, "i"), (re.M, "m"), (re.S, "s"), (re.X, "x"))
+        if re_flags & flag
+    )
+    return f"(?{inline}:{pattern})" if inline else f"(?:{pattern})"
+
+
+class ProbeIndex:
+    """
+    The search_patterns of every SSH_MAPPER_DICT entry that uses the same probe command,
+    indexed so that the output of the command is scanned once for all of the entries.
+
+    Patterns that are plain (ASCII) strings are found with a substring search of the
+    (lowercased) output. The others are compiled into a single alternation with one named
+    group per entry. An alternation only reports one alternative per match, so an entry that
+    matches is excluded and the output is searched again (until nothing else matches).
+    """
+
+    def __init__(self) -> None:
+        # (search_patterns, re_flags) => group name
+        self.groups: Dict[Tuple[Tuple[str, ...], int], str] = {}
+        # (group name, literal, ignore case)
+        self._literals: List[Tuple[str, str, bool]] = []
+        self._alternatives: Dict[str, str] = {}
+        self._regexes: Dict[FrozenSet[str], Optional[Pattern[str]]] = {}
+
+    def add(self, search_patterns: List[str], re_flags: int = re.IGNORECASE) -> str:
+        key = (tuple(search_patterns), re_flags)
+        group = self.groups.get(key)
+        if group is not None:
+            return group
+        group = f"_entry{len(self.groups)}"
+        self.groups[key] = group
+        alternatives = []
+        for pattern in search_patterns:
+            if (
+                pattern.isascii()
+                and not re_flags & re.X
+                and not any(char in pattern for char in ".^$*+?{}[]\\|()")
+            ):
+                ignore_case = bool(re_flags & re.I)
+                literal = pattern.lower() if ignore_case else pattern
+                self._literals.append((group, literal, ignore_case))
+            else:
+                alternatives.append(_scoped_pattern(pattern, re_flags))
+        if alternatives:
+            self._alternatives[group] = "|".join(alternatives)
+            self._regexes.clear()
+        return group
+
+    def group(self, search_patterns: List[str], re_flags: int) -> Optional[str]:
+        """Return the group name of the entry (None if it isn't part of the index)."""
+        return self.groups.get((tuple(search_patterns), re_flags))
+
+    def _regex(self, excluded: FrozenSet[str]) -> Optional[Pattern[str]]:
+        if excluded not in self._regexes:
+            alternation = "|".join(
+                f"(?P<{group}>{alternative})"
+                for group, alternative in self._alternatives.items()
+                if group not in excluded
+            )
+            self._regexes[excluded] = re.compile(alternation) if alternation else None
+        return self._regexes[excluded]
+
+    def matches(self, output: str) -> Set[str]:
+        """Return the group names of all of the entries that match output."""
+        lower_output = output.lower()
+        matched = {
+            group
+            for group, literal, ignore_case in self._literals
+            if literal in (lower_output if ignore_case else output)
+        }
+        excluded = frozenset(matched & self._alternatives.keys())
+        while True:
+            regex = self._regex(excluded)
+            match = regex.search(output) if regex is not None else None
+            if match is None:
+                return matched
+            found = {
+                group
+                for group, value in match.groupdict().items()
+                if value is not None and group in self._alternatives
+            }
+            matched |= found
+            excluded |= found
+
+
+# Probe command => ProbeIndex of the entries that use the '_autodetect_std' dispatch
+SSH_MAPPER_INDEX: Dict[str, ProbeIndex] = {}
+for _device_type, _autodetect_dict in SSH_MAPPER_BASE:
+    _cmd = _autodetect_dict.get("cmd")
+    _patterns = _autodetect_dict.get("search_patterns")
+    if _autodetect_dict.get("dispatch") == "_autodetect_std" and _cmd and _patterns:
+        assert isinstance(_cmd, str) and isinstance(_patterns, list)
+        _re_flags = _autodetect_dict.get("re_flags", re.IGNORECASE)
+        assert isinstance(_re_flags, int)
+        SSH_MAPPER_INDEX.setdefault(_cmd, ProbeIndex()).add(_patterns, _re_flags)
+
+# Used by the fast mode which reads until the prompt (instead of timing based reads)
+PROMPT_PATTERN = r"\S+ ?[>#$%\]]\s*$"
+PAGER_PATTERN = r"-+\s*\(?more\b[^\n]*$"
+
 
 class SSHDetect(object):
     """
@@ -402,6 +542,15 @@ class SSHDetect(object):
         The same *args that you might provide to the netmiko.ssh_dispatcher.ConnectHandler.
     *kwargs : dict
         The same *kwargs that you might provide to the netmiko.ssh_dispatcher.ConnectHandler.
+    fast : bool, optional
+        Read until the prompt instead of using fixed sleeps and timing based reads, score the
+        SSH banner (remote version) first, and send the probe commands whose patterns match
+        the login banner first (default: False).
+    probe_timeout : float, optional
+        In fast mode, maximum time (in seconds) to wait for the prompt (default: 10).
+    cache : AutodetectCache, optional
+        Return the cached device_type (if the SSH host key and version are unchanged) instead
+        of probing the device, and store new results (default: None).
 
     Attributes
     ----------
@@ -415,9 +564,18 @@ class SSHDetect(object):
     -------
     autodetect()
         Try to determine the device type.
+    autodetect_many()
+        Try to determine the device type of many devices (concurrently).
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        fast: bool = False,
+        probe_timeout: float = 10.0,
+        cache: Optional[AutodetectCache] = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Constructor of the SSHDetect class
         """
@@ -426,15 +584,128 @@ class SSHDetect(object):
         # Always set cmd_verify to False for autodetect
         kwargs["global_cmd_verify"] = False
         self.connection = ConnectHandler(*args, **kwargs)
-
-        # Add additional sleep to let the login complete.
-        time.sleep(3)
-
-        # Call the _test_channel_read() in base to clear initial data
-        output = BaseConnection._test_channel_read(self.connection)
-        self.initial_buffer = output
+        self.fast = fast
+        self.probe_timeout = probe_timeout
+        self.prompt: Optional[str] = None
         self.potential_matches: Dict[str, int] = {}
         self._results_cache: Dict[str, str] = {}
+        # cmd => SSH_MAPPER_INDEX groups that match the output of cmd
+        self._matches_cache: Dict[str, Set[str]] = {}
+
+        self.cache = cache
+        self.cached_device_type: Optional[str] = None
+        self._identity = ("", "")
+        if cache is not None:
+            # Read before autodetect() disconnects
+            self._identity = self._host_identity()
+        fingerprint, remote_version = self._identity
+        if cache is not None and fingerprint:
+            # Without the host key, a replaced device can't be told apart (no caching)
+            self.cached_device_type = cache.get(
+                self.connection.host,
+                self.connection.port,
+                fingerprint=fingerprint,
+                remote_version=remote_version,
+            )
+
+        if self.cached_device_type:
+            # No need to interact with the device
+            self.initial_buffer = ""
+        elif fast:
+            self.initial_buffer = self._read_initial_prompt()
+        else:
+            # Add additional sleep to let the login complete.
+            time.sleep(3)
+
+            # Call the _test_channel_read() in base to clear initial data
+            output = BaseConnection._test_channel_read(self.connection)
+            self.initial_buffer = output
+
+    @classmethod
+    def autodetect_many(
+        cls,
+        devices: Sequence[Dict[str, Any]],
+        max_workers: int = 32,
+        fast: bool = True,
+        cache: Optional[AutodetectCache] = None,
+    ) -> List[Union[str, None, Exception]]:
+        """
+        Autodetect many devices concurrently.
+
+        Parameters
+        ----------
+        devices : list
+            The ConnectHandler kwargs of each device (device_type is set to 'autodetect').
+        max_workers : int, optional
+            Maximum number of devices that are autodetected at once (default: 32).
+        fast : bool, optional
+            Use the fast autodetect mode (default: True).
+        cache : AutodetectCache, optional
+            Cache of autodetect results (default: None).
+
+        Returns
+        -------
+        results : list
+            The best device_type (or None) for each device in the same order as devices. If
+            the autodetect of a device fails, the exception is returned in its place.
+        """
+
+        def detect(device: Dict[str, Any]) -> Union[str, None, Exception]:
+            try:
+                guesser = cls(
+                    fast=fast, cache=cache, **dict(device, device_type="autodetect")
+                )
+            except Exception as e:
+                return e
+            try:
+                return guesser.autodetect()
+            except Exception as e:
+                guesser.connection.disconnect()
+                return e
+
+        if not devices:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(devices))) as executor:
+            return list(executor.map(detect, devices))
+
+    def _mapper(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        The SSH_MAPPER_BASE entries in the order they are tried. In fast mode, the entries
+        that don't require a command are first and the entries are grouped by command (so
+        each command is only sent once); the commands whose search_patterns match the
+        initial_buffer (i.e. the login banner) are sent first.
+        """
+        if not self.fast:
+            return SSH_MAPPER_BASE
+        no_cmd = []
+        by_cmd: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        hinted = set()
+        for device_type, autodetect_dict in SSH_MAPPER_BASE:
+            cmd = autodetect_dict.get("cmd")
+            if not cmd:
+                no_cmd.append((device_type, autodetect_dict))
+                continue
+            assert isinstance(cmd, str)
+            by_cmd.setdefault(cmd, []).append((device_type, autodetect_dict))
+        for cmd, index in SSH_MAPPER_INDEX.items():
+            if cmd in by_cmd and index.matches(self.initial_buffer):
+                hinted.add(cmd)
+        cmds = sorted(by_cmd, key=lambda cmd: cmd not in hinted)
+        return no_cmd + [entry for cmd in cmds for entry in by_cmd[cmd]]
+
+    def _host_identity(self) -> Tuple[str, str]:
+        """Return the SSH host key fingerprint (SHA256) and remote SSH version string (empty
+        strings if they can't be read)."""
+        try:
+            remote_conn = self.connection.remote_conn
+            assert isinstance(remote_conn, paramiko.Channel)
+            transport = remote_conn.transport
+            assert transport is not None
+            host_key = transport.get_remote_server_key()
+            fingerprint = hashlib.sha256(host_key.asbytes()).hexdigest()
+            return f"{host_key.get_name()}:{fingerprint}", transport.remote_version
+        except Exception:
+            return "", ""
 
     def autodetect(self) -> Union[str, None]:
         """
@@ -445,7 +716,25 @@ class SSHDetect(object):
         best_match : str or None
             The device type that is currently the best to use to interact with the device
         """
-        for device_type, autodetect_dict in SSH_MAPPER_BASE:
+        if self.cached_device_type:
+            self.potential_matches = {self.cached_device_type: 99}
+            self.connection.disconnect()
+            return self.cached_device_type
+
+        best_match = self._autodetect()
+        fingerprint, remote_version = self._identity
+        if best_match and self.cache is not None and fingerprint:
+            self.cache.set(
+                self.connection.host,
+                self.connection.port,
+                best_match,
+                fingerprint=fingerprint,
+                remote_version=remote_version,
+            )
+        return best_match
+
+    def _autodetect(self) -> Union[str, None]:
+        for device_type, autodetect_dict in self._mapper():
             tmp_dict = autodetect_dict.copy()
             call_method = tmp_dict.pop("dispatch")
             assert isinstance(call_method, str)
@@ -490,12 +779,69 @@ class SSHDetect(object):
         output : str
             The output from the command sent
         """
+        if self.fast and self.prompt is not None:
+            return self._send_command_fast(cmd)
         self.connection.write_channel(cmd + "\n")
         time.sleep(1)
         output = self.connection.read_channel_timing(last_read=6.0)
         output = self.connection.strip_backspaces(output)
         return output
 
+    def _read_until(
+        self, pattern: Pattern[str], timeout: float
+    ) -> Tuple[str, Optional[Match[str]]]:
+        """
+        Read until the last line of the output matches pattern (or until timeout).
+
+        Returns
+        -------
+        output, match : tuple
+            The output read and the match (None if timeout expired).
+        """
+        output = ""
+        deadline = time.monotonic() + timeout
+        while True:
+            new_data = self.connection.read_channel()
+            if new_data:
+                output += new_data
+                match = pattern.search(output[output.rfind("\n") + 1 :])
+                if match:
+                    return output, match
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return output, None
+            self.connection.wait_for_data(timeout=min(remaining, 1.0))
+
+    def _read_initial_prompt(self) -> str:
+        """Read the login output and determine the prompt (used by the fast mode)."""
+        prompt_regex = re.compile(PROMPT_PATTERN)
+        output, match = self._read_until(prompt_regex, timeout=self.probe_timeout)
+        # Send a newline: the last line must be the prompt itself (and not the end of a
+        # login banner that happens to look like a prompt).
+        self.connection.write_channel(self.connection.RETURN)
+        new_data, match = self._read_until(prompt_regex, timeout=self.probe_timeout)
+        output += new_data
+        if match is not None:
+            self.prompt = new_data[new_data.rfind("\n") + 1 :].strip()
+        return output
+
+    def _send_command_fast(self, cmd: str) -> str:
+        """Send the command and read until the prompt (or a pager prompt) is found."""
+        assert self.prompt is not None
+        pattern = re.compile(
+            rf"(?P<prompt>{re.escape(self.prompt)}\s*$)|(?P<pager>{PAGER_PATTERN})",
+            flags=re.I,
+        )
+        self.connection.write_channel(cmd + "\n")
+        output, match = self._read_until(pattern, timeout=self.probe_timeout)
+        if match is not None and match.lastgroup == "pager":
+            # The output so far is enough to match; quit the pager and wait for the prompt.
+            self.connection.write_channel("q")
+            prompt_regex = re.compile(rf"{re.escape(self.prompt)}\s*$")
+            self._read_until(prompt_regex, timeout=self.probe_timeout)
+        return self.connection.strip_backspaces(output)
+
     def _send_command_wrapper(self, cmd: str) -> str:
         """
         Send command to the remote device with a caching feature to avoid sending the same command
@@ -524,7 +870,7 @@ class SSHDetect(object):
         search_patterns: Optional[List[str]] = None,
         re_flags: int = re.IGNORECASE,
         priority: int = 99,
-        **kwargs: Any
+        **kwargs: Any,
     ) -> int:
         """
         Method to try auto-detect the device type, by matching a regular expression on the reported
@@ -586,26 +932,27 @@ class SSHDetect(object):
         priority: int, optional
             The confidence the match is right between 0 and 99 (default: 99).
         """
-        invalid_responses = [
-            r"% Invalid input detected",
-            r"syntax error, expecting",
-            r"Error: Unrecognized command",
-            r"%Error",
-            r"command not found",
-            r"Syntax Error: unexpected argument",
-            r"% Unrecognized command found at",
-            r"% Unknown command, the error locates at",
-        ]
         if not cmd or not search_patterns:
             return 0
         try:
             # _send_command_wrapper will use already cached results if available
             response = self._send_command_wrapper(cmd)
+            index = SSH_MAPPER_INDEX.get(cmd)
+            group = index.group(search_patterns, re_flags) if index else None
+            if index is not None and group is not None:
+                # Score all of the entries that use cmd at once (the first time)
+                matches = self._matches_cache.get(cmd)
+                if matches is None:
+                    if INVALID_RESPONSE_REGEX.search(response):
+                        matches = set()
+                    else:
+                        matches = index.matches(response)
+                    self._matches_cache[cmd] = matches
+                return priority if group in matches else 0
+
             # Look for error conditions in output
-            for pattern in invalid_responses:
-                match = re.search(pattern, response, flags=re.I)
-                if match:
-                    return 0
+            if INVALID_RESPONSE_REGEX.search(response):
+                return 0
             for pattern in search_patterns:
                 match = re.search(pattern, response, flags=re_flags)
                 if match:
@@ -11,6 +11,9 @@ from typing import (
     List,
     Dict,
     Tuple,
+    Iterator,
+    Set,
+    Match,
 )
 from typing import TYPE_CHECKING
 import re
@@ -20,9 +23,13 @@ import io
 import os
 from pathlib import Path
 import functools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 import importlib.resources as pkg_resources
-from textfsm import clitable
+import textfsm
+from textfsm import clitable, texttable
 from textfsm.clitable import CliTableError
 from netmiko import log
 from netmiko.exceptions import NetmikoParsingException
@@ -341,7 +348,7 @@ Alternatively, `pip install ntc-templates` (if using ntc-templates).
     return os.path.abspath(template_dir)
 
 
-def clitable_to_dict(cli_table: clitable.CliTable) -> List[Dict[str, str]]:
+def clitable_to_dict(cli_table: texttable.TextTable) -> List[Dict[str, str]]:
     """Converts TextFSM cli_table object to list of dictionaries."""
     return_list = []
     for row in cli_table:
@@ -352,23 +359,193 @@ def clitable_to_dict(cli_table: clitable.CliTable) -> List[Dict[str, str]]:
     return return_list
 
 
+def _index_preread(key: str, value: str) -> str:
+    """Expand the 'sh[[ow]]' completions in the Command column of a CliTable index."""
+
+    def completion(match: Match[str]) -> str:
+        word = match.group()[2:-2]
+        return "(" + "(".join(word) + ")?" * len(word)
+
+    if key == "Command":
+        return re.sub(r"(\[\[.+?\]\])", completion, value)
+    return value
+
+
+def _index_precompile(key: str, value: str) -> Optional[str]:
+    """The Template column of a CliTable index isn't a regular expression."""
+    if key == "Template":
+        return None
+    return value
+
+
+class TextFSMCache:
+    """
+    Process-wide cache used by get_structured_data_textfsm().
+
+    Caches the parsed CliTable index (per template directory and index file mtime), the
+    index lookups (platform/command -> template files), and the compiled TextFSM
+    templates (per template file and mtime). TextFSM objects hold parsing state so a
+    compiled template is checked out for each parse (and returned to the cache after)
+    instead of being shared between threads.
+
+    :param maxsize: Maximum number of index lookups and of templates cached.
+
+    :param max_idle: Maximum number of compiled copies of a template kept (only
+        relevant when multiple threads parse with the same template concurrently).
+    """
+
+    def __init__(self, maxsize: int = 1024, max_idle: int = 4) -> None:
+        self.maxsize = maxsize
+        self.max_idle = max_idle
+        self.lookup_hits = 0
+        self.lookup_misses = 0
+        self.template_hits = 0
+        self.template_misses = 0
+        self._lock = threading.Lock()
+        self._indexes: Dict[Tuple[str, int], clitable.IndexTable] = {}
+        self._lookups: "OrderedDict[Tuple[str, int, str, str], Optional[str]]"
+        self._lookups = OrderedDict()
+        self._templates: "OrderedDict[Tuple[str, int], List[textfsm.TextFSM]]"
+        self._templates = OrderedDict()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "lookup_hits": self.lookup_hits,
+                "lookup_misses": self.lookup_misses,
+                "template_hits": self.template_hits,
+                "template_misses": self.template_misses,
+                "lookups": len(self._lookups),
+                "templates": len(self._templates),
+            }
+
+    def invalidate(self) -> None:
+        """Discard all cached indexes, lookups, and templates (and reset the stats)."""
+        with self._lock:
+            self._indexes.clear()
+            self._lookups.clear()
+            self._templates.clear()
+            self.lookup_hits = self.lookup_misses = 0
+            self.template_hits = self.template_misses = 0
+
+    def _get_index(self, template_dir: str, mtime: int) -> clitable.IndexTable:
+        with self._lock:
+            index = self._indexes.get((template_dir, mtime))
+        if index is None:
+            # Same index processing as CliTable (but not its unbounded, mtime unaware
+            # CliTable.INDEX cache)
+            index_file = os.path.join(template_dir, "index")
+            index = clitable.IndexTable(_index_preread, _index_precompile, index_file)
+            if "Template" not in index.index.header:
+                raise CliTableError("Index file does not have 'Template' column.")
+            with self._lock:
+                # Drop any index for an older version of the index file
+                for key in [key for key in self._indexes if key[0] == template_dir]:
+                    del self._indexes[key]
+                self._indexes[(template_dir, mtime)] = index
+        return index
+
+    def lookup(self, template_dir: str, attributes: Dict[str, str]) -> str:
+        """Return the template(s) in the index for attributes (Platform and Command)."""
+        mtime = os.stat(os.path.join(template_dir, "index")).st_mtime_ns
+        key = (template_dir, mtime, attributes["Platform"], attributes["Command"])
+        with self._lock:
+            found = key in self._lookups
+            if found:
+                self.lookup_hits += 1
+                self._lookups.move_to_end(key)
+                templates = self._lookups[key]
+            else:
+                self.lookup_misses += 1
+
+        if not found:
+            index = self._get_index(template_dir, mtime)
+            row_idx = index.GetRowMatch(attributes)
+            templates = index.index[row_idx]["Template"] if row_idx else None
+            with self._lock:
+                self._lookups[key] = templates
+                while len(self._lookups) > self.maxsize:
+                    self._lookups.popitem(last=False)
+
+        if templates is None:
+            raise CliTableError(f'No template found for attributes: "{attributes}"')
+        return templates
+
+    @contextmanager
+    def template(self, template_file: str) -> Iterator[textfsm.TextFSM]:
+        """Check out a compiled TextFSM template (compiling it if it isn't cached)."""
+        key = (template_file, os.stat(template_file).st_mtime_ns)
+        fsm = None
+        with self._lock:
+            idle = self._templates.get(key)
+            if idle:
+                fsm = idle.pop()
+                self._templates.move_to_end(key)
+                self.template_hits += 1
+            else:
+                self.template_misses += 1
+
+        if fsm is None:
+            with open(template_file) as f:
+                fsm = textfsm.TextFSM(f)
+        else:
+            fsm.Reset()
+        try:
+            yield fsm
+        finally:
+            with self._lock:
+                idle = self._templates.setdefault(key, [])
+                self._templates.move_to_end(key)
+                if len(idle) < self.max_idle:
+                    idle.append(fsm)
+                while len(self._templates) > self.maxsize:
+                    self._templates.popitem(last=False)
+
+    def parse(
+        self, template_dir: str, templates: str, cmd_input: str
+    ) -> texttable.TextTable:
+        """Parse cmd_input with the (':' separated) templates, like CliTable.ParseCmd().
+
+        The tables of additional templates are merged on the Key values of the first one.
+        """
+        table: Optional[texttable.TextTable] = None
+        keys: Set[str] = set()
+        for template in templates.split(":"):
+            template_file = os.path.join(template_dir, template)
+            with self.template(template_file) as fsm:
+                if not keys:
+                    keys = set(fsm.GetValuesByAttrib("Key"))
+                result = texttable.TextTable()
+                result.header = fsm.header
+                for record in fsm.ParseText(cmd_input):
+                    result.Append(record)
+            if table is None:
+                table = result
+            else:
+                table.extend(result, set(keys))
+        assert table is not None
+        return table
+
+
+TEXTFSM_CACHE = TextFSMCache()
+
+
 def _textfsm_parse(
-    textfsm_obj: clitable.CliTable,
+    template_dir: str,
     raw_output: str,
     attrs: Dict[str, str],
     template_file: Optional[str] = None,
     raise_parsing_error: bool = False,
 ) -> Union[str, List[Dict[str, str]]]:
-    """Perform the actual TextFSM parsing using the CliTable object."""
-    tfsm_parse: Callable[..., Any] = textfsm_obj.ParseCmd
+    """Perform the actual TextFSM parsing (using TEXTFSM_CACHE)."""
     try:
-        # Parse output through template
-        if template_file is not None:
-            tfsm_parse(raw_output, templates=template_file)
-        else:
-            tfsm_parse(raw_output, attrs)
+        # Parse output through template (found in the index unless template_file is given)
+        if template_file is None:
+            template_file = TEXTFSM_CACHE.lookup(template_dir, attrs)
+        table = TEXTFSM_CACHE.parse(template_dir, template_file, raw_output)
 
-        structured_data = clitable_to_dict(textfsm_obj)
+        structured_data = clitable_to_dict(table)
         if structured_data == []:
             if raise_parsing_error:
                 msg = """Failed to parse CLI output using TextFSM
@@ -410,10 +587,8 @@ def get_structured_data_textfsm(
                 "Either 'platform/command' or 'template' must be specified."
             )
         template_dir = get_template_dir()
-        index_file = os.path.join(template_dir, "index")
-        textfsm_obj = clitable.CliTable(index_file, template_dir)
         output = _textfsm_parse(
-            textfsm_obj,
+            template_dir,
             raw_output,
             attrs,
             raise_parsing_error=raise_parsing_error,
@@ -423,16 +598,14 @@ def get_structured_data_textfsm(
         if platform and "cisco_xe" in platform:
             if not isinstance(output, list):
                 attrs["Platform"] = "cisco_ios"
-                output = _textfsm_parse(textfsm_obj, raw_output, attrs)
+                output = _textfsm_parse(template_dir, raw_output, attrs)
         return output
     else:
         template_path = Path(os.path.expanduser(template))
         template_file = template_path.name
         template_dir_alt = template_path.parents[0]
-        # CliTable with no index will fall-back to a TextFSM parsing behavior
-        textfsm_obj = clitable.CliTable(template_dir=template_dir_alt)
         return _textfsm_parse(
-            textfsm_obj,
+            str(template_dir_alt),
             raw_output,
             attrs,
             template_file=template_file,
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+Benchmark: throughput (MB/s) of strip_ansi_escape_codes().
+
+Compares the previous implementation (one re.sub() pass per escape code) with the
+single-pass precompiled regex. The input emulates HP ProCurve / Aruba output where
+every line is painted using cursor positioning and erase codes.
+
+    cd tests/performance
+    python bench_ansi_strip.py [size_mb]
+"""
+import re
+import sys
+import time
+
+from netmiko.base_connection import BaseConnection
+
+
+PROCURVE_LINES = [
+    "\x1b[1;24r\x1b[24;1H\x1b[2K\x1b[24;1H\x1b[?25h\x1b[24;1H\x1b[24;1Hshow interfaces brief",
+    "\x1b[24;1H\x1b[2K\x1b[24;1H\x1b[1L\x1bE Status and Counters - Port Status",
+    "  Port         Type      | Alert     Enabled Status Mode       Mode  Ctrl",
+    "  ------------ --------- + --------- ------- ------ ---------- ----- -----",
+    "  1            100/1000T | No        Yes     Up     1000FDx    MDI   off",
+    "\x1b[7m-- MORE --, next page: Space, next line: Enter, quit: Control-C\x1b[0m\x1b[2K",
+    "  2            100/1000T | No        Yes     Down   1000FDx    Auto  off",
+    "\x1b[00;32mswitch1#\x1b[00m \x1b[K",
+]
+
+
+def legacy_strip_ansi_escape_codes(string_buffer: str, RETURN: str = "\n") -> str:
+    """Implementation prior to the single-pass regex (for comparison)."""
+    code_set = [
+        chr(27) + r"\[\d+;\d+H",
+        chr(27) + r"\[\?25h",
+        chr(27) + r"\[2K",
+        chr(27) + r"\[\d+;\d+r",
+        chr(27) + r"\[K",
+        chr(27) + r"\[1M",
+        chr(27) + r"\[\?7l",
+        chr(27) + r"\[K",
+        chr(27) + r"\[\?\d+l",
+        chr(27) + r"\[00m",
+        chr(27) + r"\[2J",
+        chr(27) + r"\[\dm",
+        chr(27) + r"\[\d\d;\d\dm",
+        chr(27) + r"\[\d\d;\d\d;\d\dm",
+        chr(27) + r"\[(3|4)\dm",
+        chr(27) + r"\[(9|10)[0-7]m",
+        chr(27) + r"\[\d;\d\dm",
+        chr(27) + r"\[6n",
+        chr(27) + r"\[m",
+        chr(27) + r"\[2J",
+        chr(27) + r"\[J",
+        chr(27) + r"\[0m",
+        chr(27) + r"\[7m",
+        chr(27) + r"\[\d+D",
+        chr(27) + r"\[\d*A",
+        chr(27) + r"\[\d*B",
+        chr(27) + r"\[\d*C",
+        chr(27) + r"\[\?7h",
+        chr(27) + r"\[\?2004h",
+        chr(27) + r"\[\?2004l",
+        chr(27) + r"\[4m",
+        chr(27) + r"\[c",
+    ]
+    code_next_line = chr(27) + r"E"
+    code_insert_line = chr(27) + r"\[(\d+)L"
+    output = string_buffer
+    for ansi_esc_code in code_set:
+        output = re.sub(ansi_esc_code, "", output)
+    output = re.sub(code_next_line, RETURN, output)
+    insert_line_match = re.search(code_insert_line, output)
+    if insert_line_match:
+        count = int(insert_line_match.group(1))
+        output = re.sub(code_insert_line, count * RETURN, output)
+    return output
+
+
+def throughput(func, chunks) -> float:
+    size = sum(len(chunk) for chunk in chunks)
+    start = time.perf_counter()
+    for chunk in chunks:
+        func(chunk)
+    return size / (time.perf_counter() - start) / 1024 / 1024
+
+
+def main() -> None:
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    line_block = "\n".join(PROCURVE_LINES) + "\n"
+    data = line_block * (size_mb * 1024 * 1024 // len(line_block))
+    # read_channel() strips each read separately
+    chunks = [data[i : i + 65535] for i in range(0, len(data), 65535)]
+
+    conn = BaseConnection(host="testhost", auto_connect=False)
+    new = throughput(conn.strip_ansi_escape_codes, chunks)
+    old = throughput(legacy_strip_ansi_escape_codes, chunks)
+    conn.disconnect()
+
+    assert all(
+        conn.strip_ansi_escape_codes(c) == legacy_strip_ansi_escape_codes(c)
+        for c in chunks[:5]
+    )
+    print(f"input: {size_mb}MB of ProCurve-style output")
+    print(f"per-code re.sub passes: {old:8.1f} MB/s")
+    print(f"single-pass regex:      {new:8.1f} MB/s")
+    print(f"speedup:                {new / old:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Benchmark: many concurrent sessions against local fake SSH servers.
+
+Compares the netmiko-show approach (ThreadPoolExecutor, one worker thread per
+session) with AsyncConnectHandler (one event loop, worker pool of max_workers
+threads; default: the shared pool, NETMIKO_ASYNC_MAX_WORKERS). Both run the same
+blocking driver code in threads: expect the same throughput, the difference is
+the number of worker threads. Every session also has its Paramiko transport
+thread.
+
+    cd tests/performance
+    python bench_async_sessions.py [num_sessions] [commands_per_session] [num_servers] \
+        [max_workers]
+"""
+import asyncio
+import collections
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from netmiko import ConnectHandler, AsyncConnectHandler
+
+from fake_ssh_server import FakeSSHServer
+
+COMMAND = "show version"
+peak_threads = 0
+
+
+def track_threads() -> None:
+    global peak_threads
+    peak_threads = max(peak_threads, threading.active_count())
+
+
+def serve(hostname: str, ports: "multiprocessing.Queue[int]", stop) -> None:
+    """Run a FakeSSHServer in its own process (the client and the servers don't share
+    the GIL, the 1000 server side transports would otherwise slow down the client)."""
+    server = FakeSSHServer(hostname=hostname)
+    server.start()
+    ports.put(server.port)
+    stop.wait()
+    server.stop()
+
+
+def thread_session(device: dict, num_commands: int) -> None:
+    with ConnectHandler(**device) as conn:
+        for _ in range(num_commands):
+            conn.send_command(COMMAND)
+            track_threads()
+
+
+async def async_session(
+    device: dict, num_commands: int, executor: Optional[ThreadPoolExecutor]
+) -> None:
+    async with await AsyncConnectHandler(executor=executor, **device) as conn:
+        for _ in range(num_commands):
+            await conn.send_command(COMMAND)
+            track_threads()
+
+
+def main() -> None:
+    global peak_threads
+    num_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_commands = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    num_servers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    max_workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    servers = [
+        multiprocessing.Process(
+            target=serve, args=(f"cisco{i}", ports, stop), daemon=True
+        )
+        for i in range(num_servers)
+    ]
+    for server in servers:
+        server.start()
+    server_ports = [ports.get(timeout=30) for _ in servers]
+    devices = [
+        {
+            "device_type": "cisco_ios",
+            "host": "127.0.0.1",
+            "port": server_ports[i % num_servers],
+            "username": "admin",
+            "password": "admin",
+            "conn_timeout": 60,
+            "banner_timeout": 60,
+            "auth_timeout": 60,
+        }
+        for i in range(num_sessions)
+    ]
+
+    try:
+        peak_threads = 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=num_sessions) as executor:
+            futures = [
+                executor.submit(thread_session, device, num_commands)
+                for device in devices
+            ]
+            thread_errors = [future.exception() for future in futures]
+        thread_time, thread_peak = time.perf_counter() - start, peak_threads
+
+        async def run_all(executor: Optional[ThreadPoolExecutor]) -> List[object]:
+            return await asyncio.gather(
+                *(async_session(device, num_commands, executor) for device in devices),
+                return_exceptions=True,
+            )
+
+        peak_threads = 0
+        start = time.perf_counter()
+        if max_workers:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                async_errors = asyncio.run(run_all(executor))
+        else:
+            async_errors = asyncio.run(run_all(None))
+        async_time, async_peak = time.perf_counter() - start, peak_threads
+    finally:
+        stop.set()
+        for server in servers:
+            server.join(timeout=10)
+
+    print(f"sessions: {num_sessions}  commands/session: {num_commands}")
+    print("(peak threads: client process, including its Paramiko transport threads)")
+    for name, elapsed, errors, peak in (
+        ("ThreadPoolExecutor: ", thread_time, thread_errors, thread_peak),
+        ("AsyncConnectHandler:", async_time, async_errors, async_peak),
+    ):
+        # Sessions that failed (i.e. connection errors under load) aren't counted
+        failed = collections.Counter(
+            type(error).__name__ for error in errors if isinstance(error, Exception)
+        )
+        total = (num_sessions - sum(failed.values())) * num_commands
+        print(
+            f"{name} {elapsed:7.2f}s  {total / elapsed:8.1f} cmds/s"
+            f"  peak threads={peak}  failed sessions={dict(failed)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
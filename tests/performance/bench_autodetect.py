@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Benchmark: SSHDetect default mode vs. fast mode, autodetect_many() across many hosts, and
+repeat runs that use the AutodetectCache.
+
+Devices are emulated by local fake SSH servers (a Cisco IOS-XE like device and a Linux host
+that only answers 'uname -a', i.e. several probe commands are needed).
+
+    cd tests/performance
+    python bench_autodetect.py [num_devices] [--no-default]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from fake_ssh_server import FakeSSHServer
+from netmiko import AutodetectCache
+from netmiko.ssh_autodetect import SSHDetect
+
+
+def main() -> None:
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    num_devices = int(args[0]) if args else 200
+    run_default = "--no-default" not in sys.argv
+
+    cisco = FakeSSHServer()
+    linux = FakeSSHServer(
+        hostname="admin@linux1:~",
+        responses={"uname -a": "Linux linux1 5.15.0-91-generic x86_64 GNU/Linux\n"},
+    )
+    cisco.start()
+    linux.start()
+    base = {"device_type": "autodetect", "host": "127.0.0.1", "username": "admin"}
+    base["password"] = "admin"
+    cisco_device = dict(base, port=cisco.port)
+    linux_device = dict(base, port=linux.port)
+
+    try:
+        for name, device in [("cisco_xe", cisco_device), ("linux", linux_device)]:
+            start = time.perf_counter()
+            result = SSHDetect(fast=True, **device).autodetect()
+            print(
+                f"fast mode    {name:9} {time.perf_counter() - start:7.2f}s  -> {result}"
+            )
+            if run_default and name == "cisco_xe":
+                start = time.perf_counter()
+                result = SSHDetect(**device).autodetect()
+                elapsed = time.perf_counter() - start
+                print(f"default mode {name:9} {elapsed:7.2f}s  -> {result}")
+
+        devices = [cisco_device if i % 2 else linux_device for i in range(num_devices)]
+        start = time.perf_counter()
+        results = SSHDetect.autodetect_many(devices, max_workers=50)
+        elapsed = time.perf_counter() - start
+        errors = sum(isinstance(result, Exception) for result in results)
+        print(
+            f"autodetect_many: {num_devices} devices in {elapsed:.2f}s "
+            f"({num_devices / elapsed:.1f} devices/s, {errors} errors)"
+        )
+
+        # A cache hit still connects (to verify the SSH host key) but sends no probes
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = AutodetectCache(file_name=os.path.join(cache_dir, "cache.db"))
+            for run in ("first run", "cached"):
+                start = time.perf_counter()
+                SSHDetect.autodetect_many(devices, max_workers=50, cache=cache)
+                elapsed = time.perf_counter() - start
+                print(f"autodetect_many with cache ({run}): {elapsed:.2f}s")
+            if run_default:
+                cache.clear()
+                for run in ("first run", "cached"):
+                    start = time.perf_counter()
+                    SSHDetect(cache=cache, **cisco_device).autodetect()
+                    elapsed = time.perf_counter() - start
+                    print(f"default mode cisco_xe with cache ({run}): {elapsed:.2f}s")
+    finally:
+        cisco.stop()
+        linux.stop()
+
+
+if __name__ == "__main__":
+    main()
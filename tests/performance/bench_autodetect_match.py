@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Benchmark: scoring SSH autodetect probe output against SSH_MAPPER_DICT.
+
+Compares searching the output with every pattern of every entry (checking the invalid
+responses again for each entry) with SSH_MAPPER_INDEX, which searches the output once per
+matching entry using a combined pattern per probe command.
+
+    cd tests/performance
+    python bench_autodetect_match.py [repeat]
+"""
+import re
+import sys
+import time
+
+from netmiko.ssh_autodetect import (
+    INVALID_RESPONSES,
+    INVALID_RESPONSE_REGEX,
+    SSH_MAPPER_BASE,
+    SSH_MAPPER_INDEX,
+)
+
+SHOW_VERSION = {
+    "cisco_xe": (
+        "Cisco IOS XE Software, Version 17.03.04a\n"
+        "Cisco IOS Software [Amsterdam], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M)\n"
+        + "Technical Support: http://www.cisco.com/techsupport\n" * 40
+    ),
+    "linux (error)": "-bash: show: command not found\n",
+    "unmatched": "Model number: ABC-123\nSoftware version 1.2.3\n" * 100,
+}
+ENTRIES = [
+    v
+    for _, v in SSH_MAPPER_BASE
+    if v["cmd"] == "show version" and v["dispatch"] == "_autodetect_std"
+]
+
+
+def per_pattern(output: str) -> int:
+    matched = 0
+    for entry in ENTRIES:
+        if any(re.search(p, output, flags=re.I) for p in INVALID_RESPONSES):
+            continue
+        for pattern in entry["search_patterns"]:
+            if re.search(pattern, output, flags=re.I):
+                matched += 1
+                break
+    return matched
+
+
+def indexed(output: str) -> int:
+    if INVALID_RESPONSE_REGEX.search(output):
+        return 0
+    return len(SSH_MAPPER_INDEX["show version"].matches(output))
+
+
+def timed(func, output: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(output)
+        best = min(best, time.perf_counter() - start)
+    return best / repeat * 1e6
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{len(ENTRIES)} 'show version' entries")
+    print(
+        f"{'output':>14} {'matches':>8} {'per pattern':>13} {'index':>10} {'speedup':>8}"
+    )
+    for name, output in SHOW_VERSION.items():
+        assert per_pattern(output) == indexed(output)
+        old = timed(per_pattern, output, repeat)
+        new = timed(indexed, output, repeat)
+        print(
+            f"{name:>14} {indexed(output):>8} {old:>11.1f}us {new:>8.1f}us "
+            f"{old / new:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Benchmark: large config push (ACL) with send_config_set(cmd_verify=True) over a high latency
+link, verifying one line at a time (window=1) versus keeping several lines in flight.
+
+    cd tests/performance
+    python bench_config_window.py [rtt_ms] [num_lines]
+"""
+import sys
+import time
+
+from netmiko import ConnectHandler
+
+from bench_send_command_batch import DelayProxy
+from fake_ssh_server import FakeSSHServer
+
+
+def main() -> None:
+    rtt_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    num_lines = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    config = [
+        f"access-list 101 permit tcp host 10.{i // 256}.{i % 256}.1 any eq 443"
+        for i in range(num_lines)
+    ]
+    server = FakeSSHServer()
+    server.start()
+    proxy = DelayProxy(server.port, rtt_ms / 2000)
+    proxy.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": proxy.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    kwargs = {
+        "enter_config_mode": False,
+        "exit_config_mode": False,
+        "error_pattern": r"% Invalid input",
+        "read_timeout": 60,
+    }
+    try:
+        with ConnectHandler(**device) as conn:
+            print(f"RTT {rtt_ms:.0f}ms, {num_lines} lines")
+            print(f"{'window':>8} {'time':>8} {'lines/s':>9}")
+            expected = None
+            for window in (1, 8, 32, 128):
+                start = time.perf_counter()
+                output = conn.send_config_set(config, window=window, **kwargs)
+                elapsed = time.perf_counter() - start
+                if expected is None:
+                    expected = output
+                assert output == expected
+                print(f"{window:>8} {elapsed:>7.2f}s {num_lines / elapsed:>9.0f}")
+    finally:
+        proxy.stop()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Benchmark: short jobs against the same device with and without ConnectionPool.
+
+    cd tests/performance
+    python bench_connection_pool.py [num_jobs]
+"""
+import sys
+import time
+
+from netmiko import ConnectHandler, ConnectionPool
+
+from fake_ssh_server import FakeSSHServer
+
+
+def main() -> None:
+    num_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    server = FakeSSHServer()
+    server.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": server.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        start = time.perf_counter()
+        for _ in range(num_jobs):
+            with ConnectHandler(**device) as conn:
+                conn.send_command("show version")
+        no_pool = (time.perf_counter() - start) / num_jobs
+
+        with ConnectionPool() as pool:
+            start = time.perf_counter()
+            for _ in range(num_jobs):
+                with pool.lease(**device) as conn:
+                    conn.send_command("show version")
+            pooled = (time.perf_counter() - start) / num_jobs
+            stats = pool.stats
+    finally:
+        server.stop()
+
+    print(f"jobs:                {num_jobs}")
+    print(f"ConnectHandler/job:  {no_pool * 1000:.1f} ms")
+    print(f"ConnectionPool/job:  {pooled * 1000:.1f} ms  {stats}")
+    print(f"speedup:             {no_pool / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmark: MD5 of a local image staged to many devices (FileTransfer.file_md5).
+
+Compares the old 512 byte read loop (once per transfer) with file_digest(): large block reads
+and a digest cache (the image is hashed once).
+
+    cd tests/performance
+    python bench_file_digest.py [image_mb] [num_devices]
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+from netmiko import file_digest as file_digest_module
+from netmiko.file_digest import file_digest
+
+
+def md5_512(file_name: str) -> str:
+    file_hash = hashlib.md5()
+    with open(file_name, "rb") as f:
+        while True:
+            file_contents = f.read(512)
+            if not file_contents:
+                break
+            file_hash.update(file_contents)
+    return file_hash.hexdigest()
+
+
+def main() -> None:
+    image_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    num_devices = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = os.path.join(tmp_dir, "image.bin")
+        with open(file_name, "wb") as f:
+            for _ in range(image_mb):
+                f.write(os.urandom(1024 * 1024))
+        old = time.time() - 60
+        os.utime(file_name, (old, old))
+
+        start = time.perf_counter()
+        expected = md5_512(file_name)
+        per_file_old = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert file_digest_module.hash_file(file_name) == expected
+        per_file_new = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(num_devices):
+            assert file_digest(file_name) == expected
+        cached = time.perf_counter() - start
+
+        print(f"{image_mb}MB image, {num_devices} devices")
+        print(f"  512 byte reads, one hash:      {per_file_old:8.2f}s")
+        print(f"  1MB block reads, one hash:     {per_file_new:8.2f}s")
+        print(
+            f"  512 byte reads, every device:  {per_file_old * num_devices:8.1f}s (est.)"
+        )
+        print(f"  file_digest(), every device:   {cached:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Benchmark: staging an image on many devices, a file_transfer() loop versus file_transfer_many().
+
+Each device is a fake SSH server (flash: emulation) reached through a latency proxy. The image
+is staged again afterwards (already verified, nothing is transferred) and with a total
+bandwidth cap.
+
+    cd tests/performance
+    python bench_file_transfer_many.py [num_devices] [image_mb] [rtt_ms]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from netmiko import ConnectHandler, file_transfer, file_transfer_many
+
+from bench_send_command_batch import DelayProxy
+from fake_ssh_server import FakeSSHServer
+
+
+def main() -> None:
+    num_devices = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    image_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    rtt_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    servers = [FakeSSHServer() for _ in range(num_devices)]
+    proxies = [DelayProxy(server.port, rtt_ms / 2000) for server in servers]
+    for server, proxy in zip(servers, proxies):
+        server.start()
+        proxy.start()
+    devices = [
+        {
+            "device_type": "cisco_ios",
+            "host": "127.0.0.1",
+            "port": proxy.port,
+            "username": "admin",
+            "password": "admin",
+        }
+        for proxy in proxies
+    ]
+    kwargs = {"dest_file": "image.bin", "file_system": "flash:"}
+
+    def clear_flash() -> None:
+        for server in servers:
+            server.files.clear()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_file = os.path.join(tmp_dir, "image.bin")
+            with open(source_file, "wb") as f:
+                f.write(os.urandom(image_mb * 1024 * 1024))
+            old = time.time() - 60
+            os.utime(source_file, (old, old))
+
+            print(f"{num_devices} devices, {image_mb}MB image, RTT {rtt_ms:.0f}ms")
+            start = time.perf_counter()
+            for device in devices:
+                with ConnectHandler(**device) as conn:
+                    result = file_transfer(conn, source_file=source_file, **kwargs)
+                    assert result["file_verified"]
+            print(
+                f"  file_transfer() loop:              {time.perf_counter() - start:7.2f}s"
+            )
+
+            for max_workers in (4, 16):
+                clear_flash()
+                start = time.perf_counter()
+                results = file_transfer_many(
+                    devices, source_file, max_workers=max_workers, **kwargs
+                )
+                elapsed = time.perf_counter() - start
+                assert all(r.ok and r.file_transferred for r in results)
+                print(
+                    f"  file_transfer_many(max_workers={max_workers:<2}): {elapsed:7.2f}s"
+                )
+
+            start = time.perf_counter()
+            results = file_transfer_many(devices, source_file, max_workers=16, **kwargs)
+            elapsed = time.perf_counter() - start
+            assert all(r.file_verified and not r.file_transferred for r in results)
+            print(f"  already staged (verify only):      {elapsed:7.2f}s")
+
+            clear_flash()
+            total_bandwidth = num_devices * image_mb * 1024 * 1024 / 4
+            start = time.perf_counter()
+            results = file_transfer_many(
+                devices,
+                source_file,
+                max_workers=16,
+                total_bandwidth=total_bandwidth,
+                **kwargs,
+            )
+            elapsed = time.perf_counter() - start
+            assert all(r.ok for r in results)
+            print(
+                f"  total_bandwidth={total_bandwidth / 1024 ** 2:.0f}MB/s (>= 4s):  "
+                f"{elapsed:7.2f}s"
+            )
+    finally:
+        for server, proxy in zip(servers, proxies):
+            proxy.stop()
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Benchmark: per-read overhead of the debug logging in read_channel()/write_channel().
+
+Each read returns one 4 KB block of output from an in-memory channel (so the time is the
+Netmiko overhead, not I/O). Three configurations are compared:
+
+    disabled   - netmiko logger at WARNING (the default for most applications)
+    filtered   - netmiko logger at DEBUG, but the only handler is at WARNING
+    enabled    - DEBUG records written to a (discarded) stream
+
+    cd tests/performance
+    python bench_logging_overhead.py [num_reads]
+"""
+import logging
+import sys
+import time
+
+from netmiko import ConnectHandler, log
+
+BLOCK = "GigabitEthernet0/1   10.1.1.1   YES NVRAM  up   up\n" * 80
+
+
+class NullStream:
+    def write(self, data: str) -> int:
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class BlockChannel:
+    def read_channel(self) -> str:
+        return BLOCK
+
+    def write_channel(self, out_data: str) -> None:
+        pass
+
+
+def run(conn, num_reads: int, repeat: int = 5) -> float:
+    """Best of 'repeat' runs (usec per write_channel() + read_channel())."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(num_reads):
+            conn.write_channel("\n")
+            conn.read_channel()
+        best = min(best, time.perf_counter() - start)
+    return best / num_reads * 1e6
+
+
+def main() -> None:
+    num_reads = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    conn = ConnectHandler(
+        host="testhost",
+        device_type="cisco_ios",
+        password="Cisco123!",
+        secret="Cisco123!enable",
+        auto_connect=False,
+    )
+    conn.channel = BlockChannel()
+
+    handler = logging.StreamHandler(NullStream())
+    log.addHandler(handler)
+    try:
+        results = {}
+        log.setLevel(logging.WARNING)
+        results["disabled"] = run(conn, num_reads)
+        log.setLevel(logging.DEBUG)
+        handler.setLevel(logging.WARNING)
+        results["filtered"] = run(conn, num_reads)
+        handler.setLevel(logging.DEBUG)
+        results["enabled"] = run(conn, num_reads)
+    finally:
+        log.removeHandler(handler)
+        log.setLevel(logging.NOTSET)
+        del conn.channel
+        conn.disconnect()
+
+    print(f"reads: {num_reads}  block: {len(BLOCK)} chars")
+    for name, usec in results.items():
+        print(f"{name:9} {usec:8.2f} usec per read+write")
+
+
+if __name__ == "__main__":
+    main()
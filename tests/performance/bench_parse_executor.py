@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Benchmark: bulk collection with TextFSM parsing inline in send_command() versus
+send_command_future() with the parsing in a ProcessPoolExecutor.
+
+    cd tests/performance
+    python bench_parse_executor.py [num_sessions] [commands_per_session] [num_interfaces]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from netmiko import ConnectHandler
+
+from fake_ssh_server import FakeSSHServer
+
+COMMAND = "show ip interface brief"
+
+
+def show_ip_int_brief(num_interfaces: int) -> str:
+    output = "Interface              IP-Address      OK? Method Status                Protocol\n"
+    for i in range(num_interfaces):
+        output += (
+            f"GigabitEthernet0/{i:<8} 10.{i // 250}.{i % 250}.1      YES NVRAM  up"
+            "                    up\n"
+        )
+    return output
+
+
+def inline_session(device: dict, num_commands: int) -> list:
+    with ConnectHandler(**device) as conn:
+        return [
+            conn.send_command(COMMAND, use_textfsm=True) for _ in range(num_commands)
+        ]
+
+
+def future_session(device: dict, num_commands: int, executor) -> list:
+    with ConnectHandler(**device) as conn:
+        return [
+            conn.send_command_future(COMMAND, parse_executor=executor, use_textfsm=True)
+            for _ in range(num_commands)
+        ]
+
+
+def main() -> None:
+    num_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    num_commands = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    num_interfaces = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+
+    server = FakeSSHServer(responses={COMMAND: show_ip_int_brief(num_interfaces)})
+    server.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": server.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=num_sessions) as threads:
+            results = list(
+                threads.map(
+                    inline_session,
+                    [device] * num_sessions,
+                    [num_commands] * num_sessions,
+                )
+            )
+        inline = time.perf_counter() - start
+        assert all(len(r[0]) == num_interfaces for r in results)
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as processes:
+            # Start the worker processes (and load the TextFSM index) up front
+            processes.submit(time.sleep, 0).result()
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=num_sessions) as threads:
+                futures = list(
+                    threads.map(
+                        future_session,
+                        [device] * num_sessions,
+                        [num_commands] * num_sessions,
+                        [processes] * num_sessions,
+                    )
+                )
+            sessions_done = time.perf_counter() - start
+            results = [[f.result() for f in session] for session in futures]
+            deferred = time.perf_counter() - start
+        assert all(len(r[0]) == num_interfaces for r in results)
+    finally:
+        server.stop()
+
+    print(
+        f"sessions: {num_sessions}  commands/session: {num_commands}  "
+        f"interfaces: {num_interfaces}  cpus: {os.cpu_count()}"
+    )
+    print(f"inline parsing:           {inline:6.2f}s")
+    print(
+        f"send_command_future():    {deferred:6.2f}s "
+        f"(sessions closed after {sessions_done:.2f}s)"
+    )
+    print(f"speedup:                  {inline / deferred:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
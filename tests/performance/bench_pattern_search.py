@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Benchmark: searching for the trailing prompt in a growing output buffer.
+
+Compares re-searching the entire accumulated output after every read (the old
+send_command behavior) with PatternSearch, which only scans the newly arrived
+data plus an overlap window.
+
+    cd tests/performance
+    python bench_pattern_search.py [size_mb ...]
+"""
+import re
+import sys
+import time
+
+from netmiko.pattern_search import PatternSearch
+
+PROMPT_PATTERN = re.escape("cisco1#")
+CHUNK_SIZE = 65535
+LINE = " 10.1.1.0/24  via 192.168.1.1, GigabitEthernet0/0/1, 1w2d\n"
+
+
+def gen_chunks(size_mb: int):
+    data = LINE * (size_mb * 1024 * 1024 // len(LINE)) + "cisco1#"
+    return [data[i : i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE)]
+
+
+def full_rescan(chunks) -> float:
+    start = time.perf_counter()
+    output = ""
+    for chunk in chunks:
+        output += chunk
+        if re.search(PROMPT_PATTERN, output):
+            break
+    else:
+        raise ValueError("Pattern not found")
+    return time.perf_counter() - start
+
+
+def incremental(chunks) -> float:
+    start = time.perf_counter()
+    output = ""
+    pattern_search = PatternSearch(PROMPT_PATTERN)
+    for chunk in chunks:
+        output += chunk
+        if pattern_search.search(output):
+            break
+    else:
+        raise ValueError("Pattern not found")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or [1, 10, 50]
+    print(f"{'size':>8} {'full re-scan':>14} {'incremental':>14} {'speedup':>9}")
+    for size_mb in sizes:
+        chunks = gen_chunks(size_mb)
+        old = full_rescan(chunks)
+        new = incremental(chunks)
+        print(f"{size_mb:>6}MB {old:>13.3f}s {new:>13.3f}s {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Microbenchmark: per-command latency of send_command() against a local fake SSH server.
+
+Compares the event-driven channel reads (wait_for_data blocks on the Paramiko
+channel) against the legacy fixed-sleep polling behavior.
+
+    cd tests/performance
+    python bench_read_latency.py [num_commands]
+"""
+import sys
+import time
+
+from netmiko import ConnectHandler
+from netmiko.base_connection import BaseConnection
+
+from fake_ssh_server import FakeSSHServer
+
+
+def legacy_wait_for_data(self: BaseConnection, timeout: float) -> bool:
+    """Emulate the old fixed polling delay of the send_command() read loop."""
+    time.sleep(0.025)
+    return True
+
+
+def run(device: dict, num_commands: int) -> float:
+    with ConnectHandler(**device) as conn:
+        start = time.perf_counter()
+        for _ in range(num_commands):
+            conn.send_command("show version", auto_find_prompt=False)
+        return (time.perf_counter() - start) / num_commands
+
+
+def main() -> None:
+    num_commands = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    server = FakeSSHServer()
+    server.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": server.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        event_driven = run(device, num_commands)
+
+        original = BaseConnection.wait_for_data
+        BaseConnection.wait_for_data = legacy_wait_for_data  # type: ignore
+        try:
+            polling = run(device, num_commands)
+        finally:
+            BaseConnection.wait_for_data = original  # type: ignore
+    finally:
+        server.stop()
+
+    print(f"commands per run:      {num_commands}")
+    print(f"fixed-sleep polling:   {polling * 1000:.2f} ms/command")
+    print(f"event-driven reads:    {event_driven * 1000:.2f} ms/command")
+    print(f"speedup:               {polling / event_driven:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
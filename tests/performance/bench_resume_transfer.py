@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Benchmark: an image transfer interrupted at 90% (the fake SSH server drops the connection) and
+retried by file_transfer_many(), starting over (SCP) versus resume=True (SFTP).
+
+The link is emulated with a latency proxy and a device_bandwidth cap.
+
+    cd tests/performance
+    python bench_resume_transfer.py [image_mb] [bandwidth_mbps] [rtt_ms]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from netmiko import file_transfer_many
+
+from bench_send_command_batch import DelayProxy
+from fake_ssh_server import FakeSSHServer
+
+
+def main() -> None:
+    image_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    bandwidth_mbps = float(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rtt_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    image_size = image_mb * 1024 * 1024
+    server = FakeSSHServer()
+    server.start()
+    proxy = DelayProxy(server.port, rtt_ms / 2000)
+    proxy.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": proxy.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_file = os.path.join(tmp_dir, "image.bin")
+            with open(source_file, "wb") as f:
+                f.write(os.urandom(image_size))
+            old = time.time() - 60
+            os.utime(source_file, (old, old))
+
+            print(
+                f"{image_mb}MB image, {bandwidth_mbps:.0f}Mbps, RTT {rtt_ms:.0f}ms, "
+                "connection dropped at 90%"
+            )
+            for resume in (False, True):
+                server.files.clear()
+                server.received = 0
+                server.drop_after = int(image_size * 0.9)
+                start = time.perf_counter()
+                results = file_transfer_many(
+                    [device],
+                    source_file,
+                    dest_file="image.bin",
+                    file_system="flash:",
+                    retries=1,
+                    retry_delay=0,
+                    device_bandwidth=bandwidth_mbps * 1e6 / 8,
+                    resume=resume,
+                    overwrite_file=True,
+                )
+                elapsed = time.perf_counter() - start
+                result = results[0]
+                assert result.ok and result.file_verified and result.attempts == 2
+                with open(source_file, "rb") as f:
+                    assert server.files["image.bin"] == f.read()
+                name = "resume (SFTP)" if resume else "start over (SCP)"
+                print(
+                    f"  {name:<17} {elapsed:7.2f}s  "
+                    f"{server.received / 1024 ** 2:6.1f}MB sent in total"
+                )
+    finally:
+        proxy.stop()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Benchmark: file_transfer() with a separate SSH connection for SCP (a second login) versus
+reuse_transport=True (SCP channel on the control connection's SSH transport).
+
+The fake SSH server emulates a slow (TACACS) authentication and is reached through a latency
+proxy.
+
+    cd tests/performance
+    python bench_scp_reuse_transport.py [num_files] [auth_delay_ms] [rtt_ms]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from netmiko import ConnectHandler, file_transfer
+
+from bench_send_command_batch import DelayProxy
+from fake_ssh_server import FakeSSHServer
+
+
+class TimeSaved(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def main() -> None:
+    num_files = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    auth_delay_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rtt_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    server = FakeSSHServer(auth_delay=auth_delay_ms / 1000)
+    server.start()
+    proxy = DelayProxy(server.port, rtt_ms / 2000)
+    proxy.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": proxy.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    handler = TimeSaved()
+    logging.getLogger("netmiko").addHandler(handler)
+    logging.getLogger("netmiko").setLevel(logging.INFO)
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = []
+            for i in range(num_files):
+                file_name = os.path.join(tmp_dir, f"config{i}.txt")
+                with open(file_name, "wb") as f:
+                    f.write(os.urandom(64 * 1024))
+                files.append(file_name)
+
+            print(
+                f"{num_files} x 64KB files, auth {auth_delay_ms:.0f}ms, "
+                f"RTT {rtt_ms:.0f}ms"
+            )
+            with ConnectHandler(**device) as conn:
+                for reuse_transport in (False, True):
+                    server.files.clear()
+                    handler.messages.clear()
+                    start = time.perf_counter()
+                    for file_name in files:
+                        result = file_transfer(
+                            conn,
+                            source_file=file_name,
+                            dest_file=os.path.basename(file_name),
+                            file_system="flash:",
+                            reuse_transport=reuse_transport,
+                        )
+                        assert result["file_transferred"] and result["file_verified"]
+                    elapsed = time.perf_counter() - start
+                    print(
+                        f"  reuse_transport={reuse_transport!s:<5} {elapsed:7.2f}s "
+                        f"({elapsed / num_files * 1000:.0f}ms per file)"
+                    )
+                    for message in handler.messages[:1]:
+                        print(f"    {message}")
+    finally:
+        proxy.stop()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Benchmark: sending a list of show commands over a high latency link, one command at a time
+(send_command, send_command_batch with window=1) versus pipelined (send_command_batch).
+
+The fake SSH server is reached through a local TCP proxy that delays the data by half of the
+round-trip time in each direction.
+
+    cd tests/performance
+    python bench_send_command_batch.py [rtt_ms] [num_commands]
+"""
+import queue
+import socket
+import sys
+import threading
+import time
+
+from netmiko import ConnectHandler
+
+from fake_ssh_server import FakeSSHServer
+
+
+class DelayProxy:
+    """TCP proxy that delays the data in each direction by one_way_delay seconds."""
+
+    def __init__(self, target_port: int, one_way_delay: float) -> None:
+        self.target_port = target_port
+        self.delay = one_way_delay
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(16)
+        self.port = self.sock.getsockname()[1]
+
+    def start(self) -> None:
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def stop(self) -> None:
+        self.sock.close()
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            server = socket.create_connection(("127.0.0.1", self.target_port))
+            for src, dst in ((client, server), (server, client)):
+                pipe: "queue.Queue" = queue.Queue()
+                threading.Thread(
+                    target=self._read, args=(src, pipe), daemon=True
+                ).start()
+                threading.Thread(
+                    target=self._write, args=(dst, pipe), daemon=True
+                ).start()
+
+    def _read(self, src: socket.socket, pipe: "queue.Queue") -> None:
+        while True:
+            try:
+                data = src.recv(65536)
+            except OSError:
+                data = b""
+            pipe.put((time.perf_counter() + self.delay, data))
+            if not data:
+                return
+
+    def _write(self, dst: socket.socket, pipe: "queue.Queue") -> None:
+        while True:
+            due, data = pipe.get()
+            time.sleep(max(due - time.perf_counter(), 0))
+            if not data:
+                # shutdown() (not just close()) so that the other end sees the connection close
+                try:
+                    dst.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                dst.close()
+                return
+            try:
+                dst.sendall(data)
+            except OSError:
+                return
+
+
+def main() -> None:
+    rtt_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 100
+    num_commands = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    commands = [f"show interface Gi{i}" for i in range(num_commands)]
+    responses = {
+        cmd: f"{cmd[5:]} is up, line protocol is up\n  Hardware is CSR vNIC\n"
+        for cmd in commands
+    }
+    server = FakeSSHServer(responses=responses)
+    server.start()
+    proxy = DelayProxy(server.port, rtt_ms / 2000)
+    proxy.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": proxy.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        with ConnectHandler(**device) as conn:
+            start = time.perf_counter()
+            expected = [conn.send_command(cmd) for cmd in commands]
+            serial = time.perf_counter() - start
+            print(f"RTT {rtt_ms:.0f}ms, {num_commands} commands")
+            print(f"{'mode':>22} {'time':>8} {'per command':>12}")
+            print(
+                f"{'send_command':>22} {serial:>7.2f}s "
+                f"{serial / num_commands * 1000:>10.1f}ms"
+            )
+            for window in (1, 4, None):
+                start = time.perf_counter()
+                results = conn.send_command_batch(commands, window=window)
+                elapsed = time.perf_counter() - start
+                assert results == expected
+                name = f"batch window={window or 'all'}"
+                print(
+                    f"{name:>22} {elapsed:>7.2f}s "
+                    f"{elapsed / num_commands * 1000:>10.1f}ms"
+                )
+    finally:
+        proxy.stop()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Benchmark: large output ('show tech-support') with send_command() versus
+send_command_stream() writing the chunks to a file as they arrive.
+
+Reports the time to the first data, the total time, and the peak Python memory
+allocated (tracemalloc) during each call.
+
+    cd tests/performance
+    python bench_send_command_stream.py [output_mb]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from netmiko import ConnectHandler
+
+from fake_ssh_server import FakeSSHServer
+
+COMMAND = "show tech-support"
+
+
+def show_tech(size_mb: int) -> str:
+    line = "interface GigabitEthernet0/0/0 is up, line protocol is up (connected)\n"
+    return line * (size_mb * 1024 * 1024 // len(line))
+
+
+def main() -> None:
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    expected = show_tech(size_mb)
+    server = FakeSSHServer(responses={COMMAND: expected})
+    server.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": server.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        with ConnectHandler(**device) as conn, tempfile.TemporaryDirectory() as tmp_dir:
+            # Let the fake server build (and cache) its reply outside of the measurements
+            conn.send_command(COMMAND, read_timeout=300)
+            tracemalloc.start()
+            start = time.perf_counter()
+            output = conn.send_command(COMMAND, read_timeout=300)
+            with open(os.path.join(tmp_dir, "full.txt"), "w") as f:
+                f.write(output)
+            full_time = time.perf_counter() - start
+            full_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert output.strip() == expected.strip()
+            del output
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            first_chunk = None
+            stream_file = os.path.join(tmp_dir, "stream.txt")
+            with open(stream_file, "w") as f:
+                for chunk in conn.send_command_stream(COMMAND, read_timeout=300):
+                    if first_chunk is None:
+                        first_chunk = time.perf_counter() - start
+                    f.write(chunk)
+            stream_time = time.perf_counter() - start
+            stream_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            with open(stream_file) as f:
+                assert f.read().strip() == expected.strip()
+    finally:
+        server.stop()
+
+    assert first_chunk is not None
+    print(f"output size:            {size_mb} MB")
+    print(
+        f"send_command():         first data {full_time:6.2f}s  total {full_time:6.2f}s"
+        f"  peak {full_peak / 1e6:7.1f} MB"
+    )
+    print(
+        f"send_command_stream():  first data {first_chunk:6.2f}s  total {stream_time:6.2f}s"
+        f"  peak {stream_peak / 1e6:7.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
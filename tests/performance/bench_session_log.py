@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Benchmark: SessionLog with no_log redaction for a large output.
+
+Compares the previous behavior (stage everything in a StringIO until flush(), then
+str.replace() per no_log entry) with the streaming redaction.
+
+    cd tests/performance
+    python bench_session_log.py [output_mb]
+"""
+import io
+import sys
+import time
+import tracemalloc
+
+from netmiko.session_log import SessionLog
+
+NO_LOG = {"password": "Cisco123!", "secret": "Enable456!", "username": "admin"}
+CHUNK_SIZE = 65536
+
+
+class LegacySessionLog(SessionLog):
+    """Emulate the staging buffer + replace() implementation."""
+
+    def write(self, data: str) -> None:
+        if len(data) > 0:
+            self.slog_buffer.write(data)
+
+    def flush(self) -> None:
+        assert self.session_log is not None
+        data = self._read_buffer()
+        for hidden_data in self.no_log.values():
+            data = data.replace(hidden_data, "********")
+        self.session_log.write(data.encode())
+        self.session_log.flush()
+
+
+class NullIO(io.BufferedIOBase):
+    """Discard the data (so the file contents don't count against memory)."""
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        return len(data)
+
+
+def write_all(slog: SessionLog, data: str) -> None:
+    for i in range(0, len(data), CHUNK_SIZE):
+        slog.write(data[i : i + CHUNK_SIZE])
+    slog.flush()
+
+
+def run(slog_class, data: str) -> tuple:
+    start = time.perf_counter()
+    write_all(slog_class(buffered_io=NullIO(), no_log=NO_LOG), data)
+    elapsed = time.perf_counter() - start
+
+    # Separate run for memory (tracemalloc slows down allocations considerably)
+    tracemalloc.start()
+    write_all(slog_class(buffered_io=NullIO(), no_log=NO_LOG), data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    # One line with no_log entries in every 100 lines
+    block = "username admin privilege 15 secret Enable456!\n" + (
+        " ip address 10.1.1.1 255.255.255.0\n" * 99
+    )
+    data = block * (size_mb * 1024 * 1024 // len(block))
+
+    legacy_time, legacy_peak = run(LegacySessionLog, data)
+    stream_time, stream_peak = run(SessionLog, data)
+
+    print(f"output size:          {size_mb} MB")
+    print(
+        f"staged + replace():   {legacy_time:6.2f}s  peak {legacy_peak / 1e6:7.1f} MB"
+    )
+    print(
+        f"streaming redaction:  {stream_time:6.2f}s  peak {stream_peak / 1e6:7.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
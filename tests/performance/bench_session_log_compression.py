@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Benchmark: time to write a session_log and its size on disk (including the rotated files)
+for plain, gzip, and zstd session logs.
+
+    cd tests/performance
+    python bench_session_log_compression.py [size_mb] [log_dir]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from netmiko.session_log import SessionLog, ZSTD_INSTALLED
+
+NO_LOG = {"password": "Cisco123!"}
+OUTPUT = "".join(
+    f"GigabitEthernet0/{i % 48:<3}  10.{i % 256}.1.1   YES NVRAM  up   up\n"
+    for i in range(200)
+)
+READ_SIZE = 4096
+
+
+def run(file_name: str, size: int) -> tuple:
+    slog = SessionLog(
+        file_name=file_name, no_log=NO_LOG, max_bytes=10 * 1024 * 1024, backup_count=100
+    )
+    slog.open()
+    start = time.perf_counter()
+    written = 0
+    while written < size:
+        for i in range(0, len(OUTPUT), READ_SIZE):
+            slog.write(OUTPUT[i : i + READ_SIZE])
+        # send_command flushes the session_log after every command
+        slog.flush()
+        written += len(OUTPUT)
+    slog.close()
+    elapsed = time.perf_counter() - start
+    directory = os.path.dirname(file_name)
+    on_disk = sum(
+        os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)
+    )
+    return elapsed, on_disk
+
+
+def main() -> None:
+    size = int(sys.argv[1]) * 1024 * 1024 if len(sys.argv) > 1 else 100 * 1024 * 1024
+    base_dir = sys.argv[2] if len(sys.argv) > 2 else None
+
+    suffixes = [".log", ".log.gz"]
+    if ZSTD_INSTALLED:
+        suffixes.append(".log.zst")
+    print(f"session_log data: {size / 1024 / 1024:.0f} MB")
+    for suffix in suffixes:
+        with tempfile.TemporaryDirectory(dir=base_dir) as log_dir:
+            elapsed, on_disk = run(os.path.join(log_dir, f"device1{suffix}"), size)
+        print(
+            f"{suffix:9} {elapsed:6.2f}s  {on_disk / 1024 / 1024:8.2f} MB on disk  "
+            f"({size / max(on_disk, 1):5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Benchmark: many sessions writing session logs to disk, flushing after every command
+(as send_command does), with and without the background SessionLogWriter.
+
+Reports the total time and the time spent in the session threads on logging
+(write + flush), i.e. the time that a session is blocked on the filesystem. With
+--durable, each flush is followed by fsync() (models slow/networked log storage).
+
+    cd tests/performance
+    python bench_session_log_writer.py [--durable] [num_sessions] [commands_per_session] \
+        [log_dir]
+"""
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from netmiko.session_log import SessionLog, SessionLogWriter
+
+NO_LOG = {"password": "Cisco123!"}
+OUTPUT = "GigabitEthernet0/1   10.1.1.1   YES NVRAM  up   up\n" * 200
+READ_SIZE = 4096
+
+
+class DurableFile(io.BufferedWriter):
+    def flush(self) -> None:
+        super().flush()
+        os.fsync(self.fileno())
+
+
+def session(
+    file_name: str, num_commands: int, writer, blocked: list, durable: bool
+) -> None:
+    if durable:
+        raw = DurableFile(io.FileIO(file_name, "w"))
+        slog = SessionLog(buffered_io=raw, no_log=NO_LOG, writer=writer)
+    else:
+        slog = SessionLog(file_name=file_name, no_log=NO_LOG, writer=writer)
+        slog.open()
+    spent = 0.0
+    for _ in range(num_commands):
+        start = time.perf_counter()
+        for i in range(0, len(OUTPUT), READ_SIZE):
+            slog.write(OUTPUT[i : i + READ_SIZE])
+        slog.flush()
+        spent += time.perf_counter() - start
+    slog.close()
+    if durable:
+        raw.close()
+    blocked.append(spent)
+
+
+def run(
+    log_dir: str, num_sessions: int, num_commands: int, writer, durable: bool
+) -> tuple:
+    blocked: list = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_sessions) as executor:
+        for i in range(num_sessions):
+            executor.submit(
+                session,
+                f"{log_dir}/session{i}.log",
+                num_commands,
+                writer,
+                blocked,
+                durable,
+            )
+    return time.perf_counter() - start, sum(blocked) / len(blocked)
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    durable = "--durable" in args
+    args = [arg for arg in args if arg != "--durable"]
+    num_sessions = int(args[0]) if len(args) > 0 else 200
+    num_commands = int(args[1]) if len(args) > 1 else 50
+    base_dir = args[2] if len(args) > 2 else None
+    threading.stack_size(512 * 1024)
+
+    with tempfile.TemporaryDirectory(dir=base_dir) as log_dir:
+        direct = run(log_dir, num_sessions, num_commands, None, durable)
+        writer = SessionLogWriter(flush_interval=0.5)
+        background = run(log_dir, num_sessions, num_commands, writer, durable)
+        writer.close()
+
+    print(
+        f"sessions: {num_sessions}  commands/session: {num_commands}  "
+        f"durable: {durable}"
+    )
+    print(
+        f"write + flush per command:  total {direct[0]:6.2f}s  "
+        f"logging time/session {direct[1]:6.3f}s"
+    )
+    print(
+        f"SessionLogWriter:           total {background[0]:6.2f}s  "
+        f"logging time/session {background[1]:6.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
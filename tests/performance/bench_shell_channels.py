@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""
+Benchmark: setup time of additional sessions to one device; fresh connections
+(ConnectHandler) versus extra shells over the existing transport (open_shell()).
+
+    cd tests/performance
+    python bench_shell_channels.py [num_sessions]
+"""
+import sys
+import time
+
+from netmiko import ConnectHandler
+
+from fake_ssh_server import FakeSSHServer
+
+
+def main() -> None:
+    num_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    server = FakeSSHServer()
+    server.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": server.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        start = time.perf_counter()
+        conns = [ConnectHandler(**device) for _ in range(num_sessions)]
+        fresh = (time.perf_counter() - start) / num_sessions
+        for conn in conns:
+            conn.disconnect()
+
+        with ConnectHandler(**device) as conn:
+            conn.max_shell_channels = num_sessions + 1
+            start = time.perf_counter()
+            shells = [conn.open_shell() for _ in range(num_sessions)]
+            shared = (time.perf_counter() - start) / num_sessions
+            outputs = [shell.send_command("show version") for shell in shells]
+            assert all("Cisco IOS" in output for output in outputs)
+            for shell in shells:
+                shell.disconnect()
+            # The original session is unaffected by closing its shells
+            assert conn.is_alive()
+    finally:
+        server.stop()
+
+    print(f"sessions:              {num_sessions}")
+    print(f"ConnectHandler:        {fresh * 1000:.1f} ms/session")
+    print(f"open_shell():          {shared * 1000:.1f} ms/session")
+    print(f"speedup:               {fresh / shared:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmark: SNMPDetect.autodetect() host by host vs. SNMPDetect.autodetect_many() against
+local UDP SNMP responder stubs (see fake_snmp_agent.py).
+
+    cd tests/performance
+    python bench_snmp_autodetect.py [num_hosts] [num_sequential]
+"""
+import sys
+import time
+
+from fake_snmp_agent import FakeSNMPAgent
+from netmiko.snmp_autodetect import SNMPDetect
+
+SYS_DESCRS = [
+    "Arista Networks EOS version 4.28.3M running on an Arista DCS-7050",
+    "Cisco IOS Software, C3750E Software (C3750E-UNIVERSALK9-M), Version 15.2(4)E10",
+    "Juniper Networks, Inc. ex4300-48t Ethernet Switch, kernel JUNOS 21.4R3",
+    "Linux server1 5.15.0-91-generic #101-Ubuntu SMP x86_64",
+]
+
+
+def main() -> None:
+    num_hosts = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    num_sequential = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    agents = [FakeSNMPAgent(sys_descr=sys_descr) for sys_descr in SYS_DESCRS]
+    for agent in agents:
+        agent.start()
+    hosts = [
+        {"hostname": "127.0.0.1", "snmp_port": agents[i % len(agents)].port}
+        for i in range(num_hosts)
+    ]
+    snmp_args = {"snmp_version": "v2c", "community": "public"}
+
+    try:
+        start = time.perf_counter()
+        for host in hosts[:num_sequential]:
+            SNMPDetect(**host, **snmp_args).autodetect()  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+        requests = sum(agent.requests for agent in agents)
+        print(
+            f"autodetect() sequential: {num_sequential} hosts in {elapsed:.2f}s "
+            f"({elapsed / num_sequential * 1000:.1f} ms/host, "
+            f"{requests / num_sequential:.1f} requests/host)"
+        )
+
+        for agent in agents:
+            agent.requests = 0
+        start = time.perf_counter()
+        results = SNMPDetect.autodetect_many(hosts, **snmp_args)
+        elapsed = time.perf_counter() - start
+        requests = sum(agent.requests for agent in agents)
+        detected = sum(isinstance(result, str) for result in results)
+        print(
+            f"autodetect_many(): {num_hosts} hosts in {elapsed:.2f}s "
+            f"({num_hosts / elapsed:.0f} hosts/s, {requests / num_hosts:.1f} requests/host, "
+            f"{detected} detected)"
+        )
+    finally:
+        for agent in agents:
+            agent.stop()
+
+
+if __name__ == "__main__":
+    main()
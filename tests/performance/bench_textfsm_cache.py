@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Benchmark: TextFSM parsing through the ntc-templates index with and without the
+TextFSMCache (index lookups and compiled templates).
+
+    cd tests/performance
+    python bench_textfsm_cache.py [num_parses]
+"""
+import os
+import sys
+import time
+
+from textfsm import clitable
+
+from netmiko import utilities
+
+RAW_OUTPUT = """Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet1       10.220.88.22    YES NVRAM  up                    up
+GigabitEthernet2       unassigned      YES NVRAM  administratively down down
+GigabitEthernet3       unassigned      YES NVRAM  administratively down down
+Loopback0              10.1.1.1        YES manual up                    up
+"""
+ATTRS = {"Command": "show ip interface brief", "Platform": "cisco_ios"}
+
+
+def uncached_parse() -> object:
+    """Equivalent to get_structured_data_textfsm() before the cache was added."""
+    template_dir = utilities.get_template_dir()
+    index_file = os.path.join(template_dir, "index")
+    textfsm_obj = clitable.CliTable(index_file, template_dir)
+    textfsm_obj.ParseCmd(RAW_OUTPUT, dict(ATTRS))
+    return utilities.clitable_to_dict(textfsm_obj)
+
+
+def cached_parse() -> object:
+    return utilities.get_structured_data_textfsm(
+        RAW_OUTPUT, platform=ATTRS["Platform"], command=ATTRS["Command"]
+    )
+
+
+def run(func, num_parses: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_parses):
+        result = func()
+    assert isinstance(result, list) and len(result) == 4
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    num_parses = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    uncached = run(uncached_parse, num_parses)
+    cached = run(cached_parse, num_parses)
+
+    print(f"parses:      {num_parses}")
+    print(f"uncached:    {uncached:.2f}s  ({uncached / num_parses * 1e6:.0f} us/parse)")
+    print(f"cached:      {cached:.2f}s  ({cached / num_parses * 1e6:.0f} us/parse)")
+    print(f"speedup:     {uncached / cached:.1f}x")
+    print(f"cache stats: {utilities.TEXTFSM_CACHE.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Benchmark: multi-file staging job (transfer the files, then run the job again to check that
+they are in place) with and without a transfer_session() (cached 'dir' listings and remote
+MD5s).
+
+The fake SSH server is reached through a latency proxy and emulates the device CPU cost of
+'verify /md5'.
+
+    cd tests/performance
+    python bench_transfer_session.py [num_files] [file_mb] [rtt_ms] [md5_mbps]
+"""
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+from netmiko import ConnectHandler, file_transfer, transfer_session
+
+from bench_send_command_batch import DelayProxy
+from fake_ssh_server import FakeSSHServer
+
+
+def main() -> None:
+    num_files = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    file_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    rtt_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    md5_mbps = float(sys.argv[4]) if len(sys.argv) > 4 else 50
+    server = FakeSSHServer(md5_rate=md5_mbps * 1024 * 1024)
+    server.start()
+    proxy = DelayProxy(server.port, rtt_ms / 2000)
+    proxy.start()
+    device = {
+        "device_type": "cisco_ios",
+        "host": "127.0.0.1",
+        "port": proxy.port,
+        "username": "admin",
+        "password": "admin",
+    }
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = []
+            for i in range(num_files):
+                file_name = os.path.join(tmp_dir, f"image{i}.bin")
+                with open(file_name, "wb") as f:
+                    f.write(os.urandom(file_mb * 1024 * 1024))
+                old = time.time() - 60
+                os.utime(file_name, (old, old))
+                files.append(file_name)
+
+            print(
+                f"{num_files} x {file_mb}MB files, RTT {rtt_ms:.0f}ms, "
+                f"verify /md5 at {md5_mbps:.0f}MB/s"
+            )
+            print(f"{'':>16} {'stage':>16} {'run again':>16}")
+            with ConnectHandler(**device) as conn:
+                for session in (False, True):
+                    server.files.clear()
+                    row = []
+                    with (
+                        transfer_session(conn) if session else contextlib.nullcontext()
+                    ):
+                        for expect_transferred in (True, False):
+                            server.commands.clear()
+                            start = time.perf_counter()
+                            for file_name in files:
+                                result = file_transfer(
+                                    conn,
+                                    source_file=file_name,
+                                    dest_file=os.path.basename(file_name),
+                                    file_system="flash:",
+                                )
+                                assert result["file_verified"]
+                                assert result["file_transferred"] == expect_transferred
+                            elapsed = time.perf_counter() - start
+                            row.append(
+                                f"{elapsed:6.2f}s {len(server.commands):>3} cmds"
+                            )
+                    name = "transfer_session" if session else "file_transfer"
+                    print(f"{name:>16} {row[0]:>16} {row[1]:>16}")
+    finally:
+        proxy.stop()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Minimal SNMPv2c GET responder (UDP) used by the SNMP autodetect benchmark.
+
+Responds to every GET with the sysDescr of the agent (other OIDs return noSuchObject).
+
+Usage:
+
+    agent = FakeSNMPAgent(sys_descr="Arista Networks EOS version 4.28.3M")
+    agent.start()
+    SNMPDetect("127.0.0.1", snmp_port=agent.port, snmp_version="v2c", community="public")
+    ...
+    agent.stop()
+"""
+
+from typing import Optional
+import socket
+import threading
+
+from pyasn1.codec.ber import decoder, encoder
+from pysnmp.proto import api, rfc1905
+
+SYS_DESCR_OID = "1.3.6.1.2.1.1.1.0"
+
+_P_MOD = api.protoModules[api.protoVersion2c]
+
+
+class FakeSNMPAgent:
+    def __init__(
+        self,
+        sys_descr: str = "Arista Networks EOS version 4.28.3M running on an Arista DCS-7050",
+        listen_ip: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.sys_descr = sys_descr
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        self.sock.bind((listen_ip, port))
+        self.port = self.sock.getsockname()[1]
+        self.requests = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                data, address = self.sock.recvfrom(65535)
+            except OSError:
+                return
+            try:
+                reply = self._reply(data)
+            except Exception:
+                continue
+            self.requests += 1
+            try:
+                self.sock.sendto(reply, address)
+            except OSError:
+                return
+
+    def _reply(self, data: bytes) -> bytes:
+        request, _ = decoder.decode(data, asn1Spec=_P_MOD.Message())
+        request_pdu = _P_MOD.apiMessage.getPDU(request)
+        response = _P_MOD.apiMessage.getResponse(request)
+        response_pdu = _P_MOD.apiMessage.getPDU(response)
+        var_binds = []
+        for oid, _ in _P_MOD.apiPDU.getVarBinds(request_pdu):
+            if str(oid) == SYS_DESCR_OID:
+                var_binds.append((oid, _P_MOD.OctetString(self.sys_descr)))
+            else:
+                var_binds.append((oid, rfc1905.noSuchObject))
+        _P_MOD.apiPDU.setVarBinds(response_pdu, var_binds)
+        return bytes(encoder.encode(response))
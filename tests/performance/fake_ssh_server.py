@@ -0,0 +1,377 @@
+"""
+Minimal Paramiko-based SSH server that emulates a Cisco IOS-like CLI.
+
+Used by the local microbenchmarks (no real network devices required). Every
+connection gets an interactive shell that echoes commands and responds with a
+canned output followed by the prompt.
+
+The server also emulates a 'flash:' file system: files can be uploaded with SCP
+('scp -t' exec requests) or SFTP and the 'dir flash:', 'dir flash:/<file>', and
+'verify /md5 flash:/<file>' commands reflect the uploaded files. Setting drop_after
+to a number of bytes closes the SSH connection during the next upload (i.e. to test
+interrupted transfers).
+
+Usage:
+
+    server = FakeSSHServer(hostname="cisco1")
+    server.start()
+    device = {"device_type": "cisco_ios", "host": "127.0.0.1", "port": server.port,
+              "username": "admin", "password": "admin"}
+    ...
+    server.stop()
+"""
+
+from typing import Dict, List, Optional, Union
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+
+import paramiko
+
+
+SHOW_VERSION = """Cisco IOS XE Software, Version 17.03.04a
+Cisco IOS Software [Amsterdam], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M)
+Technical Support: http://www.cisco.com/techsupport
+Copyright (c) 1986-2021 by Cisco Systems, Inc.
+
+ROM: IOS-XE ROMMON
+cisco1 uptime is 5 weeks, 1 day, 2 hours, 30 minutes
+System image file is "bootflash:packages.conf"
+Configuration register is 0x2102
+"""
+
+DEFAULT_RESPONSES = {
+    "show version": SHOW_VERSION,
+    "show ip int brief": "Interface   IP-Address  OK? Method Status  Protocol\n"
+    "Gi1         10.1.1.1    YES NVRAM  up      up\n",
+}
+
+_HOST_KEY: Optional[paramiko.PKey] = None
+_HOST_KEY_LOCK = threading.Lock()
+
+
+def _host_key() -> paramiko.PKey:
+    """Generating an RSA key is slow so share one host key across all servers."""
+    global _HOST_KEY
+    with _HOST_KEY_LOCK:
+        if _HOST_KEY is None:
+            _HOST_KEY = paramiko.RSAKey.generate(2048)
+        return _HOST_KEY
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    def __init__(self, server: "FakeSSHServer") -> None:
+        self.server = server
+
+    def check_auth_password(self, username: str, password: str) -> int:
+        if self.server.auth_delay:
+            time.sleep(self.server.auth_delay)
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "password"
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, *args, **kwargs) -> bool:  # type: ignore
+        return True
+
+    def check_channel_shell_request(self, channel: paramiko.Channel) -> bool:
+        self.server._channel_request(channel, "shell")
+        return True
+
+    def check_channel_subsystem_request(
+        self, channel: paramiko.Channel, name: str
+    ) -> bool:
+        self.server._channel_request(channel, "subsystem")
+        return super().check_channel_subsystem_request(channel, name)
+
+    def check_channel_exec_request(
+        self, channel: paramiko.Channel, command: bytes
+    ) -> bool:
+        match = re.match(r"scp -t (?:-- )?'?flash:/?([^']+)'?$", command.decode())
+        if not match:
+            return False
+        self.server._channel_request(channel, "exec")
+        threading.Thread(
+            target=self.server._scp_sink, args=(channel, match.group(1)), daemon=True
+        ).start()
+        return True
+
+
+def _flash_name(path: str) -> Optional[str]:
+    match = re.match(r"/?flash:/?(.+)$", path)
+    return match.group(1) if match else None
+
+
+class _FlashHandle(paramiko.SFTPHandle):
+    def __init__(self, server: "FakeSSHServer", name: str, flags: int) -> None:
+        super().__init__(flags)
+        self.server = server
+        self.name = name
+
+    def read(self, offset: int, length: int) -> bytes:
+        return bytes(self.server.files[self.name][offset : offset + length])
+
+    def write(self, offset: int, data: bytes) -> int:
+        contents = self.server.files[self.name]
+        if not isinstance(contents, bytearray):
+            contents = self.server.files[self.name] = bytearray(contents)
+        contents[offset : offset + len(data)] = data
+        self.server._received(len(data))
+        return paramiko.SFTP_OK
+
+    def stat(self) -> paramiko.SFTPAttributes:
+        attr = paramiko.SFTPAttributes()
+        attr.st_size = len(self.server.files[self.name])
+        return attr
+
+
+class _FlashSFTP(paramiko.SFTPServerInterface):
+    """SFTP access to the emulated flash: file system."""
+
+    def __init__(self, server: _ServerInterface, *args, **kwargs) -> None:  # type: ignore
+        super().__init__(server, *args, **kwargs)
+        self.server = server.server
+
+    def open(self, path: str, flags: int, attr: paramiko.SFTPAttributes):  # type: ignore
+        name = _flash_name(path)
+        if name is None:
+            return paramiko.SFTP_NO_SUCH_FILE
+        if name not in self.server.files or flags & os.O_TRUNC:
+            if not flags & os.O_CREAT:
+                return paramiko.SFTP_NO_SUCH_FILE
+            self.server.files[name] = bytearray()
+        return _FlashHandle(self.server, name, flags)
+
+    def stat(self, path: str):  # type: ignore
+        name = _flash_name(path)
+        if name not in self.server.files:
+            return paramiko.SFTP_NO_SUCH_FILE
+        attr = paramiko.SFTPAttributes()
+        attr.st_size = len(self.server.files[name])
+        return attr
+
+    lstat = stat
+
+
+class FakeSSHServer:
+    def __init__(
+        self,
+        hostname: str = "cisco1",
+        responses: Optional[Dict[str, str]] = None,
+        listen_ip: str = "127.0.0.1",
+        port: int = 0,
+        response_delay: float = 0.0,
+        flash_size: int = 8 * 1024**3,
+        auth_delay: float = 0.0,
+        md5_rate: Optional[float] = None,
+    ) -> None:
+        self.hostname = hostname
+        self.responses = DEFAULT_RESPONSES if responses is None else responses
+        self.response_delay = response_delay
+        # Emulates a slow (i.e. TACACS) authentication
+        self.auth_delay = auth_delay
+        # Emulates the device CPU: 'verify /md5' hashes md5_rate bytes per second
+        self.md5_rate = md5_rate
+        # Commands received by the shells
+        self.commands: List[str] = []
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((listen_ip, port))
+        self.sock.listen(1024)
+        self.port = self.sock.getsockname()[1]
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Encoded replies (so large outputs aren't re-encoded for every command)
+        self._replies: Dict[str, bytes] = {}
+        # Emulated 'flash:' file system (file name => contents)
+        self.files: Dict[str, Union[bytes, bytearray]] = {}
+        self.flash_size = flash_size
+        # Close the SSH connection once this many more bytes have been uploaded
+        self.drop_after: Optional[int] = None
+        # Total bytes uploaded
+        self.received = 0
+        self._transports: List[paramiko.Transport] = []
+        # Channel => 'shell' or 'exec' (the request made after the channel was opened)
+        self._requests: Dict[paramiko.Channel, str] = {}
+        self._requests_cond = threading.Condition()
+
+    @property
+    def prompt(self) -> str:
+        return f"{self.hostname}#"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def _accept_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _handle(self, client: socket.socket) -> None:
+        transport = paramiko.Transport(client)
+        # Hundreds of concurrent handshakes (i.e. bench_async_sessions.py) can take a while
+        transport.banner_timeout = 60
+        transport.handshake_timeout = 60
+        transport.add_server_key(_host_key())
+        transport.set_subsystem_handler("sftp", paramiko.SFTPServer, _FlashSFTP)
+        self._transports.append(transport)
+        try:
+            transport.start_server(server=_ServerInterface(self))
+        except paramiko.SSHException:
+            return
+        while transport.is_active() and not self._stop.is_set():
+            chan = transport.accept(timeout=1)
+            if chan is None:
+                continue
+            threading.Thread(target=self._session, args=(chan,), daemon=True).start()
+
+    def _received(self, size: int) -> None:
+        """Account for uploaded data (drop the connections once drop_after is reached)."""
+        self.received += size
+        if self.drop_after is None:
+            return
+        self.drop_after -= size
+        if self.drop_after <= 0:
+            self.drop_after = None
+            for transport in self._transports:
+                # shutdown() so that the client sees the connection close right away
+                try:
+                    transport.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                transport.close()
+            self._transports.clear()
+
+    def _channel_request(self, chan: paramiko.Channel, kind: str) -> None:
+        with self._requests_cond:
+            self._requests[chan] = kind
+            self._requests_cond.notify_all()
+
+    def _session(self, chan: paramiko.Channel) -> None:
+        """Run the interactive shell (exec channels are handled by their own thread)."""
+        with self._requests_cond:
+            self._requests_cond.wait_for(lambda: chan in self._requests, timeout=10)
+            kind = self._requests.pop(chan, None)
+        if kind == "shell":
+            self._shell(chan)
+
+    def _shell(self, chan: paramiko.Channel) -> None:
+        buffer = ""
+        try:
+            chan.sendall(f"\r\n{self.prompt}".encode())
+            while True:
+                data = chan.recv(4096)
+                if not data:
+                    break
+                buffer += data.decode(errors="ignore")
+                while "\n" in buffer:
+                    line, buffer = buffer.split("\n", 1)
+                    self._respond(chan, line.strip())
+        except (OSError, EOFError):
+            pass
+        finally:
+            chan.close()
+
+    def _respond(self, chan: paramiko.Channel, cmd: str) -> None:
+        self.commands.append(cmd)
+        if cmd in ("exit", "logout"):
+            chan.close()
+            return
+        if self.response_delay:
+            self._stop.wait(self.response_delay)
+        flash_output = self._flash_command(cmd)
+        if flash_output is not None:
+            text = f"{cmd}\r\n{flash_output}".replace("\n", "\r\n")
+            chan.sendall(f"{text.replace(chr(13) * 2, chr(13))}{self.prompt}".encode())
+            return
+        reply = self._replies.get(cmd)
+        if reply is None:
+            output = self.responses.get(cmd, "")
+            text = f"{cmd}\r\n{output}".replace("\n", "\r\n").replace("\r\r\n", "\r\n")
+            reply = self._replies.setdefault(cmd, f"{text}{self.prompt}".encode())
+        # Send in blocks (Channel.sendall() re-slices the remaining data after every send)
+        for i in range(0, len(reply), 32768):
+            chan.sendall(reply[i : i + 32768])
+
+    def _flash_command(self, cmd: str) -> Optional[str]:
+        """Output of the commands that look at the 'flash:' file system (None otherwise)."""
+        free = self.flash_size - sum(len(data) for data in self.files.values())
+        summary = f"{self.flash_size} bytes total ({free} bytes free)\n"
+        match = re.match(r"dir flash:/?(\S*)$", cmd)
+        if match:
+            name = match.group(1)
+            names = [name] if name else sorted(self.files)
+            if name and name not in self.files:
+                return f"%Error opening flash:/{name} (No such file or directory)\n"
+            lines = [
+                f"{i + 1:>6}  -rw-  {len(self.files[n]):>10}  Jan 1 2024 00:00:00 +00:00  {n}"
+                for i, n in enumerate(names)
+            ]
+            listing = "\n".join(lines)
+            return f"Directory of flash:/{name}\n\n{listing}\n\n{summary}"
+        match = re.match(r"verify /md5 (?:\()?flash:/?([^)\s]+)\)?$", cmd)
+        if match:
+            name = match.group(1)
+            if name not in self.files:
+                return f"%Error opening flash:/{name} (No such file or directory)\n"
+            digest = hashlib.md5(self.files[name]).hexdigest()
+            if self.md5_rate:
+                self._stop.wait(len(self.files[name]) / self.md5_rate)
+            return f".......Done!\nverify /md5 (flash:/{name}) = {digest}\n"
+        return None
+
+    def _scp_sink(self, chan: paramiko.Channel, name: str) -> None:
+        """Receive one file ('scp -t') into the emulated flash: file system."""
+
+        def read_line() -> bytes:
+            line = b""
+            while not line.endswith(b"\n"):
+                data = chan.recv(1)
+                if not data:
+                    raise EOFError
+                line += data
+            return line
+
+        try:
+            chan.sendall(b"\x00")
+            header = read_line()
+            while header[:1] in (b"T", b"D"):
+                chan.sendall(b"\x00")
+                header = read_line()
+            _, size, _ = header[1:].decode().split(" ", 2)
+            chan.sendall(b"\x00")
+            remaining = int(size) + 1
+            chunks = []
+            while remaining:
+                data = chan.recv(min(remaining, 1024 * 1024))
+                if not data:
+                    raise EOFError
+                chunks.append(data)
+                remaining -= len(data)
+                self._received(len(data))
+            self.files[name] = b"".join(chunks)[:-1]
+            chan.sendall(b"\x00")
+            chan.send_exit_status(0)
+        except (OSError, EOFError):
+            pass
+        finally:
+            chan.close()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from netmiko import async_connection
+from netmiko.async_connection import AsyncBaseConnection, AsyncConnectHandler
+
+
+class FakeConnection:
+    def __init__(self, **kwargs):
+        self.host = kwargs.get("host", "")
+        self.device_type = kwargs.get("device_type", "")
+        self.base_prompt = "cisco1"
+        self.active = 0
+        self.max_active = 0
+        self.disconnected = False
+        self.lock = threading.Lock()
+
+    def send_command(self, command_string, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return f"output of {command_string}"
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def test_async_connect_handler(monkeypatch):
+    monkeypatch.setattr(async_connection, "ConnectHandler", FakeConnection)
+
+    async def main():
+        async with await AsyncConnectHandler(
+            device_type="cisco_ios", host="cisco1.lasthop.io"
+        ) as conn:
+            assert conn.host == "cisco1.lasthop.io"
+            assert conn.base_prompt == "cisco1"
+            output = await conn.send_command("show version")
+        return conn, output
+
+    conn, output = asyncio.run(main())
+    assert output == "output of show version"
+    assert conn.connection.disconnected
+
+
+def test_async_sessions_concurrent():
+    """Different sessions run concurrently; operations on one session are serialized."""
+    connections = [FakeConnection(host=f"cisco{i}") for i in range(10)]
+
+    async def main():
+        async_conns = [AsyncBaseConnection(conn) for conn in connections]
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(conn.send_command(f"show {i}") for conn in async_conns for i in range(2))
+        )
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(main())
+    # 20 operations of 50ms each (2 per session)
+    assert elapsed < 0.5
+    assert all(conn.max_active == 1 for conn in connections)
+
+
+def test_async_max_workers(monkeypatch):
+    monkeypatch.setenv("NETMIKO_ASYNC_MAX_WORKERS", "32")
+    assert async_connection._max_workers() == 32
+    # Malformed values don't break the import of netmiko (default pool size)
+    monkeypatch.setenv("NETMIKO_ASYNC_MAX_WORKERS", "lots")
+    assert async_connection._max_workers() == async_connection.ASYNC_MAX_WORKERS
+    monkeypatch.setenv("NETMIKO_ASYNC_MAX_WORKERS", "0")
+    assert async_connection._max_workers() == async_connection.ASYNC_MAX_WORKERS
+
+
+def test_async_caller_executor():
+    """A caller's executor isn't capped by the size of the shared pool."""
+    num_sessions = async_connection.ASYNC_MAX_WORKERS + 44
+    # Only passes once all of the sessions are running a command at the same time
+    barrier = threading.Barrier(num_sessions, timeout=10)
+
+    class BarrierConnection(FakeConnection):
+        def send_command(self, command_string, **kwargs):
+            barrier.wait()
+            return f"output of {command_string}"
+
+    async def main(executor):
+        async_conns = [
+            AsyncBaseConnection(BarrierConnection(host=f"r{i}"), executor=executor)
+            for i in range(num_sessions)
+        ]
+        return await asyncio.gather(
+            *(conn.send_command("show version") for conn in async_conns)
+        )
+
+    with ThreadPoolExecutor(max_workers=num_sessions) as executor:
+        outputs = asyncio.run(main(executor))
+    assert outputs == ["output of show version"] * num_sessions
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+import os
+import time
+
+from netmiko import AutodetectCache
+
+
+def test_autodetect_cache(tmp_path):
+    cache = AutodetectCache(file_name=str(tmp_path / "cache.db"))
+    assert cache.get("10.1.1.1", 22) is None
+    cache.set(
+        "10.1.1.1", 22, "cisco_ios", fingerprint="ssh-rsa:ab", remote_version="v1"
+    )
+    cache.set("10.1.1.1", 161, "cisco_xe", method="snmp")
+
+    assert (
+        cache.get("10.1.1.1", 22, fingerprint="ssh-rsa:ab", remote_version="v1")
+        == "cisco_ios"
+    )
+    assert cache.get("10.1.1.1", 161, method="snmp") == "cisco_xe"
+    assert cache.get("10.1.1.1", 161) is None
+
+    # Persistent (a new cache object using the same file)
+    cache = AutodetectCache(file_name=str(tmp_path / "cache.db"))
+    assert cache.get("10.1.1.1", 161, method="snmp") == "cisco_xe"
+
+    # A different host key (or SSH version) invalidates the entry
+    assert (
+        cache.get("10.1.1.1", 22, fingerprint="ssh-rsa:cd", remote_version="v1") is None
+    )
+    assert (
+        cache.get("10.1.1.1", 22, fingerprint="ssh-rsa:ab", remote_version="v1") is None
+    )
+
+    cache.invalidate("10.1.1.1")
+    assert cache.get("10.1.1.1", 161, method="snmp") is None
+
+
+def test_autodetect_cache_ttl(tmp_path):
+    cache = AutodetectCache(file_name=str(tmp_path / "cache.db"), ttl=0.05)
+    cache.set("sw1", 22, "arista_eos")
+    assert cache.get("sw1", 22) == "arista_eos"
+    time.sleep(0.1)
+    assert cache.get("sw1", 22) is None
+
+
+def test_autodetect_cache_netmiko_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NETMIKO_DIR", str(tmp_path / "netmiko"))
+    cache = AutodetectCache()
+    cache.set("sw1", 22, "arista_eos")
+    assert os.path.exists(tmp_path / "netmiko" / "autodetect_cache.db")
+    cache.clear()
+    assert cache.get("sw1", 22) is None
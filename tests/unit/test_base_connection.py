@@ -1,12 +1,14 @@
 #!/usr/bin/env python
+import logging
 import pytest
 import time
 from os.path import dirname, join
 from threading import Lock
 
 import paramiko
-from netmiko import NetmikoTimeoutException, log, ConnectHandler
-from netmiko.base_connection import BaseConnection
+from netmiko import NetmikoTimeoutException, ConnectionException, log, ConnectHandler
+from netmiko import ConfigInvalidException
+from netmiko.base_connection import BaseConnection, SecretsFilter
 
 RESOURCE_FOLDER = join(dirname(dirname(__file__)), "etc")
 
@@ -487,6 +489,42 @@ def test_strip_ansi_codes():
     assert connection.strip_ansi_escape_codes("\x1bE") == "\n"
 
 
+def test_strip_ansi_codes_mixed():
+    """All of the codes are stripped in one pass (insert_line uses the first count)."""
+    connection = FakeBaseConnection(RETURN="\n")
+    output = (
+        "\x1b[2K\x1b[1;24rswitch1#\x1b[?25h show ver\x1bE\x1b[2Lline2\x1b[5Lend\x1b[0m"
+    )
+    expected = "switch1# show ver\n\n\nline2\n\nend"
+    assert connection.strip_ansi_escape_codes(output) == expected
+
+
+@pytest.mark.parametrize(
+    "output,expected",
+    [
+        ("\x1b[?25hD\x1b[\x1b[7mm", "D"),
+        ("\x1b[1M\x1b[\x1b[32mm\x1b[1;32m\x1b[Aa", "a"),
+        ("\x1b[\x1b[\x1b[0mmK\x1b[?25hok", "ok"),
+    ],
+)
+def test_strip_ansi_codes_nested(output, expected):
+    """Codes that only form once an inner code is removed are stripped as well."""
+    connection = FakeBaseConnection(RETURN="\n")
+    assert connection.strip_ansi_escape_codes(output) == expected
+
+
+def test_strip_ansi_codes_driver_extra_codes():
+    """Driver specific ANSI codes are also removed (and take precedence)."""
+    conn = ConnectHandler(
+        host="testhost",
+        device_type="huawei",
+        auto_connect=False,  # No need to connect for the test purposes
+    )
+    output = "display version \x1b[1D\x1b[1Dx\x1b[32m"
+    assert conn.strip_ansi_escape_codes(output) == "display versionx"
+    conn.disconnect()
+
+
 def test_remove_SecretsFilter_after_disconnection():
     connection = BaseConnection(
         host="testhost",  # Enter the hostname to pass initialization
@@ -622,3 +660,334 @@ def test_nokiasrl_prompt_stripping(test_string, expected):
     )
     result = conn.strip_prompt(a_string=test_string)
     assert result == expected
+
+
+class FakeShellChannel:
+    def __init__(self):
+        self.closed = False
+
+    def settimeout(self, timeout):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSSHClient:
+    def __init__(self):
+        self.closed = False
+        self.channels = []
+
+    def get_transport(self):
+        return self
+
+    def is_active(self):
+        return not self.closed
+
+    def invoke_shell(self, term, width, height):
+        self.channels.append(FakeShellChannel())
+        return self.channels[-1]
+
+    def close(self):
+        self.closed = True
+
+
+def test_open_shell_requires_connection():
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    with pytest.raises(ValueError):
+        conn.open_shell()
+    conn.disconnect()
+
+
+def test_open_shell_shares_transport(monkeypatch):
+    monkeypatch.setattr(BaseConnection, "_try_session_preparation", lambda self: None)
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    conn.remote_conn_pre = client = FakeSSHClient()
+    conn.max_shell_channels = 2
+
+    shell = conn.open_shell()
+    assert shell.remote_conn is client.channels[0]
+    # Channel limit (the original session counts as one of the channels)
+    with pytest.raises(ConnectionException):
+        conn.open_shell()
+
+    # Disconnecting a shell only closes its channel (not the shared transport)
+    shell.disconnect()
+    assert client.channels[0].closed
+    assert not client.closed
+
+    shell = conn.open_shell()
+    conn.disconnect()
+    assert client.channels[1].closed
+    assert client.closed
+
+
+@pytest.mark.parametrize("transport_active", [True, False])
+def test_disconnect_lost_connection(monkeypatch, transport_active):
+    """No graceful exit (cleanup()) once the SSH transport is no longer active."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    conn.remote_conn_pre = client = FakeSSHClient()
+    conn.remote_conn = client.invoke_shell("vt100", 511, 1000)
+    conn.remote_conn.transport = client
+    client.closed = not transport_active
+    cleanups = []
+    monkeypatch.setattr(conn, "cleanup", lambda: cleanups.append(True))
+    conn.disconnect()
+    assert cleanups == ([True] if transport_active else [])
+    assert client.closed and conn.remote_conn is None
+
+
+def test_send_command_future(monkeypatch):
+    """Structured data parsing is handed to the executor."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setenv("NET_TEXTFSM", RESOURCE_FOLDER)
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    raw_output = "Cisco IOS Software, Catalyst 4500 L3 Switch Software"
+    monkeypatch.setattr(conn, "send_command", lambda *args, **kwargs: raw_output)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = conn.send_command_future(
+            "show version", parse_executor=executor, use_textfsm=True
+        )
+        assert future.result() == [{"model": "4500"}]
+        future = conn.send_command_future("show version", parse_executor=executor)
+        assert future.result() == raw_output
+    conn.disconnect()
+
+
+class FakeChannel:
+    """Channel that returns data in chunks of chunk_size characters."""
+
+    def __init__(self, data, chunk_size):
+        self.chunks = [
+            data[i : i + chunk_size] for i in range(0, len(data), chunk_size)
+        ]
+
+    def write_channel(self, out_data):
+        pass
+
+    def read_channel(self):
+        return self.chunks.pop(0) if self.chunks else ""
+
+    def wait_for_data(self, timeout):
+        return bool(self.chunks)
+
+
+@pytest.mark.parametrize(
+    "elapsed,read_timeout,expected",
+    [(0, 10, 1.0), (9.5, 10, 0.5), (11, 10, 0), (100, 0, 1.0)],
+)
+def test_wait_for_data_until(monkeypatch, elapsed, read_timeout, expected):
+    """Each wait is capped at one second and never runs past read_timeout."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    timeouts = []
+    monkeypatch.setattr(conn, "wait_for_data", lambda timeout: timeouts.append(timeout))
+    conn._wait_for_data_until(time.time() - elapsed, read_timeout)
+    assert timeouts[0] == pytest.approx(expected, abs=0.05)
+    conn.disconnect()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 100000])
+@pytest.mark.parametrize("cmd_verify", [True, False])
+def test_send_command_stream(chunk_size, cmd_verify):
+    """Joined chunks of send_command_stream() match the send_command() output."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    conn.base_prompt = "cisco1"
+    lines = [f"GigabitEthernet0/{i}  10.1.{i}.1  YES NVRAM  up  up" for i in range(50)]
+    data = "show ip int brief\n" + "\n".join(lines) + "\ncisco1#"
+    kwargs = {"auto_find_prompt": False, "cmd_verify": cmd_verify}
+
+    conn.channel = FakeChannel(data, chunk_size)
+    expected = conn.send_command("show ip int brief", **kwargs)
+    assert expected == "\n".join(lines)
+
+    conn.channel = FakeChannel(data, chunk_size)
+    chunks = list(conn.send_command_stream("show ip int brief", **kwargs))
+    assert "".join(chunks) == expected
+    if chunk_size < len(data):
+        assert len(chunks) > 1
+    # No channel (so disconnect doesn't try to talk to the device)
+    del conn.channel
+    conn.disconnect()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+def test_send_command_stream_lookahead(chunk_size):
+    """An expect_string lookahead whose text arrives in later reads is still found."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    lines = [f"GigabitEthernet0/{i}  10.1.{i}.1  YES NVRAM  up  up" for i in range(10)]
+    data = "show ip int brief\n" + "\n".join(lines) + "\n" + "\n" * 6 + "cisco1#"
+    kwargs = {
+        "expect_string": r"up(?=\s{1,8}cisco1#)",
+        "strip_prompt": False,
+        "read_timeout": 2,
+    }
+
+    conn.channel = FakeChannel(data, chunk_size)
+    chunks = list(conn.send_command_stream("show ip int brief", **kwargs))
+    assert "".join(chunks) == data[len("show ip int brief\n") :]
+    del conn.channel
+    conn.disconnect()
+
+
+class FakeTypeaheadDevice:
+    """Device that queues the commands written to it and answers one of them per read."""
+
+    def __init__(self, responses, prompt="cisco1#"):
+        self.responses = responses
+        self.prompt = prompt
+        self.queue = []
+        self.max_outstanding = 0
+
+    def write_channel(self, out_data):
+        self.queue.append(out_data.strip())
+        self.max_outstanding = max(self.max_outstanding, len(self.queue))
+
+    def read_channel(self):
+        if not self.queue:
+            return ""
+        cmd = self.queue.pop(0)
+        return f"{cmd}\r\n{self.responses.get(cmd, '')}{self.prompt}"
+
+    def wait_for_data(self, timeout):
+        return bool(self.queue)
+
+
+@pytest.mark.parametrize("window", [None, 1, 2])
+@pytest.mark.parametrize("typeahead_safe", [True, False])
+def test_send_command_batch(window, typeahead_safe):
+    """Pipelined output is split into the same per-command results as send_command()."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    conn.base_prompt = "cisco1"
+    conn.typeahead_safe = typeahead_safe
+    responses = {
+        "show clock": "*10:00:00.000 UTC Mon Jan 1 2024\r\n",
+        "show ip int brief": "Gi0/0  10.1.1.1  YES NVRAM  up  up\r\n",
+        "show users": "",
+    }
+    commands = ["show clock", "show ip int brief", "show users"]
+    expected = []
+    for cmd in commands:
+        conn.channel = FakeTypeaheadDevice(responses)
+        expected.append(conn.send_command(cmd, auto_find_prompt=False))
+
+    conn.channel = device = FakeTypeaheadDevice(responses)
+    results = conn.send_command_batch(commands, window=window, auto_find_prompt=False)
+    assert results == expected
+    if not typeahead_safe or window == 1:
+        assert device.max_outstanding == 1
+    else:
+        assert device.max_outstanding == (window or len(commands))
+
+    conn.channel = FakeTypeaheadDevice(responses)
+    expected = conn.send_multiline(commands, auto_find_prompt=False)
+    conn.channel = FakeTypeaheadDevice(responses)
+    output = conn.send_multiline(commands, pipeline=True, auto_find_prompt=False)
+    assert output == expected
+
+    # Arguments send_command_batch() doesn't support: the commands are sent one at a time
+    conn.channel = device = FakeTypeaheadDevice(responses)
+    output = conn.send_multiline(
+        commands,
+        pipeline=True,
+        auto_find_prompt=False,
+        delay_factor=1,
+        use_textfsm=False,
+    )
+    assert output == expected
+    assert device.max_outstanding == 1
+    # No channel (so disconnect doesn't try to talk to the device)
+    del conn.channel
+    conn.disconnect()
+
+
+def test_send_command_batch_trailing_data():
+    """Data received after the last prompt is kept for the next read (not dropped)."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    conn.base_prompt = "cisco1"
+    conn.channel = FakeTypeaheadDevice(
+        {}, prompt="cisco1#\n*Jan  1 00:00:01: %SYS-5-LOG"
+    )
+    results = conn.send_command_batch(["show clock"], auto_find_prompt=False)
+    assert results == [""]
+    assert conn._read_buffer == "\n*Jan  1 00:00:01: %SYS-5-LOG"
+    del conn.channel
+    conn.disconnect()
+
+
+class FakeConfigDevice(FakeTypeaheadDevice):
+    """Config mode device that rejects the commands containing 'bogus'."""
+
+    def read_channel(self):
+        if not self.queue:
+            return ""
+        cmd = self.queue.pop(0)
+        error = "% Invalid input detected at '^' marker.\r\n" if "bogus" in cmd else ""
+        return f"{cmd}\r\n{error}{self.prompt}"
+
+
+@pytest.mark.parametrize("window", [2, 8, 100])
+def test_send_config_set_window(window):
+    """Windowed config push gives the same output and reports the line that failed."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    conn.base_prompt = "cisco1"
+    commands = [f"access-list 101 permit ip host 10.0.0.{i} any" for i in range(20)]
+    kwargs = {
+        "enter_config_mode": False,
+        "exit_config_mode": False,
+        "error_pattern": r"% Invalid input",
+    }
+    conn.channel = FakeConfigDevice({}, prompt="cisco1(config)#")
+    expected = conn.send_config_set(commands, **kwargs)
+
+    conn.channel = device = FakeConfigDevice({}, prompt="cisco1(config)#")
+    output = conn.send_config_set(commands, window=window, **kwargs)
+    assert output == expected
+    assert device.max_outstanding == min(window, len(commands))
+
+    commands[12] = "bogus command"
+    conn.channel = FakeConfigDevice({}, prompt="cisco1(config)#")
+    with pytest.raises(ConfigInvalidException, match=r"bogus command \(line 13;"):
+        conn.send_config_set(commands, window=window, **kwargs)
+    # No channel (so disconnect doesn't try to talk to the device)
+    del conn.channel
+    conn.disconnect()
+
+
+def test_secrets_filter_args():
+    """SecretsFilter redacts the formatted message (args included), msg remains a str."""
+    secrets_filter = SecretsFilter(
+        no_log={"password": "Cisco123!", "secret": "Cisco123!enable"}
+    )
+    record = logging.LogRecord(
+        "netmiko",
+        logging.DEBUG,
+        __file__,
+        1,
+        "read_channel: %s",
+        ("enable secret Cisco123!enable",),
+        None,
+    )
+    assert secrets_filter.filter(record)
+    assert record.msg == "read_channel: enable secret ********"
+    assert record.getMessage() == "read_channel: enable secret ********"
+
+    # Records without secrets are left untouched
+    record = logging.LogRecord(
+        "netmiko", logging.DEBUG, __file__, 1, "read_channel: %s", ("cisco1#",), None
+    )
+    assert secrets_filter.filter(record)
+    assert record.msg == "read_channel: %s" and record.args == ("cisco1#",)
+
+
+def test_secrets_filter_caplog(caplog):
+    conn = ConnectHandler(
+        host="testhost",
+        device_type="cisco_ios",
+        password="Cisco123!",
+        auto_connect=False,
+    )
+    with caplog.at_level(logging.DEBUG, logger="netmiko"):
+        log.debug("write_channel: %s", b"Cisco123!\n")
+    assert caplog.records[-1].message == "write_channel: b'********\\n'"
+    conn.disconnect()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+import os
+import resource
+import socket
+import time
+
+import pytest
+
+from netmiko._telnetlib import telnetlib
+from netmiko.channel import SSHChannel, TelnetChannel
+
+
+class FakeParamikoChannel:
+    """Socket-backed stand-in for paramiko.Channel (select() uses fileno())."""
+
+    def __init__(self):
+        self.local, self.remote = socket.socketpair()
+        self.local.setblocking(False)
+        self.closed = False
+        self.eof_received = False
+
+    def fileno(self):
+        return self.local.fileno()
+
+    def recv_ready(self):
+        try:
+            return bool(self.local.recv(1, socket.MSG_PEEK))
+        except BlockingIOError:
+            return False
+
+    def recv(self, nbytes):
+        return self.local.recv(nbytes)
+
+    def close(self):
+        self.local.close()
+        self.remote.close()
+
+
+class HighFdParamikoChannel(FakeParamikoChannel):
+    """Channel whose file descriptor is above select()'s FD_SETSIZE (1024)."""
+
+    high_fd = 1500
+
+    def __init__(self):
+        super().__init__()
+        os.dup2(self.local.fileno(), self.high_fd)
+
+    def fileno(self):
+        return self.high_fd
+
+    def close(self):
+        os.close(self.high_fd)
+        super().close()
+
+
+def fake_telnet():
+    local, remote = socket.socketpair()
+    conn = telnetlib.Telnet()
+    conn.sock = local
+    return conn, remote
+
+
+def test_ssh_wait_for_data_wakes_on_data():
+    conn = FakeParamikoChannel()
+    channel = SSHChannel(conn=conn, encoding="utf-8")
+    try:
+        conn.remote.sendall(b"router1#")
+        start = time.time()
+        assert channel.wait_for_data(timeout=5)
+        assert time.time() - start < 1
+        assert channel.read_channel() == "router1#"
+    finally:
+        conn.close()
+
+
+def test_ssh_wait_for_data_timeout():
+    conn = FakeParamikoChannel()
+    channel = SSHChannel(conn=conn, encoding="utf-8")
+    try:
+        start = time.time()
+        assert not channel.wait_for_data(timeout=0.2)
+        assert time.time() - start >= 0.15
+    finally:
+        conn.close()
+
+
+def test_ssh_wait_for_data_closed_channel():
+    conn = FakeParamikoChannel()
+    conn.eof_received = True
+    channel = SSHChannel(conn=conn, encoding="utf-8")
+    try:
+        assert not channel.wait_for_data(timeout=0.2)
+    finally:
+        conn.close()
+
+
+@pytest.mark.skipif(
+    resource.getrlimit(resource.RLIMIT_NOFILE)[0] <= HighFdParamikoChannel.high_fd,
+    reason="file descriptor limit too low",
+)
+def test_ssh_wait_for_data_high_fd():
+    conn = HighFdParamikoChannel()
+    channel = SSHChannel(conn=conn, encoding="utf-8")
+    try:
+        assert not channel.wait_for_data(timeout=0.1)
+        conn.remote.sendall(b"router1#")
+        assert channel.wait_for_data(timeout=5)
+    finally:
+        conn.close()
+
+
+def test_telnet_wait_for_data_wakes_on_data():
+    conn, remote = fake_telnet()
+    channel = TelnetChannel(conn=conn, encoding="utf-8")
+    try:
+        assert not channel.wait_for_data(timeout=0.1)
+        remote.sendall(b"router1#")
+        assert channel.wait_for_data(timeout=5)
+        assert channel.read_channel() == "router1#"
+    finally:
+        conn.close()
+        remote.close()
+
+
+def test_telnet_wait_for_data_rawq():
+    """Bytes already moved into rawq must not wait for the socket to become readable."""
+    conn, remote = fake_telnet()
+    conn.rawq = b"router1#"
+    channel = TelnetChannel(conn=conn, encoding="utf-8")
+    try:
+        start = time.time()
+        assert channel.wait_for_data(timeout=2)
+        assert time.time() - start < 1
+        assert channel.read_channel() == "router1#"
+    finally:
+        conn.close()
+        remote.close()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+import pytest
+
+from netmiko import ConnectionPool, NetmikoTimeoutException
+
+
+class FakeConnection:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.alive = True
+        self.config_mode = False
+        self.prompt_checks = 0
+        self.disconnected = False
+
+    def is_alive(self):
+        return self.alive
+
+    def check_config_mode(self):
+        return self.config_mode
+
+    def exit_config_mode(self):
+        self.config_mode = False
+        return ""
+
+    def set_base_prompt(self):
+        self.prompt_checks += 1
+        return "cisco1"
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+DEVICE = {
+    "device_type": "cisco_ios",
+    "host": "cisco1.lasthop.io",
+    "username": "pyclass",
+    "password": "password",
+}
+
+
+def test_pool_reuse():
+    pool = ConnectionPool(connection_factory=FakeConnection)
+    with pool.lease(**DEVICE) as conn1:
+        conn1.config_mode = True
+    # Mode/prompt state restored on release
+    assert not conn1.config_mode
+    assert conn1.prompt_checks == 1
+
+    with pool.lease(**DEVICE) as conn2:
+        assert conn2 is conn1
+    # Different username is a different key
+    with pool.lease(**{**DEVICE, "username": "admin"}) as conn3:
+        assert conn3 is not conn1
+
+    assert pool.hits == 1
+    assert pool.misses == 2
+    pool.close()
+    assert conn1.disconnected and conn3.disconnected
+
+
+def test_pool_dead_connection():
+    pool = ConnectionPool(connection_factory=FakeConnection)
+    with pool.lease(**DEVICE) as conn1:
+        pass
+    conn1.alive = False
+    with pool.lease(**DEVICE) as conn2:
+        assert conn2 is not conn1
+    assert conn1.disconnected
+    assert pool.stats["evictions"] == 1
+    assert pool.misses == 2
+
+
+def test_pool_discard_on_exception():
+    pool = ConnectionPool(connection_factory=FakeConnection)
+    with pytest.raises(RuntimeError):
+        with pool.lease(**DEVICE) as conn:
+            raise RuntimeError("command failed")
+    assert conn.disconnected
+    assert pool.stats["idle"] == 0
+
+
+def test_pool_idle_ttl():
+    pool = ConnectionPool(idle_ttl=0, connection_factory=FakeConnection)
+    with pool.lease(**DEVICE) as conn:
+        pass
+    assert pool.evict_idle() == 1
+    assert conn.disconnected
+    assert pool.evictions == 1
+
+
+def test_pool_max_per_host():
+    pool = ConnectionPool(max_per_host=1, connection_factory=FakeConnection)
+    conn = pool.acquire(**DEVICE)
+    with pytest.raises(NetmikoTimeoutException):
+        pool.acquire(timeout=0.1, **DEVICE)
+    pool.release(conn)
+    assert pool.acquire(timeout=0.1, **DEVICE) is conn
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+import hashlib
+import os
+import threading
+import time
+
+import pytest
+
+from netmiko import DigestCache
+from netmiko import file_digest as file_digest_module
+from netmiko.file_digest import file_digest, set_digest_cache
+
+
+@pytest.fixture
+def image(tmp_path, monkeypatch):
+    """A 3.5MB file with an mtime in the past (i.e. not 'racy') and a hash_file() counter."""
+    file_name = tmp_path / "image.bin"
+    file_name.write_bytes(os.urandom(3 * 1024 * 1024 + 512 * 1024))
+    old = time.time() - 60
+    os.utime(file_name, (old, old))
+
+    calls = []
+    hash_file = file_digest_module.hash_file
+
+    def counting_hash_file(*args, **kwargs):
+        calls.append(args)
+        return hash_file(*args, **kwargs)
+
+    monkeypatch.setattr(file_digest_module, "hash_file", counting_hash_file)
+    file_digest_module.clear_digests()
+    yield file_name, calls
+    set_digest_cache(None)
+    file_digest_module.clear_digests()
+
+
+def test_file_digest_cached(image):
+    file_name, calls = image
+    expected = hashlib.md5(file_name.read_bytes()).hexdigest()
+    assert file_digest(str(file_name)) == expected
+    assert file_digest(str(file_name)) == expected
+    assert len(calls) == 1
+    assert file_digest(str(file_name), algorithm="sha256") == (
+        hashlib.sha256(file_name.read_bytes()).hexdigest()
+    )
+    assert len(calls) == 2
+
+    # Modifying the file invalidates the digest
+    with open(file_name, "r+b") as f:
+        f.write(b"\x00" * 16)
+    old = time.time() - 30
+    os.utime(file_name, (old, old))
+    assert (
+        file_digest(str(file_name)) == hashlib.md5(file_name.read_bytes()).hexdigest()
+    )
+    assert len(calls) == 3
+
+
+def test_file_digest_racy(image):
+    """Recently modified files aren't cached."""
+    file_name, calls = image
+    os.utime(file_name)
+    file_digest(str(file_name))
+    file_digest(str(file_name))
+    assert len(calls) == 2
+
+
+def test_file_digest_concurrent(image):
+    """Concurrent transfers of the same file hash it once."""
+    file_name, calls = image
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(file_digest(str(file_name))))
+        for _ in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == 1 and len(results) == 20
+    assert len(calls) == 1
+
+
+def test_digest_cache(image, tmp_path):
+    file_name, calls = image
+    set_digest_cache(DigestCache(file_name=str(tmp_path / "digests.db")))
+    digest = file_digest(str(file_name))
+
+    # A new process (empty in-memory cache) uses the persistent cache
+    file_digest_module.clear_digests()
+    set_digest_cache(DigestCache(file_name=str(tmp_path / "digests.db")))
+    assert file_digest(str(file_name)) == digest
+    assert len(calls) == 1
+
+
+def test_digest_cache_netmiko_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NETMIKO_DIR", str(tmp_path / "netmiko"))
+    cache = DigestCache()
+    key, stat = ("/images/ios.bin", "md5", ""), (1024, 1, 2, 3)
+    cache.set(key, stat, "d41d8cd98f00b204e9800998ecf8427e")
+    assert os.path.exists(tmp_path / "netmiko" / "digest_cache.db")
+    assert cache.get(key, stat) == "d41d8cd98f00b204e9800998ecf8427e"
+    assert cache.get(key, (1024, 1, 2, 4)) is None
+    cache.clear()
+    assert cache.get(key, stat) is None
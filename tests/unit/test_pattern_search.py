@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+import re
+import pytest
+
+from netmiko.pattern_search import PatternSearch, max_match_width
+
+
+def feed(pattern_search, chunks):
+    """Append chunks one at a time (like the read loops) and return the first match."""
+    output = ""
+    for chunk in chunks:
+        output += chunk
+        match = pattern_search.search(output)
+        if match:
+            return output, match
+    return output, None
+
+
+def test_max_match_width():
+    assert max_match_width(re.compile(re.escape("cisco1#"))) == 7
+    assert max_match_width(re.compile(r"cisco1#.*")) is None
+    # The text checked by lookaheads has to be rescanned too
+    assert max_match_width(re.compile(r"foo(?=\s{1,3}bar)")) == 9
+    assert max_match_width(re.compile(r"foo(?=\s+bar)")) is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64])
+def test_pattern_split_across_reads(chunk_size):
+    data = "show version\nCisco IOS XE Software\n" * 50 + "cisco1#"
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    output, match = feed(PatternSearch(re.escape("cisco1#")), chunks)
+    assert match is not None
+    assert output == data
+    assert match.group(0) == "cisco1#"
+
+
+@pytest.mark.parametrize("pattern", [r"foo(?=\s+bar)", r"foo(?=\s{1,6}bar)"])
+def test_lookahead_split_across_reads(pattern):
+    """The text checked by a lookahead arrives in a later read than the match itself."""
+    output, match = feed(PatternSearch(pattern), ["xx foo   ", "   bar"])
+    assert match is not None
+    assert match.group(0) == "foo"
+
+
+def test_anchor_not_matched_at_search_start():
+    """'^' must not match at the start of the rescan window (only at real line starts)."""
+    pattern_search = PatternSearch(r"^#", re_flags=re.M)
+    output, match = feed(pattern_search, ["abc#", "def#", "\n#"])
+    assert match is not None
+    assert match.start() == output.rindex("#")
+
+
+def test_unbounded_pattern_long_match():
+    """Matches of unbounded width patterns can start anywhere in the data searched before."""
+    pattern_search = PatternSearch(r"Building configuration.*end", re_flags=re.S)
+    chunks = ["Building configuration...\n"] + ["interface Gi0/1\n"] * 1000 + ["end\n"]
+    output, match = feed(pattern_search, chunks)
+    assert match is not None
+    assert len(match.group(0)) > 16000
+
+
+def test_lookbehind_before_search_window():
+    """Lookbehinds see the data preceding the rescanned window."""
+    prefix = "x" * 100
+    output, match = feed(PatternSearch(r"(?<=" + prefix + ")#"), [prefix, "#"])
+    assert match is not None
+
+
+def test_reset_after_modification():
+    pattern_search = PatternSearch(r"cisco1#")
+    assert pattern_search.search("x" * 100) is None
+    # Output was rewritten to a shorter string that contains the pattern
+    assert pattern_search.search("cisco1#") is not None
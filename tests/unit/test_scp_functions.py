@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+import socket
+import time
+
+import paramiko
+import pytest
+
+from netmiko import ConnectHandler, NetmikoAuthenticationException, scp_functions
+from netmiko.exceptions import NetmikoTimeoutException
+from netmiko.scp_functions import (
+    BandwidthLimiter,
+    _limited_progress,
+    file_transfer,
+    file_transfer_many,
+)
+
+
+class FakeConnection:
+    def __init__(self, host, **kwargs):
+        self.host = host
+        self.disconnected = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.disconnected = True
+
+
+@pytest.fixture
+def transfers(monkeypatch):
+    """Replace file_transfer(): 'flaky' hosts fail once, 'down' hosts always fail."""
+    calls = []
+
+    def fake_file_transfer(ssh_conn, source_file, dest_file, **kwargs):
+        calls.append(ssh_conn.host)
+        progress4 = kwargs.get("progress4")
+        if progress4 is not None:
+            for sent in range(0, 100_001, 20_000):
+                progress4(dest_file, 100_000, sent, (ssh_conn.host, 22))
+        if ssh_conn.host == "down" or (
+            ssh_conn.host == "flaky" and calls.count("flaky") == 1
+        ):
+            raise OSError(f"{ssh_conn.host} failed")
+        transferred = ssh_conn.host != "staged"
+        return {
+            "file_exists": True,
+            "file_transferred": transferred,
+            "file_verified": True,
+        }
+
+    monkeypatch.setattr(scp_functions, "file_transfer", fake_file_transfer)
+    return calls
+
+
+def test_file_transfer_many(transfers):
+    hosts = ["r1", "flaky", "down", "staged", "r2"]
+    results = file_transfer_many(
+        [{"host": host} for host in hosts],
+        source_file="image.bin",
+        dest_file="image.bin",
+        retries=1,
+        retry_delay=0,
+        connection_factory=FakeConnection,
+    )
+    assert [result.host for result in results] == hosts
+    assert [result.ok for result in results] == [True, True, False, True, True]
+    assert [result.attempts for result in results] == [1, 2, 2, 1, 1]
+    assert [result.file_transferred for result in results] == [
+        True,
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert isinstance(results[2].error, OSError)
+    assert transfers.count("down") == 2
+
+
+@pytest.mark.parametrize(
+    "error,retried",
+    [
+        (NetmikoTimeoutException("connect timed out"), True),
+        (paramiko.SSHException("Error reading SSH protocol banner"), True),
+        (socket.timeout("timed out"), True),
+        (OSError("Socket is closed"), True),
+        (EOFError(), True),
+        (ValueError(scp_functions.MD5_FAILURE), True),
+        (NetmikoAuthenticationException("Authentication failed"), False),
+        (ValueError("File already exists and overwrite_file is disabled"), False),
+        (ValueError("Insufficient space available on remote device"), False),
+        (FileNotFoundError("image.bin"), False),
+        (TypeError("unexpected keyword argument"), False),
+    ],
+)
+def test_file_transfer_many_retries(monkeypatch, error, retried):
+    """Only transient failures are retried."""
+    calls = []
+
+    def fake_file_transfer(ssh_conn, source_file, dest_file, **kwargs):
+        calls.append(ssh_conn.host)
+        raise error
+
+    monkeypatch.setattr(scp_functions, "file_transfer", fake_file_transfer)
+    results = file_transfer_many(
+        [{"host": "r1"}],
+        source_file="image.bin",
+        dest_file="image.bin",
+        retries=2,
+        retry_delay=0,
+        connection_factory=FakeConnection,
+    )
+    assert not results[0].ok and results[0].error is error
+    assert results[0].attempts == len(calls) == (3 if retried else 1)
+
+
+def test_file_transfer_many_connections(transfers):
+    """Existing connections are used as-is (not closed)."""
+    conn = FakeConnection("r1")
+    progress = []
+    results = file_transfer_many(
+        [conn],
+        source_file="image.bin",
+        dest_file="image.bin",
+        device_bandwidth=1e9,
+        progress=lambda filename, size, sent: progress.append(sent),
+    )
+    assert results[0].ok and results[0].file_verified
+    assert not conn.disconnected
+    assert progress == [0, 20_000, 40_000, 60_000, 80_000, 100_000]
+
+
+class FakeFileTransfer:
+    """Destination file is a smaller (partial or unrelated) copy of the source file."""
+
+    transferred = False
+
+    def __init__(self, **kwargs):
+        self.file_size = 3500
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def check_file_exists(self):
+        return True
+
+    def remote_file_size(self):
+        return 2500
+
+    def verify_space_available(self):
+        return True
+
+    def transfer_file(self):
+        FakeFileTransfer.transferred = True
+
+    def verify_file(self):
+        return FakeFileTransfer.transferred
+
+
+def test_file_transfer_resume(monkeypatch):
+    monkeypatch.setattr(scp_functions, "FileTransfer", FakeFileTransfer)
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    kwargs = {"source_file": "image.bin", "dest_file": "image.bin", "resume": True}
+
+    # The smaller file on the device is only completed when it can be overwritten
+    FakeFileTransfer.transferred = False
+    with pytest.raises(ValueError, match="overwrite_file is disabled"):
+        file_transfer(conn, **kwargs)
+    assert not FakeFileTransfer.transferred
+
+    result = file_transfer(conn, overwrite_file=True, **kwargs)
+    assert result["file_transferred"] and result["file_verified"]
+    conn.disconnect()
+
+
+def test_bandwidth_limiter():
+    limiter = BandwidthLimiter(1_000_000, burst=0)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.consume(40_000)
+    assert 0.18 < time.monotonic() - start < 0.5
+
+
+def test_file_transfer_many_retry_bandwidth(transfers):
+    """The retried transfer (100KB sent again) is throttled too: 200KB at 500KB/s (50KB burst)."""
+    start = time.monotonic()
+    results = file_transfer_many(
+        [{"host": "flaky"}],
+        source_file="image.bin",
+        dest_file="image.bin",
+        retries=1,
+        retry_delay=0,
+        device_bandwidth=500_000,
+        connection_factory=FakeConnection,
+    )
+    assert results[0].ok and results[0].attempts == 2
+    assert 0.28 < time.monotonic() - start < 0.6
+
+
+def test_limited_progress_offset():
+    """Only the data sent is charged, not the offset a (resumed) transfer starts at."""
+    limiter = BandwidthLimiter(1_000_000, burst=0)
+    progress = []
+    limited_progress = _limited_progress(
+        [limiter], progress=lambda filename, size, sent: progress.append(sent)
+    )
+    start = time.monotonic()
+    for sent in (600_000, 650_000, 700_000):
+        limited_progress("image.bin", 1_000_000, sent)
+    assert 0.08 < time.monotonic() - start < 0.3
+    assert progress == [600_000, 650_000, 700_000]
+
+
+def test_file_transfer_many_total_bandwidth(transfers):
+    """Four 100KB transfers sharing 2MB/s (200KB burst) take ~0.1s."""
+    start = time.monotonic()
+    results = file_transfer_many(
+        [{"host": f"r{i}"} for i in range(4)],
+        source_file="image.bin",
+        dest_file="image.bin",
+        total_bandwidth=2_000_000,
+        connection_factory=FakeConnection,
+    )
+    assert all(result.ok for result in results)
+    assert 0.08 < time.monotonic() - start < 0.5
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+import hashlib
+import os
+
+import paramiko
+import pytest
+
+from netmiko import ConnectHandler, ResumeJournal, SCPConn, scp_handler
+from netmiko import transfer_session
+from netmiko.scp_handler import BaseFileTransfer
+
+
+class FakeChannel:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeTransport:
+    def __init__(self, allow_channels=True):
+        self.allow_channels = allow_channels
+        self.channels = []
+
+    def is_active(self):
+        return True
+
+    def getpeername(self):
+        return ("127.0.0.1", 22)
+
+    def open_session(self):
+        if not self.allow_channels:
+            raise paramiko.ChannelException(1, "Administratively prohibited")
+        self.channels.append(FakeChannel())
+        return self.channels[-1]
+
+
+class FakeSSHClient:
+    def __init__(self, transport):
+        self.transport = transport
+        self.connected = False
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def connect(self, **kwargs):
+        self.connected = True
+
+    def close(self):
+        self.closed = True
+
+
+def scp_setup(monkeypatch, allow_channels=True):
+    """Connection whose SSH transport (allow_channels) is shared with the SCP channel."""
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    conn.remote_conn_pre = FakeSSHClient(FakeTransport(allow_channels))
+    conn.ssh_connect_time = 5.0
+    new_clients = []
+
+    def build_ssh_client():
+        new_clients.append(FakeSSHClient(FakeTransport()))
+        return new_clients[-1]
+
+    monkeypatch.setattr(conn, "_build_ssh_client", build_ssh_client)
+    return conn, new_clients
+
+
+def test_scp_conn_reuse_transport(monkeypatch):
+    conn, new_clients = scp_setup(monkeypatch)
+    scp_conn = SCPConn(conn, reuse_transport=True)
+    assert scp_conn.transport_reused
+    assert not new_clients
+    assert 4.0 < scp_conn.time_saved <= 5.0
+    channel = conn.remote_conn_pre.transport.channels[0]
+    assert scp_conn.scp_client.channel is channel
+
+    # Only the SCP channel is closed
+    scp_conn.close()
+    assert channel.closed
+    assert not conn.remote_conn_pre.closed
+    conn.disconnect()
+
+
+def test_scp_conn_reuse_transport_fallback(monkeypatch):
+    # The device rejects additional channels
+    conn, new_clients = scp_setup(monkeypatch, allow_channels=False)
+    scp_conn = SCPConn(conn, reuse_transport=True)
+    assert not scp_conn.transport_reused and scp_conn.time_saved == 0.0
+    assert len(new_clients) == 1 and new_clients[0].connected
+    scp_conn.close()
+    assert new_clients[0].closed
+    conn.disconnect()
+
+    # No room for another channel (max_shell_channels)
+    conn, new_clients = scp_setup(monkeypatch)
+    conn.max_shell_channels = 1
+    scp_conn = SCPConn(conn, reuse_transport=True)
+    assert not scp_conn.transport_reused
+    assert not conn.remote_conn_pre.transport.channels
+    assert len(new_clients) == 1
+    conn.disconnect()
+
+    # Default: separate SSH connection
+    conn, new_clients = scp_setup(monkeypatch)
+    scp_conn = SCPConn(conn)
+    assert not scp_conn.transport_reused
+    assert len(new_clients) == 1
+    conn.disconnect()
+
+
+class FakeSFTPFile:
+    def __init__(self, contents):
+        self.contents = contents
+        self.pos = 0
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def set_pipelined(self, pipelined):
+        pass
+
+    def seek(self, pos):
+        self.pos = pos
+
+    def readv(self, chunks):
+        for offset, size in chunks:
+            yield bytes(self.contents[offset : offset + size])
+
+    def write(self, data):
+        self.contents[self.pos : self.pos + len(data)] = data
+        self.pos += len(data)
+        self.written += len(data)
+
+
+class FakeSFTPClient:
+    def __init__(self, files):
+        self.files = files
+        self.opened = []
+
+    def open(self, path, mode):
+        if "w" in mode:
+            self.files[path] = bytearray()
+        self.opened.append(FakeSFTPFile(self.files[path]))
+        return self.opened[-1]
+
+    def close(self):
+        pass
+
+
+class FakeSCPConn:
+    def __init__(self, sftp=None):
+        self.sftp = sftp
+        self.scp_client = type("FakeSCPClient", (), {"peername": ("127.0.0.1", 22)})
+        self.scp_files = []
+
+    def open_sftp(self):
+        if self.sftp is None:
+            raise paramiko.SSHException("subsystem request failed")
+        return self.sftp
+
+    def scp_transfer_file(self, source_file, dest_file):
+        self.scp_files.append(dest_file)
+
+    def close(self):
+        pass
+
+
+def resume_setup(
+    monkeypatch, tmp_path, remote_contents, recorded=lambda source: source
+):
+    """The partial file (remote_contents) of an interrupted transfer of recorded(source)
+    (no journal entry if recorded is None)."""
+    monkeypatch.setattr(scp_handler, "RESUME_CHUNK_SIZE", 1024)
+    source_file = tmp_path / "image.bin"
+    source_file.write_bytes(os.urandom(3500))
+    source = source_file.read_bytes()
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    journal = ResumeJournal(file_name=str(tmp_path / "resume.db"))
+    if recorded is not None:
+        old_source = recorded(source)
+        digests = [
+            hashlib.md5(old_source[i : i + 1024]).hexdigest()
+            for i in range(0, len(old_source), 1024)
+        ]
+        journal.set("testhost", conn.port, "flash:/image.bin", 1024, digests)
+    transfer = BaseFileTransfer(
+        ssh_conn=conn,
+        source_file=str(source_file),
+        dest_file="image.bin",
+        file_system="flash:",
+        resume=True,
+        resume_journal=journal,
+    )
+    files = {"flash:/image.bin": bytearray(remote_contents(source))}
+    transfer.scp_conn = FakeSCPConn(FakeSFTPClient(files))
+    monkeypatch.setattr(
+        transfer, "remote_file_size", lambda: len(files["flash:/image.bin"])
+    )
+    return conn, transfer, source_file.read_bytes(), files
+
+
+def test_put_file_resume(monkeypatch, tmp_path):
+    # Interrupted transfer: resumes at the last complete chunk (2048)
+    conn, transfer, source, files = resume_setup(
+        monkeypatch, tmp_path, lambda source: source[:2500]
+    )
+    progress = []
+    transfer.progress = lambda filename, size, sent: progress.append(sent)
+    transfer.put_file()
+    assert files["flash:/image.bin"] == source
+    assert transfer.scp_conn.sftp.opened[-1].written == 3500 - 2048
+    assert progress == [2048, 3072, 3500]
+    # The file was transferred entirely: no longer resumable
+    assert transfer.resume_journal.get("testhost", 22, "flash:/image.bin") is None
+    conn.disconnect()
+
+
+def test_put_file_resume_not_recorded(monkeypatch, tmp_path):
+    # The partial file wasn't written by an earlier transfer: transfer all of it
+    conn, transfer, source, files = resume_setup(
+        monkeypatch, tmp_path, lambda source: source[:2500], recorded=None
+    )
+    transfer.put_file()
+    assert files["flash:/image.bin"] == source
+    assert transfer.scp_conn.sftp.opened[-1].written == 3500
+    conn.disconnect()
+
+
+@pytest.mark.parametrize("changed_chunk,written", [(0, 3500), (1, 3500 - 1024)])
+def test_put_file_resume_source_changed(monkeypatch, tmp_path, changed_chunk, written):
+    # The source file changed since the interrupted transfer (only in changed_chunk): the
+    # transfer resumes before that chunk even though the last complete chunk matches
+    def old_source(source):
+        start = changed_chunk * 1024
+        return source[:start] + bytes(1024) + source[start + 1024 :]
+
+    conn, transfer, source, files = resume_setup(
+        monkeypatch,
+        tmp_path,
+        lambda source: old_source(source)[:2500],
+        recorded=old_source,
+    )
+    transfer.put_file()
+    assert files["flash:/image.bin"] == source
+    assert transfer.scp_conn.sftp.opened[-1].written == written
+    conn.disconnect()
+
+
+def test_put_file_resume_mismatch(monkeypatch, tmp_path):
+    # The partial file isn't part of the file being transferred: transfer all of it
+    conn, transfer, source, files = resume_setup(
+        monkeypatch, tmp_path, lambda source: source[:1024] + bytes(1476)
+    )
+    transfer.put_file()
+    assert files["flash:/image.bin"] == source
+    assert transfer.scp_conn.sftp.opened[-1].written == 3500
+    conn.disconnect()
+
+
+def test_put_file_resume_no_sftp(monkeypatch, tmp_path):
+    # SFTP isn't supported: regular SCP transfer
+    conn, transfer, source, files = resume_setup(
+        monkeypatch, tmp_path, lambda source: source[:2500]
+    )
+    transfer.scp_conn = FakeSCPConn()
+    transfer.put_file()
+    assert transfer.scp_conn.scp_files == ["flash:/image.bin"]
+    conn.disconnect()
+
+
+class FakeFlash:
+    """Fake Cisco IOS 'dir' and 'verify /md5' commands for a flash: with one file."""
+
+    def __init__(self, contents):
+        self.contents = contents
+        self.commands = []
+
+    def send_command(self, command, **kwargs):
+        self.commands.append(command)
+        listing = (
+            "Directory of flash:/\n\n"
+            f"    1  -rw-  {len(self.contents):>10}  Jan 1 2024 00:00:00 +00:00  image.bin\n"
+            "    2  -rw-          42  Jan 1 2024 00:00:00 +00:00  other.bin\n\n"
+            "8000000 bytes total (7000000 bytes free)\n"
+        )
+        if command in ("dir flash:", "dir flash:/image.bin"):
+            return listing
+        if command == "verify /md5 flash:/image.bin":
+            digest = hashlib.md5(self.contents).hexdigest()
+            return f"verify /md5 (flash:/image.bin) = {digest}\n"
+        raise ValueError(command)
+
+
+def test_transfer_session(monkeypatch, tmp_path):
+    source_file = tmp_path / "image.bin"
+    source_file.write_bytes(os.urandom(3500))
+    flash = FakeFlash(b"old image")
+    conn = ConnectHandler(host="testhost", device_type="cisco_ios", auto_connect=False)
+    monkeypatch.setattr(conn, "_send_command_str", flash.send_command)
+    transfer = BaseFileTransfer(
+        ssh_conn=conn,
+        source_file=str(source_file),
+        dest_file="image.bin",
+        file_system="flash:",
+    )
+    transfer.scp_conn = FakeSCPConn()
+
+    def check():
+        assert transfer.check_file_exists()
+        assert transfer.verify_space_available()
+        return transfer.remote_file_size(), transfer.compare_md5()
+
+    # No session: every method runs its own command
+    assert check() == (9, False)
+    assert len(flash.commands) == 4
+
+    with transfer_session(conn) as cache:
+        flash.commands = []
+        assert check() == (9, False)
+        assert check() == (9, False)
+        assert flash.commands == ["dir flash:", "verify /md5 flash:/image.bin"]
+
+        # Writing the file invalidates its listing and digest
+        monkeypatch.setattr(
+            transfer,
+            "put_file",
+            lambda: setattr(flash, "contents", source_file.read_bytes()),
+        )
+        transfer.transfer_file()
+        flash.commands = []
+        assert check() == (3500, True)
+        assert flash.commands == ["dir flash:", "verify /md5 flash:/image.bin"]
+
+        # Files the listing has no information about
+        transfer.dest_file = "missing.bin"
+        assert not transfer.check_file_exists()
+        with pytest.raises(IOError):
+            transfer.remote_file_size()
+        assert len(flash.commands) == 2
+
+        # Nested sessions share the cache
+        with transfer_session(conn) as nested_cache:
+            assert nested_cache is cache
+        assert scp_handler.remote_file_cache(conn) is cache
+    assert scp_handler.remote_file_cache(conn) is None
+    conn.disconnect()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+import gzip
+import io
+import time
+
+import pytest
+
+from netmiko.session_log import (
+    SessionLog,
+    SessionLogWriter,
+    SessionLogReader,
+    open_session_log,
+    ZSTD_INSTALLED,
+)
+
+NO_LOG = {"password": "Cisco123!", "secret": "Cisco123!enable", "username": "admin"}
+DATA = (
+    "username admin password Cisco123!\n"
+    "enable secret Cisco123!enable\n"
+    "show run | i Cisco123\n"
+) * 20
+
+
+def write_chunks(slog, data, chunk_size):
+    for i in range(0, len(data), chunk_size):
+        slog.write(data[i : i + chunk_size])
+    slog.flush()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 13, 64, 100000])
+def test_session_log_no_log_split_writes(chunk_size):
+    """no_log entries are hidden even when they are split across writes."""
+    buffer = io.BytesIO()
+    slog = SessionLog(buffered_io=buffer, no_log=NO_LOG)
+    write_chunks(slog, DATA, chunk_size)
+    output = buffer.getvalue().decode()
+    assert "Cisco123!" not in output
+    assert "admin" not in output
+    assert (
+        output
+        == (
+            "username ******** password ********\n"
+            "enable secret ********\n"
+            "show run | i Cisco123\n"
+        )
+        * 20
+    )
+
+
+def test_session_log_write_through():
+    """Redacted data is written out as it arrives (only a short tail is held back)."""
+    buffer = io.BytesIO()
+    slog = SessionLog(buffered_io=buffer, no_log=NO_LOG)
+    slog.write("x" * 10000)
+    assert len(buffer.getvalue()) >= 10000 - len("Cisco123!enable")
+    slog.write("Cisco123")
+    slog.flush()
+    assert buffer.getvalue().decode() == "x" * 10000 + "Cisco123"
+
+
+def test_session_log_no_no_log():
+    buffer = io.BytesIO()
+    slog = SessionLog(buffered_io=buffer)
+    slog.write("password Cisco123!")
+    assert buffer.getvalue() == b"password Cisco123!"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 7])
+def test_session_log_no_log_overlapping(chunk_size):
+    """Entries that are prefixes of (or overlap with) other entries."""
+    no_log = {"a": "abc", "b": "abcdef", "c": "defxyz"}
+    data = "abcdefxyz abc abcde abcdef defxyzabc ab"
+    buffer = io.BytesIO()
+    slog = SessionLog(buffered_io=buffer, no_log=no_log)
+    write_chunks(slog, data, chunk_size)
+    assert buffer.getvalue().decode() == slog.no_log_filter(data)
+    assert buffer.getvalue().decode() == (
+        "********xyz ******** ********de ******** **************** ab"
+    )
+
+
+def test_session_log_writer():
+    """Data from multiple SessionLogs is written by the background writer."""
+    writer = SessionLogWriter(flush_interval=60)
+    buffers = [io.BytesIO() for _ in range(3)]
+    slogs = [SessionLog(buffered_io=b, no_log=NO_LOG, writer=writer) for b in buffers]
+    for slog in slogs:
+        write_chunks(slog, DATA, 5)
+    for slog, buffer in zip(slogs, buffers):
+        # Drained (and redacted) on close
+        slog.close()
+        assert buffer.getvalue().decode() == slog.no_log_filter(DATA)
+    writer.close()
+
+
+class SlowFile(io.BytesIO):
+    def write(self, data):
+        time.sleep(0.01)
+        return super().write(data)
+
+
+def test_session_log_writer_backpressure():
+    writer = SessionLogWriter(flush_interval=60, max_buffer_size=100)
+    buffer = SlowFile()
+    slog = SessionLog(buffered_io=buffer, writer=writer)
+    for _ in range(20):
+        slog.write("x" * 50)
+        assert writer._queued_size <= 100
+    slog.close()
+    assert buffer.getvalue() == b"x" * 1000
+    writer.close()
+
+
+@pytest.mark.parametrize(
+    "suffix",
+    [
+        ".log",
+        ".log.gz",
+        pytest.param(
+            ".log.zst",
+            marks=pytest.mark.skipif(not ZSTD_INSTALLED, reason="zstandard missing"),
+        ),
+    ],
+)
+def test_session_log_rotation(tmp_path, suffix):
+    """Compressed/rotated session logs are read back (in order) by the reader."""
+    file_name = str(tmp_path / f"device1{suffix}")
+    slog = SessionLog(file_name=file_name, no_log=NO_LOG, max_bytes=200, backup_count=2)
+    slog.open()
+    lines = [f"line {i:03d} password Cisco123!\n" for i in range(30)]
+    for line in lines:
+        slog.write(line)
+        slog.flush()
+    slog.close()
+
+    if suffix == ".log.gz":
+        with gzip.open(file_name, "rt") as f:
+            assert f.read().endswith("line 029 password ********\n")
+
+    # Only backup_count rotated files are retained
+    assert not (tmp_path / f"device1{suffix}.3").exists()
+    reader = SessionLogReader(file_name)
+    assert reader.files == [f"{file_name}.2", f"{file_name}.1", file_name]
+    data = reader.read().decode()
+    expected = "".join(lines[-len(data.splitlines()) :]).replace(
+        "Cisco123!", "********"
+    )
+    assert data == expected
+
+    # Seek forwards/backwards across the file boundaries
+    line_len = len(expected.splitlines()[0]) + 1
+    for line_num in [10, 2, len(expected.splitlines()) - 1, 0]:
+        reader.seek(line_num * line_len)
+        assert reader.read(line_len).decode() == expected.splitlines(True)[line_num]
+    reader.seek(-line_len, io.SEEK_END)
+    assert reader.read().decode() == "line 029 password ********\n"
+    reader.close()
+
+    with open_session_log(file_name) as f:
+        assert f.read() == expected
+
+
+def test_session_log_rotate_interval(tmp_path):
+    file_name = str(tmp_path / "device1.log")
+    slog = SessionLog(file_name=file_name, rotate_interval=0.05, backup_count=1)
+    slog.open()
+    slog.write("first\n")
+    slog.flush()
+    time.sleep(0.1)
+    slog.write("second\n")
+    slog.close()
+    assert (tmp_path / "device1.log.1").read_text() == "first\n"
+    assert (tmp_path / "device1.log").read_text() == "second\n"
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+import asyncio
+import threading
+
+import pytest
+
+from netmiko import AutodetectCache
+
+pytest.importorskip("pysnmp")
+from netmiko.snmp_autodetect import SNMPDetect  # noqa
+
+SYS_DESCR = ".1.3.6.1.2.1.1.1.0"
+RESPONSES = {
+    "10.0.0.1": {SYS_DESCR: "Arista Networks EOS version 4.28.3M"},
+    "10.0.0.2": {SYS_DESCR: "Cisco IOS Software, C3750E Software, Version 15.2(4)E10"},
+    "10.0.0.3": {},
+}
+
+
+def test_snmp_autodetect_many(monkeypatch, tmp_path):
+    """One GET (with all of the OIDs) per host; results are in the order of the hosts."""
+    requests = []
+
+    async def fake_query(self, snmp_engine, oids):
+        requests.append((self.hostname, tuple(oids)))
+        return RESPONSES[self.hostname]
+
+    monkeypatch.setattr(SNMPDetect, "_run_query_many", fake_query)
+    cache = AutodetectCache(file_name=str(tmp_path / "cache.db"))
+    hosts = ["10.0.0.1", {"hostname": "10.0.0.2", "community": "other"}, "10.0.0.3"]
+    results = SNMPDetect.autodetect_many(
+        hosts + [{"hostname": "10.0.0.4", "snmp_version": "v5"}],
+        snmp_version="v2c",
+        community="public",
+        cache=cache,
+    )
+    assert results[:3] == ["arista_eos", "cisco_ios", None]
+    assert isinstance(results[3], ValueError)
+    assert len(requests) == 3
+    assert all(SYS_DESCR in oids for _, oids in requests)
+
+    # Detected hosts are cached
+    requests.clear()
+    results = SNMPDetect.autodetect_many(
+        hosts, snmp_version="v2c", community="public", cache=cache
+    )
+    assert results == ["arista_eos", "cisco_ios", None]
+    assert [host for host, _ in requests] == ["10.0.0.3"]
+
+
+class ThreadRecordingCache(AutodetectCache):
+    """AutodetectCache that records the thread of every lookup/update."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = []
+
+    def get(self, *args, **kwargs):
+        self.threads.append(threading.current_thread())
+        return super().get(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        self.threads.append(threading.current_thread())
+        return super().set(*args, **kwargs)
+
+
+@pytest.mark.parametrize("use_async", [True, False])
+def test_snmp_autodetect_many_running_loop(monkeypatch, tmp_path, use_async):
+    """Callable from a running event loop; the sqlite cache isn't used in the loop thread."""
+
+    async def fake_query(self, snmp_engine, oids):
+        return RESPONSES[self.hostname]
+
+    monkeypatch.setattr(SNMPDetect, "_run_query_many", fake_query)
+    cache = ThreadRecordingCache(file_name=str(tmp_path / "cache.db"))
+    hosts = list(RESPONSES)
+    kwargs = {"snmp_version": "v2c", "community": "public", "cache": cache}
+
+    async def main():
+        if use_async:
+            results = await SNMPDetect.autodetect_many_async(hosts, **kwargs)
+        else:
+            results = SNMPDetect.autodetect_many(hosts, **kwargs)
+        return results, threading.current_thread()
+
+    results, loop_thread = asyncio.run(main())
+    assert results == ["arista_eos", "cisco_ios", None]
+    # A lookup for each host and an update for each detected host
+    assert len(cache.threads) == 5
+    assert loop_thread not in cache.threads
+
+
+def test_snmp_autodetect_cache(monkeypatch, tmp_path):
+    detected = []
+
+    def fake_autodetect(self):
+        detected.append(self.hostname)
+        return "arista_eos"
+
+    monkeypatch.setattr(SNMPDetect, "_autodetect", fake_autodetect)
+    cache = AutodetectCache(file_name=str(tmp_path / "cache.db"))
+    for _ in range(2):
+        detector = SNMPDetect(
+            "10.0.0.1", snmp_version="v2c", community="public", cache=cache
+        )
+        assert detector.autodetect() == "arista_eos"
+    assert detected == ["10.0.0.1"]
+    assert cache.get("10.0.0.1", 161, method="snmp") == "arista_eos"
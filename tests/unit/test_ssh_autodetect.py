@@ -1,7 +1,171 @@
 #!/usr/bin/env python
-from netmiko.ssh_autodetect import SSH_MAPPER_BASE
+from netmiko.autodetect_cache import AutodetectCache
+import re
+
+from netmiko.ssh_autodetect import SSH_MAPPER_BASE, SSH_MAPPER_INDEX, SSHDetect
 
 
 def test_ssh_base_mapper_order():
     "SSH_MAPPER_BASE should be sorted based on the most common command used." ""
     assert SSH_MAPPER_BASE[0][1]["cmd"] == "show version"
+
+
+class FakeCLI:
+    """Connection that answers commands with canned output followed by the prompt."""
+
+    RETURN = "\n"
+
+    def __init__(self, responses, prompt="switch1#", banner="Welcome\n"):
+        self.responses = responses
+        self.prompt = prompt
+        self.pending = f"{banner}{prompt}"
+        self.commands = []
+        self.disconnected = False
+
+    def write_channel(self, out_data):
+        cmd = out_data.strip()
+        if out_data == "q":
+            self.pending += f"\n{self.prompt}"
+            return
+        self.commands.append(cmd)
+        self.pending += f"{cmd}\n{self.responses.get(cmd, '')}{self.prompt}"
+
+    def read_channel(self):
+        data, self.pending = self.pending, ""
+        return data
+
+    def wait_for_data(self, timeout):
+        return bool(self.pending)
+
+    def strip_backspaces(self, output):
+        return output
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def test_ssh_autodetect_fast(monkeypatch):
+    """Fast mode finds the prompt, stops at the first 99 match, and sends each command once."""
+    responses = {"show system info": "hostname: PA-VM\nmodel: PA-VM\n"}
+    conn = FakeCLI(responses, prompt="admin@PA-VM> ")
+    monkeypatch.setattr(
+        "netmiko.ssh_autodetect.ConnectHandler", lambda *args, **kwargs: conn
+    )
+    guesser = SSHDetect(device_type="autodetect", host="pa1", fast=True)
+    assert guesser.prompt == "admin@PA-VM>"
+    assert guesser.autodetect() == "paloalto_panos"
+    assert conn.disconnected
+    assert len(conn.commands) == len(set(conn.commands))
+    assert conn.commands[-1] == "show system info"
+
+
+def test_ssh_autodetect_fast_banner_hint(monkeypatch):
+    """Commands whose patterns match the login banner are sent first."""
+    responses = {"get system status": "Version: FortiGate-VM64 v7.2.5\n"}
+    conn = FakeCLI(responses, prompt="FGT1 # ", banner="FortiGate login banner\n")
+    monkeypatch.setattr(
+        "netmiko.ssh_autodetect.ConnectHandler", lambda *args, **kwargs: conn
+    )
+    guesser = SSHDetect(device_type="autodetect", host="fgt1", fast=True)
+    assert guesser.autodetect() == "fortinet"
+    assert conn.commands == ["", "get system status"]
+
+
+def test_ssh_autodetect_fast_pager(monkeypatch):
+    """A pager prompt ends the read (the pager is quit before the next command)."""
+    responses = {"show version": "Cisco IOS Software, C3750E Software\n --More-- "}
+    conn = FakeCLI(responses)
+    monkeypatch.setattr(
+        "netmiko.ssh_autodetect.ConnectHandler", lambda *args, **kwargs: conn
+    )
+    guesser = SSHDetect(device_type="autodetect", host="sw1", fast=True)
+    assert guesser.autodetect() == "cisco_ios"
+
+
+def test_ssh_autodetect_many(monkeypatch):
+    conns = {
+        "sw1": FakeCLI({"show version": "Cisco IOS Software, C3750E Software\n"}),
+        "sw2": FakeCLI({"show version": "Arista DCS-7050\n"}, prompt="sw2>"),
+    }
+
+    def fake_connect(*args, **kwargs):
+        if kwargs["host"] == "down":
+            raise ConnectionRefusedError("down")
+        return conns[kwargs["host"]]
+
+    monkeypatch.setattr("netmiko.ssh_autodetect.ConnectHandler", fake_connect)
+    devices = [{"host": "sw1"}, {"host": "down"}, {"host": "sw2"}]
+    results = SSHDetect.autodetect_many(devices)
+    assert results[0] == "cisco_ios"
+    assert isinstance(results[1], ConnectionRefusedError)
+    assert results[2] == "arista_eos"
+
+
+def test_ssh_autodetect_cache(monkeypatch, tmp_path):
+    """Repeat runs return the cached device_type without probing the device."""
+    cache = AutodetectCache(file_name=str(tmp_path / "cache.db"))
+    monkeypatch.setattr(
+        SSHDetect, "_host_identity", lambda self: ("ssh-rsa:ab", "SSH-2.0-Cisco-1.25")
+    )
+    responses = {"show version": "Arista DCS-7050\n"}
+    conn = FakeCLI(responses, prompt="sw2>")
+    conn.host, conn.port = "sw2", 22
+    monkeypatch.setattr(
+        "netmiko.ssh_autodetect.ConnectHandler", lambda *args, **kwargs: conn
+    )
+    guesser = SSHDetect(device_type="autodetect", host="sw2", fast=True, cache=cache)
+    assert guesser.autodetect() == "arista_eos"
+    assert "show version" in conn.commands
+
+    conn = FakeCLI(responses, prompt="sw2>")
+    conn.host, conn.port = "sw2", 22
+    guesser = SSHDetect(device_type="autodetect", host="sw2", fast=True, cache=cache)
+    assert guesser.autodetect() == "arista_eos"
+    assert conn.commands == []
+    assert conn.disconnected
+
+
+def test_ssh_mapper_index():
+    """The per-command index finds the same entries as searching each pattern separately."""
+    outputs = [
+        "Cisco IOS Software, C3750E Software (C3750E-UNIVERSALK9-M)\n",
+        "Cisco IOS XE Software, Version 17.03.04a\nCisco IOS Software [Amsterdam]\n",
+        "Cisco Nexus Operating System (NX-OS) Software\n",
+        "Arista DCS-7050\n",
+        "Fiberstore Co., Limited\nFS Software\n",
+        "Huawei Versatile Routing Platform\nVRP (R) software\n",
+        "nothing to see here\n",
+    ]
+    for cmd, index in SSH_MAPPER_INDEX.items():
+        entries = [
+            v
+            for _, v in SSH_MAPPER_BASE
+            if v["cmd"] == cmd and v["dispatch"] == "_autodetect_std"
+        ]
+        for output in outputs:
+            matches = index.matches(output)
+            for entry in entries:
+                expected = any(
+                    re.search(pattern, output, flags=re.I)
+                    for pattern in entry["search_patterns"]
+                )
+                group = index.group(entry["search_patterns"], re.I)
+                assert (group in matches) == expected, (cmd, entry, output)
+
+
+def test_ssh_autodetect_cache_no_fingerprint(monkeypatch, tmp_path):
+    """Nothing is cached when the host key fingerprint can't be read."""
+    cache = AutodetectCache(file_name=str(tmp_path / "cache.db"))
+    responses = {"show version": "Arista DCS-7050\n"}
+    for _ in range(2):
+        conn = FakeCLI(responses, prompt="sw2>")
+        conn.host, conn.port = "sw2", 22
+        monkeypatch.setattr(
+            "netmiko.ssh_autodetect.ConnectHandler", lambda *args, **kwargs: conn
+        )
+        guesser = SSHDetect(
+            device_type="autodetect", host="sw2", fast=True, cache=cache
+        )
+        assert guesser.autodetect() == "arista_eos"
+        assert "show version" in conn.commands
+    assert cache.get("sw2", 22) is None
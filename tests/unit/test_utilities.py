@@ -295,6 +295,75 @@ def test_textfsm_w_index():
     assert result == [{"model": "4500"}]
 
 
+def test_textfsm_cache(tmp_path, monkeypatch):
+    """Index lookups and compiled templates are cached (and refreshed on index change)."""
+    for file_name in ("index", "cisco_ios_show_version.template"):
+        (tmp_path / file_name).write_text(open(join(RESOURCE_FOLDER, file_name)).read())
+    monkeypatch.setenv("NET_TEXTFSM", str(tmp_path))
+    cache = utilities.TEXTFSM_CACHE
+    cache.invalidate()
+    raw_output = "Cisco IOS Software, Catalyst 4500 L3 Switch Software"
+    for _ in range(3):
+        result = utilities.get_structured_data_textfsm(
+            raw_output, platform="cisco_ios", command="show version"
+        )
+        assert result == [{"model": "4500"}]
+    stats = cache.stats
+    assert stats["lookup_misses"] == 1 and stats["lookup_hits"] == 2
+    assert stats["template_misses"] == 1 and stats["template_hits"] == 2
+
+    # Modified index is re-read
+    index = tmp_path / "index"
+    index.write_text(index.read_text().replace("sh[[ow]] ver[[sion]]", "sh[[ow]] inv"))
+    os.utime(index, ns=(0, 0))
+    result = utilities.get_structured_data_textfsm(
+        raw_output, platform="cisco_ios", command="show version"
+    )
+    assert result == raw_output
+    assert cache.stats["lookup_misses"] == 2
+    cache.invalidate()
+    assert cache.stats["lookups"] == 0
+
+
+def test_textfsm_cache_multiple_templates(tmp_path, monkeypatch):
+    """Same results as CliTable.ParseCmd() (completions, tables merged on Key values)."""
+    (tmp_path / "index").write_text(
+        "Template, Hostname, Platform, Command\n\n"
+        "cisco_ios_show_mod.template:cisco_ios_show_mod_status.template, .*, cisco_ios, "
+        "sh[[ow]] mod[[ule]]\n"
+    )
+    (tmp_path / "cisco_ios_show_mod.template").write_text(
+        "Value Key MODULE (\\d+)\nValue MODEL (WS-\\S+)\n\n"
+        "Start\n  ^${MODULE}\\s+${MODEL}\\s*$$ -> Record\n"
+    )
+    (tmp_path / "cisco_ios_show_mod_status.template").write_text(
+        "Value Key MODULE (\\d+)\nValue STATUS (ok|fail)\n\n"
+        "Start\n  ^${MODULE}\\s+${STATUS}\\s*$$ -> Record\n"
+    )
+    monkeypatch.setenv("NET_TEXTFSM", str(tmp_path))
+    raw_output = "1  WS-X4516\n2  WS-X4548\n1  ok\n2  fail\n"
+    attrs = {"Command": "sh mod", "Platform": "cisco_ios"}
+    cli_table = clitable.CliTable("index", str(tmp_path))
+    cli_table.ParseCmd(raw_output, attrs)
+    expected = utilities.clitable_to_dict(cli_table)
+    assert expected == [
+        {"module": "1", "model": "WS-X4516", "status": "ok"},
+        {"module": "2", "model": "WS-X4548", "status": "fail"},
+    ]
+    utilities.TEXTFSM_CACHE.invalidate()
+    for command in ("sh mod", "show module"):
+        result = utilities.get_structured_data_textfsm(
+            raw_output, platform="cisco_ios", command=command
+        )
+        assert result == expected
+    assert (
+        utilities.get_structured_data_textfsm(
+            raw_output, platform="cisco_ios", command="show mac"
+        )
+        == raw_output
+    )
+
+
 @skip_if_not_linux
 def test_ntc_templates_discovery():
     """